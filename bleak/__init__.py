@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import functools
 import inspect
 import logging
 import os
 import sys
 import uuid
-from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable
 from types import TracebackType
 from typing import Any, Literal, Optional, TypedDict, Union, cast, overload
 from warnings import warn
@@ -21,7 +23,10 @@ from bleak.args.bluez import BlueZClientArgs, BlueZNotifyArgs, BlueZScannerArgs
 from bleak.args.corebluetooth import CBScannerArgs, CBStartNotifyArgs
 from bleak.args.winrt import WinRTClientArgs
 from bleak.backends import BleakBackend
-from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.characteristic import (
+    BleakGATTCharacteristic,
+    GattCharacteristicsFlags,
+)
 from bleak.backends.client import BaseBleakClient, get_platform_client_backend_type
 from bleak.backends.descriptor import BleakGATTDescriptor
 from bleak.backends.device import BLEDevice
@@ -53,6 +58,21 @@ if bool(os.environ.get("BLEAK_LOGGING", False)):
 # prevent tasks from being garbage collected
 _background_tasks: set[asyncio.Task[None]] = set()
 
+NotificationOverflowPolicy = Literal["drop-oldest", "drop-newest", "latest"]
+"""
+What a :class:`NotificationStream` does with a notification when its buffer
+is full.
+
+``"drop-oldest"``
+    The oldest buffered notification is discarded.
+``"drop-newest"``
+    The new notification is discarded.
+``"latest"``
+    Only the most recent notification is kept, regardless of the buffer size.
+
+.. versionadded:: 3.1
+"""
+
 
 class BleakScanner:
     """
@@ -77,6 +97,9 @@ class BleakScanner:
             Set to ``"passive"`` to avoid the ``"active"`` scanning mode.
             Passive scanning is not supported on macOS! Will raise
             :class:`BleakError` if set to ``"passive"`` on macOS.
+        timestamps:
+            If true, :attr:`AdvertisementData.timestamp` is set to the
+            :func:`time.monotonic_ns` time when the advertisement was received.
         bluez:
             Dictionary of arguments specific to the BlueZ backend.
         cb:
@@ -105,6 +128,9 @@ class BleakScanner:
     .. versionchanged:: 3.0
         Deprecated ``adapter`` keyword argument. Use ``bluez`` argument instead
         with ``{"adapter": "<adapter_name>"}``.
+
+    .. versionchanged:: 3.1
+        Added ``timestamps`` parameter.
     """
 
     def __init__(
@@ -113,6 +139,7 @@ class BleakScanner:
         service_uuids: Optional[list[str]] = None,
         scanning_mode: Literal["active", "passive"] = "active",
         *,
+        timestamps: bool = False,
         bluez: BlueZScannerArgs = {},
         cb: CBScannerArgs = {},
         backend: Optional[type[BaseBleakScanner]] = None,
@@ -144,6 +171,7 @@ class BleakScanner:
             cb=cb,
             **kwargs,
         )  # type: ignore
+        self._backend.receive_timestamps = timestamps
         self._backend_id = backend_id
 
     @property
@@ -231,6 +259,13 @@ class BleakScanner:
         Passive scanning is not supported on macOS! Will raise
         :class:`BleakError` if set to ``"passive"`` on macOS.
         """
+        timestamps: bool
+        """
+        If true, :attr:`AdvertisementData.timestamp` is set to the
+        :func:`time.monotonic_ns` time when the advertisement was received.
+
+        .. versionadded:: 3.1
+        """
         bluez: BlueZScannerArgs
         """
         Dictionary of arguments specific to the BlueZ backend.
@@ -261,6 +296,9 @@ class BleakScanner:
         timeout: float = 5.0,
         *,
         return_adv: Literal[False] = False,
+        count: Optional[int] = None,
+        filterfunc: Optional[AdvertisementDataFilter] = None,
+        idle_timeout: Optional[float] = None,
         **kwargs: Unpack[ExtraArgs],
     ) -> list[BLEDevice]: ...
 
@@ -271,6 +309,9 @@ class BleakScanner:
         timeout: float = 5.0,
         *,
         return_adv: Literal[True],
+        count: Optional[int] = None,
+        filterfunc: Optional[AdvertisementDataFilter] = None,
+        idle_timeout: Optional[float] = None,
         **kwargs: Unpack[ExtraArgs],
     ) -> dict[str, tuple[BLEDevice, AdvertisementData]]: ...
 
@@ -280,16 +321,34 @@ class BleakScanner:
         timeout: float = 5.0,
         *,
         return_adv: bool = False,
+        count: Optional[int] = None,
+        filterfunc: Optional[AdvertisementDataFilter] = None,
+        idle_timeout: Optional[float] = None,
         **kwargs: Unpack[ExtraArgs],
     ):
         """
         Scan continuously for ``timeout`` seconds and return discovered devices.
 
+        Scanning can optionally stop before ``timeout`` expires, either when
+        ``count`` devices have been seen or when no new device has been seen
+        for ``idle_timeout`` seconds. ``timeout`` is always the upper bound.
+
         Args:
             timeout:
                 Time, in seconds, to scan for.
             return_adv:
                 If ``True``, the return value will include advertising data.
+            count:
+                If given, stop scanning as soon as this many distinct devices
+                have been seen (only counting devices that match ``filterfunc``,
+                if given).
+            filterfunc:
+                Optional function that selects which devices are counted for
+                ``count`` and ``idle_timeout``. It does not affect the returned
+                devices.
+            idle_timeout:
+                If given, stop scanning when no new device (matching
+                ``filterfunc``, if given) has been seen for this many seconds.
             **kwargs:
                 Additional arguments will be passed to the :class:`BleakScanner`
                 constructor.
@@ -300,15 +359,75 @@ class BleakScanner:
 
         .. versionchanged:: 0.19
             Added ``return_adv`` parameter.
+
+        .. versionchanged:: 3.1
+            Added ``count``, ``filterfunc`` and ``idle_timeout`` parameters.
         """
-        async with cls(**kwargs) as scanner:
-            await asyncio.sleep(timeout)
+        scanner = cls(**kwargs)
+
+        if count is None and idle_timeout is None:
+            async with scanner:
+                await asyncio.sleep(timeout)
+        else:
+            await scanner._scan_until_done(timeout, count, filterfunc, idle_timeout)
 
         if return_adv:
             return scanner.discovered_devices_and_advertisement_data
 
         return scanner.discovered_devices
 
+    async def _scan_until_done(
+        self,
+        timeout: float,
+        count: Optional[int],
+        filterfunc: Optional[AdvertisementDataFilter],
+        idle_timeout: Optional[float],
+    ) -> None:
+        """
+        Scans until ``count`` matching devices have been seen, no new matching
+        device has been seen for ``idle_timeout`` seconds or ``timeout`` expires,
+        whichever comes first.
+        """
+        loop = asyncio.get_running_loop()
+        matched: set[str] = set()
+        new_device_event = asyncio.Event()
+
+        def on_advertisement(device: BLEDevice, adv: AdvertisementData) -> None:
+            if device.address in matched:
+                return
+
+            if filterfunc is None or filterfunc(device, adv):
+                matched.add(device.address)
+                new_device_event.set()
+
+        # register before starting so that we don't miss any advertisements
+        # received while start() is still awaiting
+        unregister_callback = self._backend.register_detection_callback(
+            on_advertisement
+        )
+
+        try:
+            async with self:
+                deadline = loop.time() + timeout
+
+                while count is None or len(matched) < count:
+                    wait_time = deadline - loop.time()
+
+                    if idle_timeout is not None:
+                        wait_time = min(wait_time, idle_timeout)
+
+                    if wait_time <= 0:
+                        break
+
+                    new_device_event.clear()
+
+                    try:
+                        await asyncio.wait_for(new_device_event.wait(), wait_time)
+                    except asyncio.TimeoutError:
+                        break
+        finally:
+            unregister_callback()
+
     @property
     def discovered_devices(self) -> list[BLEDevice]:
         """
@@ -349,12 +468,19 @@ class BleakScanner:
         Returns:
             The ``BLEDevice`` sought or ``None`` if not detected.
 
+        .. versionchanged:: 3.1
+            If the backend has a persistent device registry (e.g. the
+            ``registry`` BlueZ scanner arg) that knows the device, it is
+            returned immediately without scanning.
         """
+        scanner = cls(**kwargs)
+
+        if device := scanner._backend.get_cached_device(device_identifier):
+            return device
+
         device_identifier = device_identifier.lower()
-        return await cls.find_device_by_filter(
-            lambda d, ad: d.address.lower() == device_identifier,
-            timeout=timeout,
-            **kwargs,
+        return await scanner._find_device_by_filter(
+            lambda d, ad: d.address.lower() == device_identifier, timeout
         )
 
     @classmethod
@@ -407,16 +533,139 @@ class BleakScanner:
             the timeout.
 
         """
-        async with cls(**kwargs) as scanner:
+        return await cls(**kwargs)._find_device_by_filter(filterfunc, timeout)
+
+    async def _find_device_by_filter(
+        self, filterfunc: AdvertisementDataFilter, timeout: float
+    ) -> Optional[BLEDevice]:
+        async with self:
             try:
                 async with async_timeout(timeout):
-                    async for bd, ad in scanner.advertisement_data():
+                    async for bd, ad in self.advertisement_data():
                         if filterfunc(bd, ad):
                             return bd
                     assert_never(cast(Never, "advertisement_data() should never stop"))
             except asyncio.TimeoutError:
                 return None
 
+    @classmethod
+    async def find_devices_by_address(
+        cls,
+        device_identifiers: Iterable[str],
+        timeout: float = 10.0,
+        **kwargs: Unpack[ExtraArgs],
+    ) -> AsyncGenerator[BLEDevice, None]:
+        """
+        Obtain ``BLEDevice`` objects for several BLE servers specified by
+        Bluetooth address or (macOS) UUID address using a single scan.
+
+        Devices are yielded as soon as they are detected. Iteration stops when
+        all of the devices have been found or when ``timeout`` expires.
+
+        Args:
+            device_identifiers:
+                The Bluetooth/UUID addresses of the Bluetooth peripherals sought.
+            timeout:
+                Optional timeout to wait for detection of the specified
+                peripherals before giving up. Defaults to 10.0 seconds.
+            **kwargs:
+                Additional arguments to be passed to the :class:`BleakScanner`
+                constructor.
+
+        Returns:
+            An async iterator that yields each ``BLEDevice`` sought at most once.
+
+        .. tip:: If you stop iterating before all devices have been found, use
+            :func:`contextlib.aclosing` to ensure that scanning is stopped
+            right away.
+
+        .. versionadded:: 3.1
+        """
+        targets = {d.lower() for d in device_identifiers}
+
+        async for device in cls.find_devices_by_filter(
+            lambda d, ad: d.address.lower() in targets,
+            timeout=timeout,
+            count=len(targets),
+            **kwargs,
+        ):
+            yield device
+
+    @classmethod
+    async def find_devices_by_filter(
+        cls,
+        filterfunc: AdvertisementDataFilter,
+        timeout: float = 10.0,
+        *,
+        count: Optional[int] = None,
+        **kwargs: Unpack[ExtraArgs],
+    ) -> AsyncGenerator[BLEDevice, None]:
+        """
+        Obtain ``BLEDevice`` objects for all BLE servers that match a given
+        filter function using a single scan.
+
+        Devices are yielded as soon as they are detected. Iteration stops when
+        ``count`` devices have been found (if given) or when ``timeout`` expires.
+
+        Args:
+            filterfunc:
+                A function that is called for every BLEDevice found. It should
+                return ``True`` only for the wanted devices.
+            timeout:
+                Optional timeout to wait for detection of peripherals before
+                giving up. Defaults to 10.0 seconds.
+            count:
+                Optional number of devices after which to stop scanning.
+            **kwargs:
+                Additional arguments to be passed to the :class:`BleakScanner`
+                constructor.
+
+        Returns:
+            An async iterator that yields each matching ``BLEDevice`` at most once.
+
+        .. tip:: If you stop iterating before the iterator is exhausted, use
+            :func:`contextlib.aclosing` to ensure that scanning is stopped
+            right away.
+
+        .. versionadded:: 3.1
+        """
+        loop = asyncio.get_running_loop()
+        found: set[str] = set()
+        devices: asyncio.Queue[BLEDevice] = asyncio.Queue()
+
+        def on_advertisement(device: BLEDevice, adv: AdvertisementData) -> None:
+            if device.address not in found and filterfunc(device, adv):
+                found.add(device.address)
+                devices.put_nowait(device)
+
+        scanner = cls(**kwargs)
+
+        # register before starting so that we don't miss any advertisements
+        # received while start() is still awaiting
+        unregister_callback = scanner._backend.register_detection_callback(
+            on_advertisement
+        )
+
+        try:
+            async with scanner:
+                deadline = loop.time() + timeout
+                yielded = 0
+
+                while count is None or yielded < count:
+                    # Can't use async_timeout() here since it would cancel the
+                    # consumer of this generator while it is suspended at yield.
+                    try:
+                        device = await asyncio.wait_for(
+                            devices.get(), max(deadline - loop.time(), 0)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+                    yielded += 1
+                    yield device
+        finally:
+            unregister_callback()
+
 
 def _resolve_characteristic(
     char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
@@ -558,13 +807,13 @@ class BleakClient:
             if "adapter" not in bluez:
                 bluez["adapter"] = adapter_kwarg
 
+        self._disconnected_callback = disconnected_callback
+        # open notifications() streams that end when disconnected
+        self._notification_streams: set[NotificationStream] = set()
+
         self._backend = PlatformBleakClient(
             address_or_ble_device,
-            disconnected_callback=(
-                None
-                if disconnected_callback is None
-                else functools.partial(disconnected_callback, self)
-            ),
+            disconnected_callback=self._on_disconnected,
             services=(
                 None if services is None else set(map(normalize_uuid_str, services))
             ),
@@ -575,6 +824,11 @@ class BleakClient:
         )
         self._pair_before_connect = pair
         self._backend_id = backend_id
+        # resolved characteristic specifiers, only valid for _resolved_services
+        self._resolved_services: Optional[BleakGATTServiceCollection] = None
+        self._resolved_characteristics: dict[
+            Union[int, str, uuid.UUID], BleakGATTCharacteristic
+        ] = {}
 
     @property
     def backend_id(self) -> BleakBackend | str:
@@ -723,6 +977,69 @@ class BleakClient:
 
         return self._backend.services
 
+    def _resolve_characteristic(
+        self, char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID]
+    ) -> BleakGATTCharacteristic:
+        """
+        Like :func:`_resolve_characteristic` but remembers the result until
+        the services change, e.g. because of a reconnect or because the
+        characteristic was removed.
+        """
+        if isinstance(char_specifier, BleakGATTCharacteristic):
+            return char_specifier
+
+        services = self.services
+
+        if services is not self._resolved_services:
+            self._resolved_characteristics.clear()
+            self._resolved_services = services
+
+        characteristic = self._resolved_characteristics.get(char_specifier)
+
+        # the backend may update the services in place, e.g. on Service Changed
+        if (
+            characteristic is None
+            or services.characteristics.get(characteristic.handle) is not characteristic
+        ):
+            characteristic = _resolve_characteristic(char_specifier, services)
+            self._resolved_characteristics[char_specifier] = characteristic
+
+        return characteristic
+
+    def bind(
+        self, char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID]
+    ) -> BoundCharacteristic:
+        """
+        Looks up a characteristic once for repeated reads, writes and
+        notifications.
+
+        This is useful for high-rate I/O since the methods of the returned
+        object skip looking up the characteristic and checking its properties.
+
+        Args:
+            char_specifier:
+                The characteristic, specified by either integer handle, UUID or
+                directly by the BleakGATTCharacteristic object representing it.
+
+        Returns:
+            An object for doing I/O on the characteristic.
+
+        Raises:
+            BleakError: if service discovery has not been performed yet.
+            BleakCharacteristicNotFoundError: if a characteristic with the
+                handle or UUID specified by ``char_specifier`` could not be found.
+
+        Example::
+
+            char = client.bind(MY_CHAR_UUID)
+
+            while True:
+                await char.write(b"\x00\x01", response=False)
+
+        .. versionadded:: 3.1
+        """
+        return BoundCharacteristic(self, char_specifier)
+
     # I/O methods
 
     async def read_gatt_char(
@@ -757,7 +1074,7 @@ class BleakClient:
             Now raises ``BleakGATTProtocolError`` when possible instead of
             backend-specific exceptions.
         """
-        characteristic = _resolve_characteristic(char_specifier, self.services)
+        characteristic = self._resolve_characteristic(char_specifier)
         return await self._backend.read_gatt_char(
             characteristic, use_cached=use_cached, **kwargs
         )
@@ -823,17 +1140,144 @@ class BleakClient:
             ...
             await client.write_gatt_char(MY_CHAR_UUID, b"\x00\x01\x02\x03", response=True)
         """
-        characteristic = _resolve_characteristic(char_specifier, self.services)
+        characteristic = self._resolve_characteristic(char_specifier)
+
+        await self._backend.write_gatt_char(
+            characteristic, data, _get_write_response(characteristic, response)
+        )
+
+    async def read_gatt_chars(
+        self,
+        char_specifiers: Iterable[Union[BleakGATTCharacteristic, int, str, uuid.UUID]],
+        *,
+        use_cached: bool = False,
+        **kwargs: Any,
+    ) -> list[Union[bytearray, BleakError]]:
+        """
+        Perform read operations on several GATT characteristics.
 
-        if response is None:
-            # If not specified, prefer write-with-response over write-without-
-            # response if it is available since it is the more reliable write.
-            # This assumes that the peripheral correctly reports the
-            # characteristic properties, so doesn't work in some cases.
-            response = "write" in characteristic.properties
+        Reads are done concurrently when the backend allows it, which is faster
+        than calling :meth:`read_gatt_char` for each characteristic. An error
+        does not stop the other reads, instead it is returned in place of the
+        data.
 
-        await self._backend.write_gatt_char(characteristic, data, response)
+        Example::
+
+            results = await client.read_gatt_chars([MODEL_UUID, FIRMWARE_UUID])
+
+            for result in results:
+                if isinstance(result, BleakError):
+                    print("read failed:", result)
+                else:
+                    print(result)
 
+        Args:
+            char_specifiers:
+                The characteristics to read from, specified by either integer
+                handle, UUID or directly by the BleakGATTCharacteristic object
+                representing it.
+            use_cached:
+                If ``True``, the cached value will be returned instead of
+                performing a new read operation. May be ignored by some backends.
+
+        Returns:
+            The read data or the error for each characteristic, in the same
+            order as ``char_specifiers``. Errors are
+            :class:`BleakCharacteristicNotFoundError` if a characteristic could
+            not be found, :class:`BleakGATTProtocolError` if the peripheral
+            replied with ATT_ERROR_RSP or other :class:`BleakError`.
+
+        .. versionadded:: 3.1
+        """
+        results: list[Union[bytearray, BleakError]] = []
+        indexes: list[int] = []
+        characteristics: list[BleakGATTCharacteristic] = []
+
+        for char_specifier in char_specifiers:
+            try:
+                characteristic = self._resolve_characteristic(char_specifier)
+            except BleakCharacteristicNotFoundError as e:
+                results.append(e)
+            else:
+                indexes.append(len(results))
+                characteristics.append(characteristic)
+                results.append(bytearray())
+
+        values = await self._backend.read_gatt_chars(
+            characteristics, use_cached=use_cached, **kwargs
+        )
+
+        for i, value in zip(indexes, values):
+            results[i] = value
+
+        return results
+
+    async def write_gatt_chars(
+        self,
+        writes: Iterable[
+            tuple[
+                Union[BleakGATTCharacteristic, int, str, uuid.UUID],
+                SizedBuffer,
+                Optional[bool],
+            ]
+        ],
+    ) -> list[Optional[BleakError]]:
+        """
+        Perform write operations on several GATT characteristics.
+
+        Writes are done concurrently when the backend allows it, which is faster
+        than calling :meth:`write_gatt_char` for each characteristic. Writes to
+        the same characteristic are done in the given order. An error does not
+        stop the other writes, instead it is returned for the failed write.
+
+        Example::
+
+            errors = await client.write_gatt_chars(
+                [(MODE_UUID, b"\x01", True), (RATE_UUID, b"\x10", True)]
+            )
+
+        Args:
+            writes:
+                A tuple of the characteristic, the data and the ``response``
+                argument of :meth:`write_gatt_char` for each write.
+
+        Returns:
+            ``None`` if the write succeeded or the error for each write, in the
+            same order as ``writes``. Errors are
+            :class:`BleakCharacteristicNotFoundError` if a characteristic could
+            not be found, :class:`BleakGATTProtocolError` if the peripheral
+            replied with ATT_ERROR_RSP or other :class:`BleakError`.
+
+        .. versionadded:: 3.1
+        """
+        results: list[Optional[BleakError]] = []
+        indexes: list[int] = []
+        resolved: list[tuple[BleakGATTCharacteristic, SizedBuffer, bool]] = []
+
+        for char_specifier, data, response in writes:
+            try:
+                characteristic = self._resolve_characteristic(char_specifier)
+            except BleakCharacteristicNotFoundError as e:
+                results.append(e)
+            else:
+                indexes.append(len(results))
+                resolved.append(
+                    (
+                        characteristic,
+                        data,
+                        _get_write_response(characteristic, response),
+                    )
+                )
+                results.append(None)
+
+        errors = await self._backend.write_gatt_chars(resolved)
+
+        for i, error in zip(indexes, errors):
+            results[i] = error
+
+        return results
+
+    @overload
     async def start_notify(
         self,
         char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
@@ -841,6 +1285,50 @@ class BleakClient:
             [BleakGATTCharacteristic, bytearray], Union[None, Awaitable[None]]
         ],
         *,
+        batch: Literal[False] = False,
+        timestamps: Literal[False] = False,
+        bluez: BlueZNotifyArgs = {},
+        cb: CBStartNotifyArgs = {},
+        **kwargs: Any,
+    ) -> None: ...
+
+    @overload
+    async def start_notify(
+        self,
+        char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
+        callback: Callable[
+            [BleakGATTCharacteristic, bytearray, int], Union[None, Awaitable[None]]
+        ],
+        *,
+        batch: Literal[False] = False,
+        timestamps: Literal[True],
+        bluez: BlueZNotifyArgs = {},
+        cb: CBStartNotifyArgs = {},
+        **kwargs: Any,
+    ) -> None: ...
+
+    @overload
+    async def start_notify(
+        self,
+        char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
+        callback: Callable[
+            [BleakGATTCharacteristic, list[tuple[int, bytearray]]],
+            Union[None, Awaitable[None]],
+        ],
+        *,
+        batch: Literal[True],
+        bluez: BlueZNotifyArgs = {},
+        cb: CBStartNotifyArgs = {},
+        **kwargs: Any,
+    ) -> None: ...
+
+    async def start_notify(
+        self,
+        char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
+        callback: Callable[..., Union[None, Awaitable[None]]],
+        *,
+        batch: bool = False,
+        timestamps: bool = False,
         bluez: BlueZNotifyArgs = {},
         cb: CBStartNotifyArgs = {},
         **kwargs: Any,
@@ -858,6 +1346,25 @@ class BleakClient:
 
             client.start_notify(char_uuid, callback)
 
+        With ``timestamps=True``, callbacks receive a third input with the
+        :func:`time.monotonic_ns` time when the notification was received. The
+        time is taken by the backend as soon as possible, so it is not affected
+        by delays in calling the callback.
+
+        For characteristics that notify at a high rate, ``batch=True`` reduces
+        the number of callback calls. The second input is then a list of
+        tuples of the :func:`time.monotonic_ns` time when a notification was
+        received and its data. It contains all notifications that were
+        received at once, e.g. during one iteration of the event loop.
+
+        .. code-block:: python
+
+            def callback(sender: BleakGATTCharacteristic, batch: list[tuple[int, bytearray]]):
+                for timestamp, data in batch:
+                    print(f"{sender} at {timestamp}: {data}")
+
+            client.start_notify(char_uuid, callback, batch=True)
+
         Args:
             char_specifier:
                 The characteristic to activate notifications/indications on a
@@ -866,6 +1373,11 @@ class BleakClient:
             callback:
                 The function to be called on notification. Can be regular
                 function or async function.
+            batch:
+                If true, the callback is called with a list of notifications.
+            timestamps:
+                If true, the callback also receives the time when the
+                notification was received. Batches always include the time.
             bluez:
                 BlueZ backend-specific arguments.
             cb:
@@ -874,6 +1386,8 @@ class BleakClient:
         Raises:
             BleakCharacteristicNotFoundError: if a characteristic with the
                 handle or UUID specified by ``char_specifier`` could not be found.
+            ValueError: if ``callback`` is an async function or ``batch`` is
+                true and the BlueZ ``value_type`` arg is ``"memoryview"``.
             backend-specific exceptions: if the start notification operation failed.
 
         .. versionchanged:: 0.18
@@ -885,25 +1399,127 @@ class BleakClient:
 
         .. versionchanged:: 2.1
             Added the ``bluez`` parameter.
+
+        .. versionchanged:: 3.1
+            Added the ``batch`` and ``timestamps`` parameters.
         """
         if not self.is_connected:
             raise BleakError("Not connected")
 
-        characteristic = _resolve_characteristic(char_specifier, self.services)
+        if (inspect.iscoroutinefunction(callback) or batch) and bluez.get(
+            "value_type"
+        ) == "memoryview":
+            raise ValueError(
+                "value_type='memoryview' requires a regular function without batch"
+            )
+
+        characteristic = self._resolve_characteristic(char_specifier)
 
         if inspect.iscoroutinefunction(callback):
 
-            def wrapped_callback(data: bytearray) -> None:
-                task = asyncio.create_task(callback(characteristic, data))
+            def wrapped_callback(*args: Any) -> None:
+                task = asyncio.create_task(callback(characteristic, *args))
                 _background_tasks.add(task)
                 task.add_done_callback(_background_tasks.discard)
 
         else:
-            wrapped_callback = functools.partial(callback, characteristic)  # type: ignore
+            wrapped_callback = functools.partial(callback, characteristic)
+
+        if batch:
+            await self._backend.start_notify_batched(
+                characteristic, wrapped_callback, bluez=bluez, cb=cb, **kwargs
+            )
+        elif timestamps:
+            await self._backend.start_notify_timestamped(
+                characteristic, wrapped_callback, bluez=bluez, cb=cb, **kwargs
+            )
+        else:
+            await self._backend.start_notify(
+                characteristic, wrapped_callback, bluez=bluez, cb=cb, **kwargs
+            )
 
-        await self._backend.start_notify(
-            characteristic, wrapped_callback, bluez=bluez, cb=cb, **kwargs
+    @contextlib.asynccontextmanager
+    async def notifications(
+        self,
+        char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
+        *,
+        maxsize: int = 256,
+        policy: NotificationOverflowPolicy = "drop-oldest",
+        **kwargs: Any,
+    ) -> AsyncIterator[NotificationStream]:
+        """
+        Activates notifications/indications on a characteristic and receives
+        them by iterating over a stream instead of in a callback.
+
+        Notifications are buffered until they are read from the stream. When
+        the buffer is full, ``policy`` decides which notifications are
+        discarded. Notifications are stopped when the context is exited.
+
+        Example::
+
+            async with client.notifications(char_uuid, maxsize=100) as stream:
+                async for timestamp_ns, data in stream:
+                    print(timestamp_ns, data)
+
+        Args:
+            char_specifier:
+                The characteristic to activate notifications/indications on,
+                specified by either integer handle, UUID or directly by the
+                BleakGATTCharacteristic object representing it.
+            maxsize:
+                The maximum number of buffered notifications.
+            policy:
+                What to do with notifications when the buffer is full.
+            **kwargs:
+                Backend-specific arguments, see :meth:`start_notify`.
+
+        Returns:
+            An async context manager that yields a :class:`NotificationStream`.
+
+        Raises:
+            ValueError: if ``maxsize`` or ``policy`` is invalid or the BlueZ
+                ``value_type`` arg is ``"memoryview"``.
+            BleakCharacteristicNotFoundError: if a characteristic with the
+                handle or UUID specified by ``char_specifier`` could not be found.
+            backend-specific exceptions: if the start notification operation failed.
+
+        .. versionadded:: 3.1
+        """
+        # the memory of a memoryview is reused, so it can't be buffered
+        if kwargs.get("bluez", {}).get("value_type") == "memoryview":
+            raise ValueError("value_type='memoryview' can't be used with a stream")
+
+        stream = NotificationStream(maxsize, policy)
+        characteristic = self._resolve_characteristic(char_specifier)
+
+        await self.start_notify(
+            characteristic,
+            lambda _, data, timestamp: stream._put(data, timestamp),
+            timestamps=True,
+            **kwargs,
         )
+        self._notification_streams.add(stream)
+
+        try:
+            yield stream
+        finally:
+            self._notification_streams.discard(stream)
+            stream._close()
+
+            if self.is_connected:
+                # the device may disconnect at any time, this must not hide
+                # an exception raised in the context
+                try:
+                    await self.stop_notify(characteristic)
+                except BleakError as e:
+                    _logger.debug("failed to stop notifications: %s", e)
+
+    def _on_disconnected(self) -> None:
+        for stream in self._notification_streams:
+            stream._close()
+
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
 
     async def stop_notify(
         self, char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID]
@@ -926,7 +1542,7 @@ class BleakClient:
             method does not need to be called unless notifications need to be
             stopped some time before the device disconnects.
         """
-        characteristic = _resolve_characteristic(char_specifier, self.services)
+        characteristic = self._resolve_characteristic(char_specifier)
         await self._backend.stop_notify(characteristic)
 
     async def read_gatt_descriptor(
@@ -1006,3 +1622,207 @@ class BleakClient:
             )
 
         await self._backend.write_gatt_descriptor(descriptor, data)
+
+
+def _get_write_response(
+    characteristic: BleakGATTCharacteristic, response: Optional[bool]
+) -> bool:
+    if response is None:
+        # If not specified, prefer write-with-response over write-without-
+        # response if it is available since it is the more reliable write.
+        # This assumes that the peripheral correctly reports the
+        # characteristic properties, so doesn't work in some cases.
+        return bool(
+            characteristic.property_flags & GattCharacteristicsFlags.write.value
+        )
+
+    return response
+
+
+class BoundCharacteristic:
+    """
+    A characteristic of a connected device that is ready for I/O.
+
+    Instances are created with :meth:`BleakClient.bind`. If the services of
+    the device change, e.g. because the client reconnected, the
+    characteristic is looked up again automatically.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(
+        self,
+        client: BleakClient,
+        char_specifier: Union[BleakGATTCharacteristic, int, str, uuid.UUID],
+    ) -> None:
+        self._client = client
+        self._char_specifier = char_specifier
+        self._services: Optional[BleakGATTServiceCollection] = None
+        self._characteristic: BleakGATTCharacteristic
+        self._response: bool
+        self._resolve()
+
+    def _resolve(self) -> BleakGATTCharacteristic:
+        self._services = self._client.services
+        self._characteristic = self._client._resolve_characteristic(
+            self._char_specifier
+        )
+        # same default as BleakClient.write_gatt_char()
+        self._response = bool(
+            self._characteristic.property_flags & GattCharacteristicsFlags.write.value
+        )
+        return self._characteristic
+
+    @property
+    def characteristic(self) -> BleakGATTCharacteristic:
+        """
+        The characteristic.
+
+        Raises:
+            BleakError: if service discovery has not been performed yet.
+            BleakCharacteristicNotFoundError: if the characteristic no longer
+                exists after the services changed.
+        """
+        services = self._client._backend.services
+        characteristic = self._characteristic
+
+        if (
+            services is not self._services
+            or services.characteristics.get(characteristic.handle) is not characteristic
+        ):
+            return self._resolve()
+
+        return characteristic
+
+    async def read(self, *, use_cached: bool = False, **kwargs: Any) -> bytearray:
+        """
+        Reads the characteristic.
+
+        See :meth:`BleakClient.read_gatt_char` for details.
+        """
+        return await self._client._backend.read_gatt_char(
+            self.characteristic, use_cached=use_cached, **kwargs
+        )
+
+    async def write(self, data: SizedBuffer, response: Optional[bool] = None) -> None:
+        """
+        Writes the characteristic.
+
+        See :meth:`BleakClient.write_gatt_char` for details.
+        """
+        characteristic = self.characteristic
+
+        await self._client._backend.write_gatt_char(
+            characteristic, data, self._response if response is None else response
+        )
+
+    async def start_notify(
+        self,
+        callback: Callable[
+            [BleakGATTCharacteristic, bytearray], Union[None, Awaitable[None]]
+        ],
+        **kwargs: Any,
+    ) -> None:
+        """
+        Activates notifications/indications on the characteristic.
+
+        See :meth:`BleakClient.start_notify` for details.
+        """
+        await self._client.start_notify(self.characteristic, callback, **kwargs)
+
+    def notifications(
+        self, **kwargs: Any
+    ) -> contextlib.AbstractAsyncContextManager[NotificationStream]:
+        """
+        Receives notifications/indications of the characteristic in a stream.
+
+        See :meth:`BleakClient.notifications` for details.
+        """
+        return self._client.notifications(self.characteristic, **kwargs)
+
+    async def stop_notify(self) -> None:
+        """
+        Deactivates notifications/indications on the characteristic.
+
+        See :meth:`BleakClient.stop_notify` for details.
+        """
+        await self._client.stop_notify(self.characteristic)
+
+
+class NotificationStream:
+    """
+    Buffered notifications of a characteristic.
+
+    Instances are created with :meth:`BleakClient.notifications`. Iterating
+    yields a tuple of the :func:`time.monotonic_ns` time when the notification was
+    received and the data. Iteration ends after the device disconnected or the
+    context was exited and all buffered notifications were read. Only one task
+    can iterate a stream at a time.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(self, maxsize: int, policy: NotificationOverflowPolicy) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        if policy not in ("drop-oldest", "drop-newest", "latest"):
+            raise ValueError(f"invalid policy: {policy!r}")
+
+        self._maxsize = 1 if policy == "latest" else maxsize
+        self._drop_newest = policy == "drop-newest"
+        self._buffer: deque[tuple[int, bytearray]] = deque()
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._closed = False
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of notifications that were discarded because the buffer
+        was full.
+        """
+        return self._dropped
+
+    def _put(self, data: bytearray, timestamp: int) -> None:
+        if self._closed:
+            return
+
+        if len(self._buffer) >= self._maxsize:
+            self._dropped += 1
+
+            if self._drop_newest:
+                return
+
+            self._buffer.popleft()
+
+        self._buffer.append((timestamp, data))
+        self._wake()
+
+    def _close(self) -> None:
+        self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> tuple[int, bytearray]:
+        if self._waiter is not None:
+            raise RuntimeError("stream is already being iterated by another task")
+
+        while not self._buffer:
+            if self._closed:
+                raise StopAsyncIteration
+
+            self._waiter = asyncio.get_running_loop().create_future()
+
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        return self._buffer.popleft()
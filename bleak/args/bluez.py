@@ -4,10 +4,15 @@ BlueZ backend arguments
 -----------------------
 """
 
-from typing import NamedTuple, TypedDict, Union
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypedDict, Union
 
 from bleak.assigned_numbers import AdvertisementDataType
 
+if TYPE_CHECKING:
+    from bleak.backends.characteristic import BleakGATTCharacteristic
+    from bleak.registry import DeviceRegistry
+
 
 class BlueZDiscoveryFilters(TypedDict, total=False):
     """
@@ -79,6 +84,57 @@ class OrPattern(NamedTuple):
 OrPatternLike = Union[OrPattern, tuple[int, AdvertisementDataType, bytes]]
 
 
+class BlueZMonitorRSSI(TypedDict, total=False):
+    """
+    RSSI parameters of the ``org.bluez.AdvertisementMonitor1`` D-Bus interface
+    used for passive scanning.
+
+    A device is considered in range after its RSSI has been at or above
+    ``RSSIHighThreshold`` for ``RSSIHighTimeout`` seconds and out of range
+    after its RSSI has been at or below ``RSSILowThreshold`` for
+    ``RSSILowTimeout`` seconds. Advertisements are only received from devices
+    that are in range.
+
+    If the Bluetooth controller supports it, this filtering is done by the
+    controller, so advertisements from devices that are out of range never
+    reach the host. Missing values get the defaults listed below.
+
+    https://github.com/bluez/bluez/blob/master/doc/org.bluez.AdvertisementMonitor.rst
+
+    .. versionadded:: 3.1
+    """
+
+    RSSIHighThreshold: int
+    """
+    RSSI threshold in dBm (-127 to 20) for a device to be considered in range.
+
+    Defaults to ``RSSILowThreshold + 1``.
+    """
+    RSSILowThreshold: int
+    """
+    RSSI threshold in dBm (-127 to 20) for a device to be considered out of
+    range. Must not be greater than ``RSSIHighThreshold``.
+
+    Defaults to ``RSSIHighThreshold - 1`` or -127 if neither is given.
+    """
+    RSSIHighTimeout: int
+    """
+    Time in seconds (1 to 300) the RSSI must stay at or above
+    ``RSSIHighThreshold``. Defaults to 1.
+    """
+    RSSILowTimeout: int
+    """
+    Time in seconds (1 to 300) the RSSI must stay at or below
+    ``RSSILowThreshold``. Defaults to 5.
+    """
+    RSSISamplingPeriod: int
+    """
+    Period in units of 100 ms (0 to 255) at which advertisements of a device
+    that is in range are reported. 0 reports all advertisements and 255 only
+    reports the first one. Defaults to 0.
+    """
+
+
 class BlueZScannerArgs(TypedDict, total=False):
     """
     :class:`BleakScanner` args that are specific to the BlueZ backend.
@@ -107,7 +163,49 @@ class BlueZScannerArgs(TypedDict, total=False):
     """
     Or patterns to pass to the AdvertisementMonitor1 D-Bus interface.
 
-    Only used for passive scanning.
+    Required for passive scanning. Duplicate patterns are removed and, if
+    needed, the patterns are split between several monitors.
+
+    For active scanning, or when BlueZ does not support advertisement monitors,
+    the patterns are matched against the advertising data by Bleak instead.
+    This is a best effort since BlueZ does not provide the raw advertising
+    data.
+
+    .. versionchanged:: 3.1
+        Patterns are also used for active scanning.
+    """
+
+    monitor_rssi: BlueZMonitorRSSI
+    """
+    RSSI parameters to pass to the AdvertisementMonitor1 D-Bus interface.
+
+    Only used for passive scanning. If BlueZ or the controller does not
+    support these parameters, only the RSSI thresholds are applied by Bleak
+    instead, the timeouts and the sampling period are ignored.
+
+    .. versionadded:: 3.1
+    """
+
+    registry: "DeviceRegistry"
+    """
+    Persistent registry that devices seen while scanning are recorded in.
+
+    When given, :meth:`bleak.BleakScanner.find_device_by_address` returns
+    devices that are in the registry immediately without scanning.
+
+    .. versionadded:: 3.1
+    """
+
+    discovery_paused_callback: Callable[[bool], None]
+    """
+    Function that is called with ``True`` when discovery is paused because a
+    :class:`bleak.BleakClient` is connecting on the same adapter and with
+    ``False`` when discovery is resumed.
+
+    The scanner keeps running while discovery is paused, but no
+    advertisements are received. Only used for active scanning.
+
+    .. versionadded:: 3.1
     """
 
 
@@ -128,6 +226,83 @@ class BlueZClientArgs(TypedDict, total=False):
          vendor and product ID.
     """
 
+    address_type: Literal["public", "random"]
+    """
+    The address type of the device when :class:`bleak.BleakClient` is given
+    a Bluetooth address.
+
+    If BlueZ does not already have an object for the device, knowing the
+    address type allows connecting to it with the ``ConnectDevice`` D-Bus
+    method instead of having to scan for it first. This requires BlueZ to be
+    run with experimental features enabled (``bluetoothd --experimental``).
+    Otherwise this is ignored.
+
+    .. versionadded:: 3.1
+    """
+
+    registry: "DeviceRegistry"
+    """
+    Persistent registry that connected devices are recorded in.
+
+    If BlueZ does not have an object for the device, the address type from the
+    registry is used in the same way as ``address_type``.
+
+    .. versionadded:: 3.1
+    """
+
+    pause_discovery: bool
+    """
+    If true (the default), active scanning on the adapter is paused while
+    connecting and resumed afterwards.
+
+    Many controllers are slow or fail to connect while they are scanning.
+    Running :class:`bleak.BleakScanner` objects are not stopped, they just
+    don't receive advertisements while discovery is paused. Set this to false
+    to keep scanning while connecting.
+
+    .. versionadded:: 3.1
+    """
+
+    use_acquire_write: bool
+    """
+    If true (the default), writes without response use a socket from the
+    ``AcquireWrite`` D-Bus method instead of calling the ``WriteValue`` D-Bus
+    method each time, which allows much higher throughput.
+
+    The socket is acquired on the first write without response to a
+    characteristic and kept open until disconnecting or until a write with
+    response to the same characteristic. While it is open, other D-Bus clients
+    can't write to the characteristic. Set this to false to always use
+    ``WriteValue``.
+
+    .. versionadded:: 3.1
+    """
+
+    characteristic_discovered_callback: Callable[["BleakGATTCharacteristic"], None]
+    """
+    Callback that is called for each characteristic as soon as BlueZ has
+    discovered it while connecting.
+
+    :meth:`bleak.BleakClient.connect` only returns after all services were
+    discovered, which can take several seconds for devices with many services.
+    The characteristic passed to the callback can already be used for I/O, e.g.
+    by passing it to :meth:`bleak.BleakClient.write_gatt_char` in a task, while
+    the remaining services are still being discovered.
+
+    .. versionadded:: 3.1
+    """
+
+    services_changed_callback: Callable[[], None]
+    """
+    Callback that is called when the services of the connected device changed,
+    e.g. after the device sent a *Service Changed* indication.
+
+    :attr:`bleak.BleakClient.services` is updated in place before the callback
+    is called. Characteristics that were removed can no longer be used.
+
+    .. versionadded:: 3.1
+    """
+
 
 class BlueZNotifyArgs(TypedDict, total=False):
     """
@@ -147,3 +322,16 @@ class BlueZNotifyArgs(TypedDict, total=False):
     descriptor, before the write response is sent. In this case, "AcquireNotify"
     will miss the notification, whereas "StartNotify" will work correctly.
     """
+
+    value_type: Literal["bytearray", "bytes", "memoryview"]
+    """
+    The type of the data that is passed to the callback. The default is
+    ``"bytearray"``, a new copy that can be modified.
+
+    ``"bytes"`` avoids the copy when "StartNotify" is used. ``"memoryview"``
+    avoids copying the data at all when "AcquireNotify" is used. The memory is
+    reused for the next notifications, so the memoryview is only valid until
+    the callback returns. It can't be used with async callbacks.
+
+    .. versionadded:: 3.1
+    """
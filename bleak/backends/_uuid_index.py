@@ -0,0 +1,131 @@
+"""
+Indexes of GATT attribute handles by UUID.
+
+Indexes only depend on the UUIDs and handles of the attributes, so devices of
+the same model have identical indexes. To save memory, indexes can be interned
+with :func:`intern_index` and are then shared between service collections.
+Shared indexes are read-only, :func:`add_to_index` makes a copy first.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Union
+from uuid import UUID
+
+from bleak.uuids import normalize_uuid_str
+
+UUIDIndex = Mapping[str, tuple[int, ...]]
+"""
+Map of UUID to the handles of all attributes with that UUID.
+"""
+
+EMPTY_INDEX: UUIDIndex = MappingProxyType({})
+"""
+Shared empty index.
+"""
+
+# Upper limit of distinct interned indexes. Normally there are only a few
+# device models, so this is only reached if something goes very wrong.
+_MAX_INTERNED = 4096
+
+_interned: dict[tuple[tuple[str, tuple[int, ...]], ...], UUIDIndex] = {}
+
+
+def add_to_index(index: UUIDIndex, uuid: str, handle: int) -> UUIDIndex:
+    """
+    Adds an attribute to an index.
+
+    Args:
+        index: The index.
+        uuid: The UUID of the attribute.
+        handle: The handle of the attribute.
+
+    Returns:
+        The updated index. This is a new object if ``index`` was shared.
+    """
+    if isinstance(index, MappingProxyType):
+        index = dict(index)
+
+    assert isinstance(index, dict)
+    index[uuid] = index.get(uuid, ()) + (handle,)
+
+    return index
+
+
+def remove_from_index(index: UUIDIndex, uuid: str, handle: int) -> UUIDIndex:
+    """
+    Removes an attribute from an index.
+
+    Args:
+        index: The index.
+        uuid: The UUID of the attribute.
+        handle: The handle of the attribute.
+
+    Returns:
+        The updated index. This is a new object if ``index`` was shared.
+    """
+    handles = index.get(uuid, ())
+
+    if handle not in handles:
+        return index
+
+    if isinstance(index, MappingProxyType):
+        index = dict(index)
+
+    assert isinstance(index, dict)
+    handles = tuple(h for h in handles if h != handle)
+
+    if handles:
+        index[uuid] = handles
+    else:
+        del index[uuid]
+
+    return index
+
+
+def intern_index(index: UUIDIndex) -> UUIDIndex:
+    """
+    Gets a shared, read-only index that is equal to ``index``.
+
+    Args:
+        index: The index.
+
+    Returns:
+        The shared index.
+    """
+    if not index:
+        return EMPTY_INDEX
+
+    key = tuple(sorted(index.items()))
+
+    try:
+        return _interned[key]
+    except KeyError:
+        if len(_interned) >= _MAX_INTERNED:
+            _interned.clear()
+
+        shared = _interned[key] = MappingProxyType(dict(key))
+        return shared
+
+
+def lookup(index: UUIDIndex, uuid: Union[str, UUID]) -> tuple[int, ...]:
+    """
+    Looks up the handles of attributes with a UUID.
+
+    Normalizing the UUID is comparatively slow, so it is only done if ``uuid``
+    is not already in the index as given.
+
+    Args:
+        index: The index.
+        uuid: The UUID.
+
+    Returns:
+        The handles, in the order they were added.
+    """
+    uuid = str(uuid)
+    handles = index.get(uuid)
+
+    if handles is None:
+        handles = index.get(normalize_uuid_str(uuid), ())
+
+    return handles
@@ -14,13 +14,14 @@ if TYPE_CHECKING:
         assert False, "This backend is only available on Linux"
 
 import logging
-from collections.abc import Iterable
-from typing import Any, no_type_check
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple, Optional, no_type_check
 from warnings import warn
 
 from dbus_fast import PropertyAccess
 from dbus_fast.service import ServiceInterface, dbus_property, method
 
+from bleak.args.bluez import BlueZMonitorRSSI
 from bleak.args.bluez import OrPattern as _OrPattern
 from bleak.args.bluez import OrPatternLike as _OrPatternLike
 from bleak.backends.bluezdbus import defs
@@ -44,6 +45,70 @@ def __getattr__(name: str):
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+class MonitorRSSIParameters(NamedTuple):
+    """
+    Validated RSSI parameters of an advertisement monitor.
+    """
+
+    high_threshold: int
+    low_threshold: int
+    high_timeout: int
+    low_timeout: int
+    sampling_period: int
+
+
+def get_rssi_parameters(options: BlueZMonitorRSSI) -> MonitorRSSIParameters:
+    """
+    Fills in defaults for missing RSSI parameters and checks that all values
+    are in the ranges accepted by BlueZ.
+
+    BlueZ requires that either all or none of the RSSI parameters are set.
+
+    Raises:
+        ValueError: if a value is out of range.
+    """
+    high_threshold = options.get("RSSIHighThreshold")
+    low_threshold = options.get("RSSILowThreshold")
+
+    if high_threshold is None:
+        low_threshold = -127 if low_threshold is None else low_threshold
+        high_threshold = low_threshold + 1
+    elif low_threshold is None:
+        low_threshold = high_threshold - 1
+
+    params = MonitorRSSIParameters(
+        high_threshold,
+        low_threshold,
+        options.get("RSSIHighTimeout", 1),
+        options.get("RSSILowTimeout", 5),
+        options.get("RSSISamplingPeriod", 0),
+    )
+
+    for name, value in [
+        ("RSSIHighThreshold", params.high_threshold),
+        ("RSSILowThreshold", params.low_threshold),
+    ]:
+        if not -127 <= value <= 20:
+            raise ValueError(f"{name} must be between -127 and 20 dBm, got {value}")
+
+    if params.low_threshold > params.high_threshold:
+        raise ValueError("RSSILowThreshold must not be greater than RSSIHighThreshold")
+
+    for name, value in [
+        ("RSSIHighTimeout", params.high_timeout),
+        ("RSSILowTimeout", params.low_timeout),
+    ]:
+        if not 1 <= value <= 300:
+            raise ValueError(f"{name} must be between 1 and 300 seconds, got {value}")
+
+    if not 0 <= params.sampling_period <= 255:
+        raise ValueError(
+            f"RSSISamplingPeriod must be between 0 and 255, got {params.sampling_period}"
+        )
+
+    return params
+
+
 class AdvertisementMonitor(ServiceInterface):
     """
     Implementation of the org.bluez.AdvertisementMonitor1 D-Bus interface.
@@ -61,23 +126,33 @@ class AdvertisementMonitor(ServiceInterface):
     def __init__(
         self,
         or_patterns: Iterable[_OrPatternLike],
+        on_rejected: Optional[Callable[[], None]] = None,
     ):
         """
         Args:
             or_patterns:
                 List of or patterns that will be returned by the ``Patterns`` property.
+            on_rejected:
+                Optional callback that is called if BlueZ releases the monitor
+                without activating it, e.g. because of invalid properties.
         """
         super().__init__(defs.ADVERTISEMENT_MONITOR_INTERFACE)
         # dbus_fast marshaling requires list instead of tuple
         self._or_patterns = [list(p) for p in or_patterns]
+        self._on_rejected = on_rejected
+        self._activated = False
 
     @method()
     def Release(self):
         logger.debug("Release")
 
+        if not self._activated and self._on_rejected:
+            self._on_rejected()
+
     @method()
     def Activate(self):
         logger.debug("Activate")
+        self._activated = True
 
     # REVISIT: mypy is broke, so we have to add redundant @no_type_check
     # https://github.com/python/mypy/issues/6583
@@ -129,3 +204,56 @@ class AdvertisementMonitor(ServiceInterface):
     @no_type_check
     def Patterns(self) -> "a(yyay)":  # noqa: F821
         return self._or_patterns
+
+
+class RSSIAdvertisementMonitor(AdvertisementMonitor):
+    """
+    :class:`AdvertisementMonitor` that also has the RSSI properties.
+
+    dbus-fast properties can only be enabled or disabled per class, so this is
+    a separate class.
+    """
+
+    def __init__(
+        self,
+        or_patterns: Iterable[_OrPatternLike],
+        rssi: MonitorRSSIParameters,
+        on_rejected: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            or_patterns:
+                List of or patterns that will be returned by the ``Patterns`` property.
+            rssi:
+                The values of the RSSI properties.
+            on_rejected:
+                Optional callback that is called if BlueZ releases the monitor
+                without activating it, e.g. because of invalid properties.
+        """
+        super().__init__(or_patterns, on_rejected)
+        self._rssi = rssi
+
+    @dbus_property(PropertyAccess.READ)
+    @no_type_check
+    def RSSILowThreshold(self) -> "n":  # noqa: F821
+        return self._rssi.low_threshold
+
+    @dbus_property(PropertyAccess.READ)
+    @no_type_check
+    def RSSIHighThreshold(self) -> "n":  # noqa: F821
+        return self._rssi.high_threshold
+
+    @dbus_property(PropertyAccess.READ)
+    @no_type_check
+    def RSSILowTimeout(self) -> "q":  # noqa: F821
+        return self._rssi.low_timeout
+
+    @dbus_property(PropertyAccess.READ)
+    @no_type_check
+    def RSSIHighTimeout(self) -> "q":  # noqa: F821
+        return self._rssi.high_timeout
+
+    @dbus_property(PropertyAccess.READ)
+    @no_type_check
+    def RSSISamplingPeriod(self) -> "q":  # noqa: F821
+        return self._rssi.sampling_period
@@ -14,10 +14,11 @@ if TYPE_CHECKING:
 import asyncio
 import logging
 import os
+import time
 import warnings
-from collections.abc import Callable
-from contextlib import AsyncExitStack
-from typing import Any, Optional, Union
+from collections.abc import Callable, Coroutine, Iterable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, nullcontext
+from typing import Any, Optional, TypeVar, Union, cast
 
 from dbus_fast.aio import MessageBus
 from dbus_fast.constants import BusType, ErrorType, MessageType
@@ -29,23 +30,79 @@ from bleak._compat import override
 from bleak._compat import timeout as async_timeout
 from bleak.args import SizedBuffer
 from bleak.backends.bluezdbus import defs
-from bleak.backends.bluezdbus.manager import get_global_bluez_manager
-from bleak.backends.bluezdbus.scanner import BleakScannerBlueZDBus
+from bleak.backends.bluezdbus.manager import BlueZManager, get_global_bluez_manager
+from bleak.backends.bluezdbus.operation_queue import GattOperationQueue
+from bleak.backends.bluezdbus.scanner import BleakScannerBlueZDBus, get_active_scanner
 from bleak.backends.bluezdbus.utils import (
     assert_gatt_reply,
     assert_reply,
     get_dbus_authenticator,
 )
 from bleak.backends.bluezdbus.version import BlueZFeatures
-from bleak.backends.characteristic import BleakGATTCharacteristic
-from bleak.backends.client import BaseBleakClient, NotifyCallback
+from bleak.backends.characteristic import (
+    BleakGATTCharacteristic,
+    GattCharacteristicsFlags,
+)
+from bleak.backends.client import (
+    BaseBleakClient,
+    BatchNotifyCallback,
+    NotifyCallback,
+    TimestampedNotifyCallback,
+    create_batch_notify_callback,
+)
 from bleak.backends.descriptor import BleakGATTDescriptor
 from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
 from bleak.backends.service import BleakGATTServiceCollection
 from bleak.exc import BleakDBusError, BleakDeviceNotFoundError, BleakError
+from bleak.registry import DeviceRecord, ServiceRecord
 
 logger = logging.getLogger(__name__)
 
+# Size of the buffer for one notification from an AcquireNotify socket. The
+# largest attribute value is 512 bytes.
+_NOTIFY_READ_SIZE = 1024
+
+# Maximum number of notifications that are read from an AcquireNotify socket at
+# once.
+_NOTIFY_MAX_BATCH = 64
+
+# map of BlueZNotifyArgs value_type to function that converts a notification
+_VALUE_TYPES: dict[str, Callable[[Any], Any]] = {
+    "bytearray": bytearray,
+    "bytes": bytes,
+    "memoryview": memoryview,
+}
+
+
+def _get_value_converter(bluez: BlueZNotifyArgs) -> Callable[[Any], Any]:
+    value_type = bluez.get("value_type", "bytearray")
+
+    if value_type not in _VALUE_TYPES:
+        raise ValueError(f"invalid value_type: {value_type!r}")
+
+    return _VALUE_TYPES[value_type]
+
+
+_T = TypeVar("_T")
+
+
+async def _gather_results(
+    coros: Iterable[Coroutine[Any, Any, _T]],
+) -> list[Union[_T, BleakError]]:
+    """
+    Runs coroutines concurrently and returns their results, or the error for
+    coroutines that raised :class:`BleakError`.
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, BleakError):
+            raise result
+
+    return cast(list[Union[_T, BleakError]], results)
+
+
 # prevent tasks from being garbage collected
 _background_tasks: set[asyncio.Task[None]] = set()
 
@@ -71,6 +128,14 @@ class BleakClientBlueZDBus(BaseBleakClient):
         super().__init__(address_or_ble_device, **kwargs)
 
         self._adapter = bluez.get("adapter")
+        self._address_type = bluez.get("address_type")
+        self._registry = bluez.get("registry")
+        self._pause_discovery = bluez.get("pause_discovery", True)
+        self._use_acquire_write = bluez.get("use_acquire_write", True)
+        self._services_changed_callback = bluez.get("services_changed_callback")
+        self._characteristic_discovered_callback = bluez.get(
+            "characteristic_discovered_callback"
+        )
         self._device_path: Optional[str]
         self._device_info: Optional[dict[str, Any]]
 
@@ -83,6 +148,8 @@ class BleakClientBlueZDBus(BaseBleakClient):
             self._device_info = None
 
         self._requested_services = services
+        # checks services from the device registry after connecting
+        self._revalidate_services_task: Optional[asyncio.Task[None]] = None
 
         # D-Bus message bus
         self._bus: Optional[MessageBus] = None
@@ -95,9 +162,17 @@ class BleakClientBlueZDBus(BaseBleakClient):
         # used to ensure device gets disconnected if event loop crashes
         self._disconnect_monitor_event: Optional[asyncio.Event] = None
         # map of characteristic D-Bus object path to notification callback
-        self._notification_callbacks: dict[str, NotifyCallback] = {}
+        self._notification_callbacks: dict[str, Callable[[bytes], None]] = {}
         # map of characteristic D-Bus path to AcquireNotify file descriptor
         self._notification_fds: dict[str, int] = {}
+        # serializes reads and writes of each attribute
+        self._operation_queue = GattOperationQueue()
+        # map of characteristic D-Bus path to AcquireWrite file descriptor
+        self._write_fds: dict[str, int] = {}
+        # map of AcquireWrite file descriptor to future waiting for it to be writable
+        self._write_fd_waiters: dict[int, asyncio.Future[None]] = {}
+        # characteristic D-Bus paths where AcquireWrite failed
+        self._acquire_write_failed: set[str] = set()
 
         # used to override mtu_size property
         self._mtu_size: Optional[int] = None
@@ -110,6 +185,17 @@ class BleakClientBlueZDBus(BaseBleakClient):
     ) -> None:
         """Connect to the specified GATT server.
 
+        If the client was created with an address instead of a :class:`BLEDevice`
+        and BlueZ already has an object for the device (e.g. because it was
+        seen recently or is paired), the device is connected directly without
+        scanning first. If the ``address_type`` BlueZ client arg was given, the
+        ``ConnectDevice`` D-Bus method is tried next. Then, if a scanner is
+        already running on the adapter, the device is looked for in its
+        advertisements. Otherwise, ``BleakScanner.find_device_by_address`` is
+        used to find the device. The same happens if the client was created
+        with a :class:`BLEDevice` that BlueZ no longer has an object for, e.g.
+        one that was returned from a persistent device registry.
+
         Keyword Args:
             timeout (float): Timeout for required ``BleakScanner.find_device_by_address`` call.
 
@@ -127,30 +213,27 @@ class BleakClientBlueZDBus(BaseBleakClient):
             await BlueZFeatures.check_bluez_version()
         if not BlueZFeatures.supported_version:
             raise BleakError("Bleak requires BlueZ >= 5.55.")
-        # A Discover must have been run before connecting to any devices.
-        # Find the desired device before trying to connect.
+
+        manager = await get_global_bluez_manager()
+
+        loop = asyncio.get_running_loop()
         timeout = kwargs.get("timeout", self._timeout)
-        if self._device_path is None:
-            device = await BleakScanner.find_device_by_address(
-                self.address,
-                timeout=timeout,
-                bluez={} if self._adapter is None else {"adapter": self._adapter},
-                backend=BleakScannerBlueZDBus,
-            )
+        deadline = loop.time() + timeout
 
-            if device:
-                self._device_info = device.details.get("props")
-                self._device_path = device.details["path"]
-            else:
-                raise BleakDeviceNotFoundError(
-                    self.address, f"Device with address {self.address} was not found."
-                )
+        if (
+            self._device_path is None
+            or manager.get_device_properties(self._device_path) is None
+        ) and not await self._find_device(manager, deadline):
+            # scanning for the device is not part of the connection timeout
+            deadline = loop.time() + timeout
 
         assert self._device_path is not None
 
-        manager = await get_global_bluez_manager()
+        pause_discovery = self._pause_discovery_context(
+            manager, await self._get_adapter_path()
+        )
 
-        async with async_timeout(timeout):
+        async with async_timeout(deadline - loop.time()), pause_discovery:
             while True:
                 async with AsyncExitStack() as stack:
                     # Each BLE connection session needs a new D-Bus connection to avoid a
@@ -188,10 +271,20 @@ class BleakClientBlueZDBus(BaseBleakClient):
                         callback = self._notification_callbacks.get(char_path)
 
                         if callback:
-                            callback(bytearray(value))
+                            callback(value)
+
+                    def on_services_changed() -> None:
+                        if self._registry is not None and self.services is not None:
+                            self._update_registry(manager)
+
+                        if self._services_changed_callback is not None:
+                            self._services_changed_callback()
 
                     watcher = manager.add_device_watcher(
-                        self._device_path, on_connected_changed, on_value_changed
+                        self._device_path,
+                        on_connected_changed,
+                        on_value_changed,
+                        on_services_changed,
                     )
                     self._remove_device_watcher = lambda: manager.remove_device_watcher(
                         watcher
@@ -326,9 +419,229 @@ class BleakClientBlueZDBus(BaseBleakClient):
                         dangerous_use_bleak_cache=dangerous_use_bleak_cache
                     )
 
+                    if self._registry is not None:
+                        self._update_registry(manager)
+
                     stack.pop_all()
                     return
 
+    async def _find_device(self, manager: BlueZManager, deadline: float) -> bool:
+        """
+        Finds the D-Bus object for the device when this client was created
+        with an address instead of a :class:`BLEDevice`.
+
+        Args:
+            manager: The BlueZ manager.
+            deadline: The event loop time when connecting times out.
+
+        Returns:
+            ``True`` if the device is already being connected with
+            ``ConnectDevice``, in which case the rest of the connection must
+            finish before ``deadline``.
+
+        Raises:
+            BleakDeviceNotFoundError: if the device could not be found.
+        """
+        loop = asyncio.get_running_loop()
+
+        # If BlueZ already has a D-Bus object for this device, we can
+        # connect to it directly without having to scan first.
+        device_path = await self._get_device_path()
+        device_info = manager.get_device_properties(device_path)
+
+        if device_info is not None:
+            logger.debug("found %s in BlueZ, connecting without scanning", device_path)
+            self._device_info = cast(dict[str, Any], device_info)
+            self._device_path = device_path
+            return False
+
+        address_type = self._get_address_type()
+
+        if address_type is not None and (
+            connected_device_path := await self._connect_device(
+                address_type, deadline - loop.time()
+            )
+        ):
+            self._device_info = cast(
+                Optional[dict[str, Any]],
+                manager.get_device_properties(connected_device_path),
+            )
+            self._device_path = connected_device_path
+            return True
+
+        timeout = deadline - loop.time()
+
+        # A Discover must have been run before connecting to any devices.
+        # If there is already a scanner running on this adapter, we can wait
+        # for the device to show up there instead of starting another
+        # discovery session.
+        scanner = get_active_scanner(await self._get_adapter_path())
+
+        if scanner is not None:
+            logger.debug("%s not found in BlueZ, waiting for %s", device_path, scanner)
+            device = await self._wait_for_device(scanner, timeout)
+        else:
+            logger.debug("%s not found in BlueZ, scanning for it", device_path)
+            device = await BleakScanner.find_device_by_address(
+                self.address,
+                timeout=timeout,
+                bluez={} if self._adapter is None else {"adapter": self._adapter},
+                backend=BleakScannerBlueZDBus,
+            )
+
+        if device is None:
+            raise BleakDeviceNotFoundError(
+                self.address, f"Device with address {self.address} was not found."
+            )
+
+        self._device_info = device.details.get("props")
+        self._device_path = device.details["path"]
+
+        return False
+
+    async def _wait_for_device(
+        self, scanner: BleakScannerBlueZDBus, timeout: float
+    ) -> Optional[BLEDevice]:
+        """
+        Waits for a running scanner to receive an advertisement from this device.
+
+        Returns:
+            The device or ``None`` if it was not seen before the timeout.
+        """
+        address = self.address.upper()
+
+        for device, _ in scanner.seen_devices.values():
+            if device.address.upper() == address:
+                return device
+
+        found: asyncio.Future[BLEDevice] = asyncio.get_running_loop().create_future()
+
+        def on_advertisement(device: BLEDevice, adv: AdvertisementData) -> None:
+            if device.address.upper() == address and not found.done():
+                found.set_result(device)
+
+        unregister_callback = scanner.register_detection_callback(on_advertisement)
+
+        try:
+            async with async_timeout(timeout):
+                return await found
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            unregister_callback()
+
+    async def _connect_device(self, address_type: str, timeout: float) -> Optional[str]:
+        """
+        Connects to a device that BlueZ does not have an object for yet using
+        the ``ConnectDevice`` D-Bus method instead of scanning for it.
+
+        Returns:
+            The D-Bus object path of the device or ``None`` if ``ConnectDevice``
+            is not available, in which case the caller should fall back to
+            scanning.
+        """
+        manager = await get_global_bluez_manager()
+        adapter_path = await self._get_adapter_path()
+
+        logger.debug(
+            "Calling ConnectDevice for %s (%s) on %s",
+            self.address,
+            address_type,
+            adapter_path,
+        )
+
+        try:
+            async with (
+                async_timeout(timeout),
+                self._pause_discovery_context(manager, adapter_path),
+            ):
+                return await manager.connect_device(
+                    adapter_path, self.address.upper(), address_type
+                )
+        except BleakDBusError as e:
+            if e.dbus_error == defs.BLUEZ_ERROR_ALREADY_EXISTS:
+                # device object was created in the meantime, e.g. by a scanner
+                return await self._get_device_path()
+
+            # ConnectDevice is only available when BlueZ experimental features
+            # are enabled
+            if e.dbus_error in [
+                ErrorType.UNKNOWN_METHOD.value,
+                defs.BLUEZ_ERROR_NOT_SUPPORTED,
+            ]:
+                logger.debug("ConnectDevice not available, scanning instead: %s", e)
+                return None
+
+            raise
+
+    def _pause_discovery_context(
+        self, manager: BlueZManager, adapter_path: str
+    ) -> AbstractAsyncContextManager[None]:
+        """
+        Gets a context manager that pauses discovery on the adapter while
+        connecting, unless disabled by the ``pause_discovery`` BlueZ client arg.
+        """
+        if self._pause_discovery:
+            return manager.pause_discovery(adapter_path)
+
+        return nullcontext()
+
+    def _get_address_type(self) -> Optional[str]:
+        """
+        Gets the address type of the device from the ``address_type`` BlueZ
+        client arg, the :class:`BLEDevice` or the device registry, if known.
+        """
+        if self._address_type is not None:
+            return self._address_type
+
+        if self._device_info and "AddressType" in self._device_info:
+            return self._device_info["AddressType"]
+
+        if self._registry is not None and (record := self._registry.get(self.address)):
+            return record.address_type
+
+        return None
+
+    def _update_registry(self, manager: BlueZManager) -> None:
+        """
+        Records the connected device in the device registry.
+        """
+        assert self._registry is not None
+        assert self._device_path is not None
+        assert self.services is not None
+
+        previous = self._registry.get(self.address)
+        props = manager.get_device_properties(self._device_path)
+
+        if props is None:
+            # device was removed in the meantime
+            return
+
+        # Only use the value if BlueZ already read it, we don't want to make
+        # connecting slower by reading it ourselves.
+        gatt_database_hash = manager.get_gatt_database_hash(self._device_path) or (
+            previous.gatt_database_hash if previous else None
+        )
+
+        self._registry.update(
+            DeviceRecord(
+                props["Address"],
+                # same as BleakScannerBlueZDBus
+                (
+                    None
+                    if props["Alias"] == props["Address"].replace(":", "-")
+                    else props["Alias"]
+                ),
+                time.time(),
+                previous.advertisement if previous else None,
+                props.get("AddressType"),
+                props.get("Adapter"),
+                self._device_path,
+                gatt_database_hash,
+                manager.get_services_structure(self._device_path),
+            )
+        )
+
     @staticmethod
     async def _disconnect_monitor(
         bus: MessageBus, device_path: str, disconnect_monitor_event: asyncio.Event
@@ -372,6 +685,15 @@ class BleakClientBlueZDBus(BaseBleakClient):
             self._remove_device_watcher()
             self._remove_device_watcher = None
 
+        if self._revalidate_services_task:
+            self._revalidate_services_task.cancel()
+            self._revalidate_services_task = None
+
+        for char_path in list(self._write_fds):
+            self._release_write_fd(char_path)
+
+        self._acquire_write_failed.clear()
+
         if not self._bus:
             logger.debug("already disconnected (%s)", self._device_path)
             return
@@ -564,6 +886,11 @@ class BleakClientBlueZDBus(BaseBleakClient):
             self.services is not None
         ), "Services must be acquired before acquiring MTU"
 
+        if self._write_fds:
+            # already set when the write was acquired and BlueZ would not allow
+            # acquiring it again
+            return
+
         # This will try to get the "best" characteristic for getting the MTU.
         # We would rather not start notifications if we don't have to.
         try:
@@ -571,14 +898,15 @@ class BleakClientBlueZDBus(BaseBleakClient):
             char = next(
                 c
                 for c in self.services.characteristics.values()
-                if "write-without-response" in c.properties
+                if c.property_flags
+                & GattCharacteristicsFlags.write_without_response.value
             )
         except StopIteration:
             method = "AcquireNotify"
             char = next(
                 c
                 for c in self.services.characteristics.values()
-                if "notify" in c.properties
+                if c.property_flags & GattCharacteristicsFlags.notify.value
             )
 
         assert self._bus
@@ -673,15 +1001,133 @@ class BleakClientBlueZDBus(BaseBleakClient):
         assert self._device_path is not None
 
         manager = await get_global_bluez_manager()
+        expected_services = self._get_expected_services(manager)
 
         self.services = await manager.get_services(
-            self._device_path, dangerous_use_bleak_cache, self._requested_services
+            self._device_path,
+            dangerous_use_bleak_cache,
+            self._requested_services,
+            expected_services,
+            self._characteristic_discovered_callback,
         )
 
+        if expected_services is not None:
+            self._revalidate_services_task = asyncio.create_task(
+                self._revalidate_services(manager, expected_services)
+            )
+
         return self.services
 
+    def _get_expected_services(
+        self, manager: BlueZManager
+    ) -> Optional[tuple[ServiceRecord, ...]]:
+        """
+        Gets the structure of the GATT database from the device registry, if
+        it is still valid.
+        """
+        assert self._device_path is not None
+
+        if self._registry is None:
+            return None
+
+        record = self._registry.get(self.address)
+
+        if record is None or record.services is None:
+            return None
+
+        gatt_database_hash = manager.get_gatt_database_hash(self._device_path)
+
+        if (
+            record.gatt_database_hash is not None
+            and gatt_database_hash is not None
+            and gatt_database_hash != record.gatt_database_hash
+        ):
+            logger.debug("GATT database hash of %s changed", self.address)
+            return None
+
+        return record.services
+
+    async def _revalidate_services(
+        self, manager: BlueZManager, expected_services: tuple[ServiceRecord, ...]
+    ) -> None:
+        """
+        Waits for BlueZ to finish resolving services after services from the
+        device registry were used.
+
+        If the GATT database of the device changed, BlueZ adds and removes
+        objects while resolving services and :attr:`services` is updated in
+        place by the manager, so it is not replaced here.
+        """
+        assert self._device_path is not None
+
+        try:
+            await manager.wait_for_services_resolved(self._device_path)
+        except BleakError as e:
+            logger.debug("failed to revalidate services: %s", e)
+            return
+
+        if manager.get_services_structure(self._device_path) == expected_services:
+            return
+
+        logger.info("services of %s changed since last connection", self.address)
+
+        if self._registry is not None:
+            self._update_registry(manager)
+
     # IO methods
 
+    async def _call_gatt_method(
+        self,
+        path: str,
+        interface: str,
+        member: str,
+        signature: str,
+        body: list[Any],
+        *,
+        queued: bool = True,
+    ) -> Message:
+        """
+        Calls a ``ReadValue`` or ``WriteValue`` D-Bus method of a characteristic
+        or descriptor.
+
+        BlueZ only allows one read and one write at a time per attribute, so
+        the call waits in a queue until previous reads or writes of the same
+        attribute are done. Set ``queued`` to false if the caller is already
+        holding the queue.
+
+        Raises:
+            BleakGATTProtocolError: if the device returned an ATT error.
+            BleakDBusError: if the method call failed.
+        """
+        async with (
+            self._operation_queue.acquire((path, member)) if queued else nullcontext()
+        ):
+            while True:
+                assert self._bus
+
+                reply = await self._bus.call(
+                    Message(
+                        destination=defs.BLUEZ_SERVICE,
+                        path=path,
+                        interface=interface,
+                        member=member,
+                        signature=signature,
+                        body=body,
+                    )
+                )
+
+                if reply.error_name == defs.BLUEZ_ERROR_IN_PROGRESS:
+                    # Our own operations are queued, so this only happens when
+                    # another D-Bus client uses the same attribute. There is no
+                    # dbus signal to indicate ready, so unfortunately, we have
+                    # to poll.
+                    logger.debug("retrying %s %s due to InProgress", path, member)
+                    await asyncio.sleep(0.01)
+                    continue
+
+                assert_gatt_reply(reply)
+                return reply
+
     @override
     async def read_gatt_char(
         self,
@@ -706,29 +1152,13 @@ class BleakClientBlueZDBus(BaseBleakClient):
             manager = await get_global_bluez_manager()
             return bytearray(manager.get_char_value(characteristic.obj[0]))
 
-        while True:
-            assert self._bus
-
-            reply = await self._bus.call(
-                Message(
-                    destination=defs.BLUEZ_SERVICE,
-                    path=characteristic.obj[0],
-                    interface=defs.GATT_CHARACTERISTIC_INTERFACE,
-                    member="ReadValue",
-                    signature="a{sv}",
-                    body=[{}],
-                )
-            )
-
-            if reply.error_name == defs.BLUEZ_ERROR_IN_PROGRESS:
-                logger.debug("retrying characteristic ReadValue due to InProgress")
-                # Avoid calling in a tight loop. There is no dbus signal to
-                # indicate ready, so unfortunately, we have to poll.
-                await asyncio.sleep(0.01)
-                continue
-
-            assert_gatt_reply(reply)
-            break
+        reply = await self._call_gatt_method(
+            characteristic.obj[0],
+            defs.GATT_CHARACTERISTIC_INTERFACE,
+            "ReadValue",
+            "a{sv}",
+            [{}],
+        )
 
         value = bytearray(reply.body[0])
 
@@ -765,29 +1195,13 @@ class BleakClientBlueZDBus(BaseBleakClient):
             manager = await get_global_bluez_manager()
             return bytearray(manager.get_desc_value(descriptor.obj[0]))
 
-        while True:
-            assert self._bus
-
-            reply = await self._bus.call(
-                Message(
-                    destination=defs.BLUEZ_SERVICE,
-                    path=descriptor.obj[0],
-                    interface=defs.GATT_DESCRIPTOR_INTERFACE,
-                    member="ReadValue",
-                    signature="a{sv}",
-                    body=[{}],
-                )
-            )
-
-            if reply.error_name == defs.BLUEZ_ERROR_IN_PROGRESS:
-                logger.debug("retrying descriptor ReadValue due to InProgress")
-                # Avoid calling in a tight loop. There is no dbus signal to
-                # indicate ready, so unfortunately, we have to poll.
-                await asyncio.sleep(0.01)
-                continue
-
-            assert_gatt_reply(reply)
-            break
+        reply = await self._call_gatt_method(
+            descriptor.obj[0],
+            defs.GATT_DESCRIPTOR_INTERFACE,
+            "ReadValue",
+            "a{sv}",
+            [{}],
+        )
 
         value = bytearray(reply.body[0])
 
@@ -796,6 +1210,27 @@ class BleakClientBlueZDBus(BaseBleakClient):
         )
         return value
 
+    @override
+    async def read_gatt_chars(
+        self, characteristics: list[BleakGATTCharacteristic], **kwargs: Any
+    ) -> list[Union[bytearray, BleakError]]:
+        # BlueZ queues the requests, so all D-Bus calls can be sent at once
+        # instead of waiting for each reply. Operations on the same
+        # characteristic are still done in order by the operation queue.
+        return await _gather_results(
+            self.read_gatt_char(characteristic, **kwargs)
+            for characteristic in characteristics
+        )
+
+    @override
+    async def write_gatt_chars(
+        self, writes: list[tuple[BleakGATTCharacteristic, SizedBuffer, bool]]
+    ) -> list[Optional[BleakError]]:
+        return await _gather_results(
+            self.write_gatt_char(characteristic, data, response)
+            for characteristic, data, response in writes
+        )
+
     @override
     async def write_gatt_char(
         self, characteristic: BleakGATTCharacteristic, data: SizedBuffer, response: bool
@@ -803,39 +1238,159 @@ class BleakClientBlueZDBus(BaseBleakClient):
         if not self.is_connected:
             raise BleakError("Not connected")
 
-        while True:
+        char_path = characteristic.obj[0]
+
+        async with self._operation_queue.acquire((char_path, "WriteValue")):
+            if (
+                not response
+                and self._use_acquire_write
+                and "WriteAcquired" in characteristic.obj[1]
+                and char_path not in self._acquire_write_failed
+                and len(data) <= characteristic.max_write_without_response_size
+            ):
+                if await self._write_acquired(characteristic, data):
+                    logger.debug(
+                        "Write Characteristic %s | %s: %s",
+                        characteristic.uuid,
+                        char_path,
+                        data,
+                    )
+                    return
+            else:
+                # BlueZ does not allow WriteValue while the write is acquired
+                self._release_write_fd(char_path)
+
+            await self._call_gatt_method(
+                char_path,
+                defs.GATT_CHARACTERISTIC_INTERFACE,
+                "WriteValue",
+                "aya{sv}",
+                [
+                    bytes(data),
+                    {"type": Variant("s", "request" if response else "command")},
+                ],
+                queued=False,
+            )
+
+        logger.debug(
+            "Write Characteristic %s | %s: %s",
+            characteristic.uuid,
+            characteristic.obj[0],
+            data,
+        )
+
+    async def _write_acquired(
+        self, characteristic: BleakGATTCharacteristic, data: SizedBuffer
+    ) -> bool:
+        """
+        Writes without response using the "AcquireWrite" file descriptor of a
+        characteristic, which is much faster than a "WriteValue" call. The
+        file descriptor is acquired on first use and kept open.
+
+        Must be called while holding the operation queue of the characteristic.
+
+        Returns:
+            ``False`` if the file descriptor can't be used, in which case
+            "WriteValue" has to be used instead.
+
+        Raises:
+            BleakError: if the device disconnected while waiting to write.
+        """
+        char_path = characteristic.obj[0]
+        fd = self._write_fds.get(char_path)
+
+        if fd is None:
             assert self._bus
 
             reply = await self._bus.call(
                 Message(
                     destination=defs.BLUEZ_SERVICE,
-                    path=characteristic.obj[0],
+                    path=char_path,
                     interface=defs.GATT_CHARACTERISTIC_INTERFACE,
-                    member="WriteValue",
-                    signature="aya{sv}",
-                    body=[
-                        bytes(data),
-                        {"type": Variant("s", "request" if response else "command")},
-                    ],
+                    member="AcquireWrite",
+                    signature="a{sv}",
+                    body=[{}],
                 )
             )
 
-            if reply.error_name == defs.BLUEZ_ERROR_IN_PROGRESS:
-                logger.debug("retrying characteristic WriteValue due to InProgress")
-                # Avoid calling in a tight loop. There is no dbus signal to
-                # indicate ready, so unfortunately, we have to poll.
-                await asyncio.sleep(0.01)
-                continue
+            if reply.message_type == MessageType.ERROR:
+                # e.g. another D-Bus client has acquired it
+                logger.debug(
+                    "AcquireWrite failed for characteristic %d: %s %s",
+                    characteristic.handle,
+                    reply.error_name,
+                    reply.body,
+                )
+                self._acquire_write_failed.add(char_path)
+                return False
 
-            assert_gatt_reply(reply)
-            break
+            fd = reply.unix_fds[0]
+            os.set_blocking(fd, False)
+            self._write_fds[char_path] = fd
+            self._mtu_size = reply.body[1]
 
-        logger.debug(
-            "Write Characteristic %s | %s: %s",
-            characteristic.uuid,
-            characteristic.obj[0],
-            data,
-        )
+        while True:
+            try:
+                # The socket is SOCK_SEQPACKET, so each write is one packet
+                os.write(fd, data)
+                return True
+            except BlockingIOError:
+                # BlueZ has not sent the previous packets to the device yet
+                try:
+                    await self._wait_write_fd_writable(fd)
+                except BrokenPipeError:
+                    # the file descriptor was released while waiting, e.g. on
+                    # disconnect
+                    if not self.is_connected:
+                        raise BleakError("Not connected")
+
+                    return False
+            except OSError as e:
+                # e.g. BlueZ closed the socket on disconnect
+                logger.debug("AcquireWrite: write error on fd %d: %s", fd, e)
+                self._release_write_fd(char_path)
+                return False
+
+    async def _wait_write_fd_writable(self, fd: int) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = self._write_fd_waiters[fd] = loop.create_future()
+
+        def on_writable() -> None:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        loop.add_writer(fd, on_writable)
+
+        try:
+            await waiter
+        finally:
+            self._write_fd_waiters.pop(fd, None)
+            loop.remove_writer(fd)
+
+    def _release_write_fd(self, char_path: str) -> None:
+        """
+        Closes the "AcquireWrite" file descriptor of a characteristic, if any.
+        """
+        fd = self._write_fds.pop(char_path, None)
+
+        if fd is None:
+            return
+
+        waiter = self._write_fd_waiters.pop(fd, None)
+
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(BrokenPipeError())
+
+        try:
+            asyncio.get_running_loop().remove_writer(fd)
+        except RuntimeError:
+            # Run loop is closed
+            pass
+
+        try:
+            os.close(fd)
+        except OSError as e:
+            logger.debug("Failed to close file descriptor %d: %s", fd, e)
 
     @override
     async def write_gatt_descriptor(
@@ -851,64 +1406,90 @@ class BleakClientBlueZDBus(BaseBleakClient):
         if not self.is_connected:
             raise BleakError("Not connected")
 
-        while True:
-            assert self._bus
-
-            reply = await self._bus.call(
-                Message(
-                    destination=defs.BLUEZ_SERVICE,
-                    path=descriptor.obj[0],
-                    interface=defs.GATT_DESCRIPTOR_INTERFACE,
-                    member="WriteValue",
-                    signature="aya{sv}",
-                    body=[bytes(data), {"type": Variant("s", "command")}],
-                )
-            )
-
-            if reply.error_name == defs.BLUEZ_ERROR_IN_PROGRESS:
-                logger.debug("retrying descriptor WriteValue due to InProgress")
-                # Avoid calling in a tight loop. There is no dbus signal to
-                # indicate ready, so unfortunately, we have to poll.
-                await asyncio.sleep(0.01)
-                continue
-
-            assert_gatt_reply(reply)
-            break
+        await self._call_gatt_method(
+            descriptor.obj[0],
+            defs.GATT_DESCRIPTOR_INTERFACE,
+            "WriteValue",
+            "aya{sv}",
+            [bytes(data), {"type": Variant("s", "command")}],
+        )
 
         logger.debug(
             "Write Descriptor %s | %s: %s", descriptor.handle, descriptor.obj[0], data
         )
 
     def _register_notify_fd_reader(
-        self, char_path: str, fd: int, callback: NotifyCallback
+        self,
+        char_path: str,
+        fd: int,
+        callback: Callable[[list[memoryview], Optional[int]], None],
+        timestamps: bool = False,
     ) -> None:
-        loop = asyncio.get_running_loop()
+        """
+        Reads notifications from an "AcquireNotify" file descriptor.
 
-        def on_data():
-            try:
-                data = os.read(fd, 1024)
-                if not data:
-                    raise RuntimeError("Unexpected EOF on notification file handle")
-            except Exception as e:
-                logger.debug(
-                    "AcquireNotify: Read error on fd %d: %s. Notifications have been stopped.",
-                    fd,
-                    e,
-                )
-                try:
-                    loop.remove_reader(fd)
-                except RuntimeError:
-                    # Run loop is closed
-                    pass
+        All packets that are pending when the file descriptor becomes readable
+        are read into a buffer that is allocated once and passed to
+        ``callback`` together. The memoryviews are only valid until
+        ``callback`` returns.
+
+        If ``timestamps`` is true, ``callback`` also receives the
+        :func:`time.monotonic_ns` time when the file descriptor became
+        readable, otherwise ``None``.
+        """
+        loop = asyncio.get_running_loop()
+        os.set_blocking(fd, False)
+
+        # The socket is SOCK_SEQPACKET, so each read is one notification
+        buffer = memoryview(bytearray(_NOTIFY_READ_SIZE * _NOTIFY_MAX_BATCH))
+        slots = [
+            buffer[i : i + _NOTIFY_READ_SIZE]
+            for i in range(0, len(buffer), _NOTIFY_READ_SIZE)
+        ]
+
+        def on_data() -> None:
+            timestamp = time.monotonic_ns() if timestamps else None
+            packets: list[memoryview] = []
+            error: Optional[Exception] = None
+
+            # limit the number of packets so other work is not starved
+            for slot in slots:
                 try:
-                    os.close(fd)
-                except OSError:
-                    # Bad file descriptor
-                    pass
-                self._notification_fds.pop(char_path, None)
+                    n = os.readv(fd, [slot])
+                except BlockingIOError:
+                    break
+                except Exception as e:
+                    error = e
+                    break
+
+                if not n:
+                    error = RuntimeError("Unexpected EOF on notification file handle")
+                    break
+
+                packets.append(slot[:n])
+
+            if packets:
+                callback(packets, timestamp)
+
+            if error is None:
                 return
 
-            callback(bytearray(data))
+            logger.debug(
+                "AcquireNotify: Read error on fd %d: %s. Notifications have been stopped.",
+                fd,
+                error,
+            )
+            try:
+                loop.remove_reader(fd)
+            except RuntimeError:
+                # Run loop is closed
+                pass
+            try:
+                os.close(fd)
+            except OSError:
+                # Bad file descriptor
+                pass
+            self._notification_fds.pop(char_path, None)
 
         loop.add_reader(fd, on_data)
 
@@ -929,8 +1510,97 @@ class BleakClientBlueZDBus(BaseBleakClient):
         Keyword Args:
             bluez (dict): dictionary of additional parameters, see :ref:`linux-start-notify` for more details.
         """
+        bluez: BlueZNotifyArgs = kwargs["bluez"]
+        convert = _get_value_converter(bluez)
+
+        def on_packets(packets: list[memoryview], timestamp: Optional[int]) -> None:
+            for packet in packets:
+                callback(convert(packet))
+
+        await self._start_notify(
+            characteristic,
+            bluez,
+            on_packets,
+            lambda value: callback(convert(value)),
+            timestamps=False,
+        )
+
+    @override
+    async def start_notify_timestamped(
+        self,
+        characteristic: BleakGATTCharacteristic,
+        callback: TimestampedNotifyCallback,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Same as :meth:`start_notify` but ``callback`` also receives the
+        :func:`time.monotonic_ns` time when the notification was received.
+
+        The time is taken when the "AcquireNotify" socket becomes readable, so
+        notifications that are read at once have the same time, or when the
+        D-Bus message with the new value is received.
+        """
+        bluez: BlueZNotifyArgs = kwargs["bluez"]
+        convert = _get_value_converter(bluez)
+
+        def on_packets(packets: list[memoryview], timestamp: Optional[int]) -> None:
+            assert timestamp is not None
+
+            for packet in packets:
+                callback(convert(packet), timestamp)
+
+        await self._start_notify(
+            characteristic,
+            bluez,
+            on_packets,
+            lambda value: callback(convert(value), time.monotonic_ns()),
+            timestamps=True,
+        )
+
+    @override
+    async def start_notify_batched(
+        self,
+        characteristic: BleakGATTCharacteristic,
+        callback: BatchNotifyCallback,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Same as :meth:`start_notify` but ``callback`` receives a list of tuples
+        of the :func:`time.monotonic_ns` time when a notification was received
+        and its data.
 
+        All notifications that are read at once from the "AcquireNotify" socket
+        are passed to a single call. Notifications received as D-Bus messages
+        are collected during one iteration of the event loop.
+        """
         bluez: BlueZNotifyArgs = kwargs["bluez"]
+        convert = _get_value_converter(bluez)
+        on_notification = create_batch_notify_callback(callback)
+
+        def on_packets(packets: list[memoryview], timestamp: Optional[int]) -> None:
+            assert timestamp is not None
+            callback([(timestamp, convert(packet)) for packet in packets])
+
+        await self._start_notify(
+            characteristic,
+            bluez,
+            on_packets,
+            lambda value: on_notification(convert(value), time.monotonic_ns()),
+            timestamps=True,
+        )
+
+    async def _start_notify(
+        self,
+        characteristic: BleakGATTCharacteristic,
+        bluez: BlueZNotifyArgs,
+        on_packets: Callable[[list[memoryview], Optional[int]], None],
+        on_value: Callable[[bytes], None],
+        timestamps: bool,
+    ) -> None:
+        """
+        Starts notifications with ``on_packets`` as callback for "AcquireNotify"
+        or ``on_value`` as callback for "StartNotify".
+        """
         force_use_start_notify = bluez.get("use_start_notify", False)
 
         assert self._bus is not None
@@ -965,9 +1635,12 @@ class BleakClientBlueZDBus(BaseBleakClient):
 
             unix_fd = reply.unix_fds[0]
             self._notification_fds[characteristic.obj[0]] = unix_fd
-            self._register_notify_fd_reader(characteristic.obj[0], unix_fd, callback)
+
+            self._register_notify_fd_reader(
+                characteristic.obj[0], unix_fd, on_packets, timestamps
+            )
         else:
-            self._notification_callbacks[characteristic.obj[0]] = callback
+            self._notification_callbacks[characteristic.obj[0]] = on_value
             reply = await self._bus.call(
                 Message(
                     destination=defs.BLUEZ_SERVICE,
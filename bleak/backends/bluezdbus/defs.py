@@ -22,6 +22,7 @@ GATT_CHARACTERISTIC_INTERFACE = "org.bluez.GattCharacteristic1"
 GATT_DESCRIPTOR_INTERFACE = "org.bluez.GattDescriptor1"
 
 # BlueZ error names
+BLUEZ_ERROR_ALREADY_EXISTS = "org.bluez.Error.AlreadyExists"
 BLUEZ_ERROR_DOES_NOT_EXIST = "org.bluez.Error.DoesNotExist"
 BLUEZ_ERROR_FAILED = "org.bluez.Error.Failed"
 BLUEZ_ERROR_IMPROPERLY_CONFIGURED = "org.bluez.Error.ImproperlyConfigured"
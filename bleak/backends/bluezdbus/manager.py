@@ -18,7 +18,7 @@ import contextlib
 import logging
 import os
 from collections import defaultdict
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
 from functools import partial
 from typing import Any, NamedTuple, Optional, cast
 
@@ -27,13 +27,18 @@ from dbus_fast.aio.message_bus import MessageBus
 
 from bleak.args.bluez import OrPatternLike
 from bleak.backends.bluezdbus import defs
-from bleak.backends.bluezdbus.advertisement_monitor import AdvertisementMonitor
+from bleak.backends.bluezdbus.advertisement_monitor import (
+    AdvertisementMonitor,
+    MonitorRSSIParameters,
+    RSSIAdvertisementMonitor,
+)
 from bleak.backends.bluezdbus.defs import (
     Device1,
     GattCharacteristic1,
     GattDescriptor1,
     GattService1,
 )
+from bleak.backends.bluezdbus.or_patterns import compile_or_patterns
 from bleak.backends.bluezdbus.signals import MatchRules, add_match
 from bleak.backends.bluezdbus.utils import (
     assert_reply,
@@ -50,9 +55,14 @@ from bleak.exc import (
     BleakDBusError,
     BleakError,
 )
+from bleak.registry import ServiceRecord, get_service_records
+from bleak.uuids import normalize_uuid_16
 
 logger = logging.getLogger(__name__)
 
+# prevent tasks from being garbage collected
+_background_tasks: set[asyncio.Task[None]] = set()
+
 AdvertisementCallback = Callable[[str, Device1], None]
 """
 A callback that is called when advertisement data is received.
@@ -63,6 +73,18 @@ Args:
 """
 
 
+_GATT_DATABASE_HASH_UUID = normalize_uuid_16(0x2B2A)
+
+
+DiscoveryPausedCallback = Callable[[bool], None]
+"""
+A callback that is called when discovery is paused or resumed.
+
+Args:
+    arg0: ``True`` when discovery was paused, ``False`` when it was resumed.
+"""
+
+
 DevicePropertiesChangedCallback = Callable[[Optional[Any]], None]
 """
 A callback that is called when the properties of a device change in BlueZ.
@@ -130,6 +152,21 @@ Args:
     arg1: The current value of the "Value" property.
 """
 
+ServicesChangedCallback = Callable[[], None]
+"""
+A callback that is called when GATT services of a connected device were added
+or removed.
+"""
+
+CharacteristicAddedCallback = Callable[[BleakGATTCharacteristic], None]
+"""
+A callback that is called when a characteristic was added to a service
+collection.
+
+Args:
+    arg0: The characteristic.
+"""
+
 
 class DeviceWatcher(NamedTuple):
     device_path: str
@@ -147,6 +184,22 @@ class DeviceWatcher(NamedTuple):
     A callback that is called when a characteristics's "Value" property changes.
     """
 
+    on_services_changed: Optional[ServicesChangedCallback] = None
+    """
+    A callback that is called when the cached services of the device were
+    updated because GATT objects were added or removed.
+    """
+
+
+class _LiveServices(NamedTuple):
+    """
+    A service collection that is updated as GATT objects are added or removed.
+    """
+
+    services: BleakGATTServiceCollection
+    requested_services: Optional[set[str]]
+    on_characteristic_added: Optional[CharacteristicAddedCallback] = None
+
 
 # set of org.bluez.Device1 property names that come from advertising data
 _ADVERTISING_DATA_PROPERTIES = {
@@ -159,6 +212,69 @@ _ADVERTISING_DATA_PROPERTIES = {
 }
 
 
+def merge_discovery_filters(filters: list[dict[str, Variant]]) -> dict[str, Variant]:
+    """
+    Combines the discovery filters of several scanners into one filter that
+    lets through at least all of the advertisements that each of the filters
+    lets through.
+
+    Since the combined filter is less strict than the individual filters,
+    scanners must still apply their own filter to the advertisements they
+    receive.
+
+    Args:
+        filters: The ``SetDiscoveryFilter`` filters of each scanner.
+
+    Returns:
+        The combined filter.
+    """
+    merged: dict[str, Variant] = {}
+
+    if not filters:
+        return merged
+
+    # only filter on UUIDs if all scanners do, otherwise we would miss
+    # devices for scanners that don't filter on UUIDs
+    if all("UUIDs" in f and f["UUIDs"].value for f in filters):
+        uuids = sorted({u for f in filters for u in f["UUIDs"].value})
+        merged["UUIDs"] = Variant("as", uuids)
+
+    # RSSI and Pathloss are thresholds, so the weakest one is used
+    if all("RSSI" in f for f in filters):
+        merged["RSSI"] = Variant("n", min(f["RSSI"].value for f in filters))
+
+    if all("Pathloss" in f for f in filters):
+        merged["Pathloss"] = Variant("n", max(f["Pathloss"].value for f in filters))
+
+    transports = {f["Transport"].value if "Transport" in f else "auto" for f in filters}
+    merged["Transport"] = Variant(
+        "s", transports.pop() if len(transports) == 1 else "auto"
+    )
+
+    # BlueZ defaults to True, which disables duplicate filtering and reports
+    # more advertisements
+    merged["DuplicateData"] = Variant(
+        "b",
+        any(
+            f["DuplicateData"].value if "DuplicateData" in f else True for f in filters
+        ),
+    )
+
+    # only discoverable devices are reported, so all scanners have to ask for it
+    if all("Discoverable" in f and f["Discoverable"].value for f in filters):
+        merged["Discoverable"] = Variant("b", True)
+
+    # a common prefix of all patterns matches everything that any of the
+    # patterns match
+    if all("Pattern" in f for f in filters):
+        pattern = os.path.commonprefix([f["Pattern"].value for f in filters])
+
+        if pattern:
+            merged["Pattern"] = Variant("s", pattern)
+
+    return merged
+
+
 def get_max_write_without_response_size(char_props: GattCharacteristic1) -> int:
     # "MTU" property was added in BlueZ 5.62, otherwise fall
     # back to minimum MTU according to Bluetooth spec.
@@ -196,9 +312,29 @@ class BlueZManager:
             defaultdict(list)
         )
         self._device_removed_callbacks: list[DeviceRemovedCallbackAndState] = []
+        # map of adapter path to the discovery filters of each active scanner
+        self._discovery_filters: defaultdict[str, list[dict[str, Variant]]] = (
+            defaultdict(list)
+        )
+        # map of adapter path to the filter that was last given to SetDiscoveryFilter
+        self._applied_discovery_filters: dict[str, dict[str, Variant]] = {}
+        # map of adapter path to number of active pause_discovery() contexts
+        self._discovery_pauses: dict[str, int] = {}
+        self._discovery_paused_callbacks: defaultdict[
+            str, list[DiscoveryPausedCallback]
+        ] = defaultdict(list)
         self._device_watchers: dict[str, set[DeviceWatcher]] = {}
         self._condition_callbacks: dict[str, set[DeviceConditionCallback]] = {}
+        # services of connected devices are kept up to date as objects are
+        # added and removed, see _on_gatt_object_added/removed()
         self._services_cache: dict[str, BleakGATTServiceCollection] = {}
+        self._services_cache_filters: dict[str, Optional[set[str]]] = {}
+        # devices for which get_services() completed during the current
+        # connection, only their cached services are kept up to date
+        self._services_live: set[str] = set()
+        self._services_changed_pending: set[str] = set()
+        # map of device path to services that are being discovered
+        self._discovering_services: dict[str, _LiveServices] = {}
 
     def _check_adapter(self, adapter_path: str) -> None:
         """
@@ -250,6 +386,8 @@ class BlueZManager:
                 return
 
             self._services_cache = {}
+            self._services_cache_filters = {}
+            self._services_live = set()
 
             # We need to create a new MessageBus each time as
             # dbus-next will destroy the underlying file descriptors
@@ -418,10 +556,18 @@ class BlueZManager:
         filters: dict[str, Variant],
         advertisement_callback: AdvertisementCallback,
         device_removed_callback: DeviceRemovedCallback,
+        discovery_paused_callback: Optional[DiscoveryPausedCallback] = None,
     ) -> Callable[[], Coroutine[Any, Any, None]]:
         """
         Configures the advertisement data filters and starts scanning.
 
+        All active scanners on an adapter share a single discovery session.
+        Discovery is started for the first scanner and stopped when the last
+        one stops. The filter passed to ``SetDiscoveryFilter`` is the
+        combination of the filters of all of the scanners (see
+        :func:`merge_discovery_filters`), so callers must still filter the
+        advertisements they receive.
+
         Args:
             adapter_path: The D-Bus object path of the adapter to use for scanning.
             filters: A dictionary of filters to pass to ``SetDiscoveryFilter``.
@@ -429,6 +575,9 @@ class BlueZManager:
                 A callable that will be called when new advertisement data is received.
             device_removed_callback:
                 A callable that will be called when a device is removed from BlueZ.
+            discovery_paused_callback:
+                Optional callable that will be called when discovery is paused
+                and resumed by :meth:`pause_discovery`.
 
         Returns:
             An async function that is used to stop scanning and remove the filters.
@@ -451,30 +600,33 @@ class BlueZManager:
             )
             self._device_removed_callbacks.append(device_removed_callback_and_state)
 
+            discovery_filters = self._discovery_filters[adapter_path]
+            paused = adapter_path in self._discovery_pauses
+
             try:
-                # Apply the filters
-                reply = await self._bus.call(
-                    Message(
-                        destination=defs.BLUEZ_SERVICE,
-                        path=adapter_path,
-                        interface=defs.ADAPTER_INTERFACE,
-                        member="SetDiscoveryFilter",
-                        signature="a{sv}",
-                        body=[filters],
+                # All scanners on an adapter share one discovery session, so we
+                # only need to start discovery for the first one.
+                if paused:
+                    # discovery will be started when it is resumed
+                    logger.debug("discovery on %s is paused", adapter_path)
+                elif discovery_filters:
+                    logger.debug("joining discovery session on %s", adapter_path)
+                    await self._update_discovery_filter(
+                        adapter_path, [*discovery_filters, filters]
                     )
-                )
-                assert_reply(reply)
+                else:
+                    await self._update_discovery_filter(adapter_path, [filters])
+                    await self._start_discovery(adapter_path)
 
-                # Start scanning
-                reply = await self._bus.call(
-                    Message(
-                        destination=defs.BLUEZ_SERVICE,
-                        path=adapter_path,
-                        interface=defs.ADAPTER_INTERFACE,
-                        member="StartDiscovery",
+                discovery_filters.append(filters)
+
+                if discovery_paused_callback:
+                    self._discovery_paused_callbacks[adapter_path].append(
+                        discovery_paused_callback
                     )
-                )
-                assert_reply(reply)
+
+                    if paused:
+                        discovery_paused_callback(True)
 
                 async def stop() -> None:
                     # need to remove callbacks first, otherwise we get TxPower
@@ -487,24 +639,29 @@ class BlueZManager:
                         device_removed_callback_and_state
                     )
 
+                    if discovery_paused_callback:
+                        self._discovery_paused_callbacks[adapter_path].remove(
+                            discovery_paused_callback
+                        )
+
                     async with self._bus_lock:
                         assert self._bus
 
-                        reply = await self._bus.call(
-                            Message(
-                                destination=defs.BLUEZ_SERVICE,
-                                path=adapter_path,
-                                interface=defs.ADAPTER_INTERFACE,
-                                member="StopDiscovery",
+                        discovery_filters.remove(filters)
+
+                        # discovery is already stopped, resuming takes care
+                        # of the filters
+                        if adapter_path in self._discovery_pauses:
+                            return
+
+                        # other scanners are still using the discovery session
+                        if discovery_filters:
+                            await self._update_discovery_filter(
+                                adapter_path, discovery_filters
                             )
-                        )
+                            return
 
-                        try:
-                            assert_reply(reply)
-                        except BleakDBusError as ex:
-                            if ex.dbus_error != defs.BLUEZ_ERROR_NOT_READY:
-                                raise
-                        else:
+                        if await self._stop_discovery(adapter_path):
                             # remove the filters
                             reply = await self._bus.call(
                                 Message(
@@ -525,18 +682,184 @@ class BlueZManager:
                     advertisement_callback
                 )
                 self._device_removed_callbacks.remove(device_removed_callback_and_state)
+
+                if not discovery_filters:
+                    self._applied_discovery_filters.pop(adapter_path, None)
+
                 raise
 
+    async def _start_discovery(self, adapter_path: str) -> None:
+        """
+        Calls ``StartDiscovery`` on an adapter.
+
+        Must be called with ``_bus_lock`` held.
+        """
+        assert self._bus
+
+        reply = await self._bus.call(
+            Message(
+                destination=defs.BLUEZ_SERVICE,
+                path=adapter_path,
+                interface=defs.ADAPTER_INTERFACE,
+                member="StartDiscovery",
+            )
+        )
+        assert_reply(reply)
+
+    async def _stop_discovery(self, adapter_path: str) -> bool:
+        """
+        Calls ``StopDiscovery`` on an adapter.
+
+        BlueZ forgets the discovery filter when discovery is stopped.
+
+        Must be called with ``_bus_lock`` held.
+
+        Returns:
+            ``False`` if discovery was already stopped, e.g. because the
+            adapter was powered off, otherwise ``True``.
+        """
+        assert self._bus
+
+        self._applied_discovery_filters.pop(adapter_path, None)
+
+        reply = await self._bus.call(
+            Message(
+                destination=defs.BLUEZ_SERVICE,
+                path=adapter_path,
+                interface=defs.ADAPTER_INTERFACE,
+                member="StopDiscovery",
+            )
+        )
+
+        try:
+            assert_reply(reply)
+        except BleakDBusError as ex:
+            if ex.dbus_error != defs.BLUEZ_ERROR_NOT_READY:
+                raise
+
+            return False
+
+        return True
+
+    @contextlib.asynccontextmanager
+    async def pause_discovery(self, adapter_path: str) -> AsyncIterator[None]:
+        """
+        Temporarily stops active scanning on an adapter.
+
+        Many controllers connect more slowly or fail to connect while
+        discovery is running, so this is used while connecting. Scanners are
+        not stopped, instead they are notified that discovery was paused and
+        resumed via their ``discovery_paused_callback``. Pauses can be nested
+        and overlap, discovery is resumed when the last one ends.
+
+        Args:
+            adapter_path: The D-Bus object path of the adapter.
+        """
+        async with self._bus_lock:
+            count = self._discovery_pauses.get(adapter_path, 0)
+            self._discovery_pauses[adapter_path] = count + 1
+
+            if count == 0 and self._discovery_filters[adapter_path]:
+                logger.debug("pausing discovery on %s", adapter_path)
+
+                try:
+                    await self._stop_discovery(adapter_path)
+                except BleakDBusError as e:
+                    logger.warning("failed to pause discovery: %s", e)
+
+                for callback in self._discovery_paused_callbacks[adapter_path]:
+                    callback(True)
+
+        try:
+            yield
+        finally:
+            async with self._bus_lock:
+                count = self._discovery_pauses.pop(adapter_path) - 1
+
+                if count:
+                    self._discovery_pauses[adapter_path] = count
+                elif discovery_filters := self._discovery_filters[adapter_path]:
+                    logger.debug("resuming discovery on %s", adapter_path)
+
+                    try:
+                        await self._update_discovery_filter(
+                            adapter_path, discovery_filters
+                        )
+                        await self._start_discovery(adapter_path)
+                    except BleakDBusError as e:
+                        logger.warning("failed to resume discovery: %s", e)
+
+                    for callback in self._discovery_paused_callbacks[adapter_path]:
+                        callback(False)
+
+    async def _update_discovery_filter(
+        self, adapter_path: str, filters: list[dict[str, Variant]]
+    ) -> None:
+        """
+        Sets the discovery filter of an adapter to the combination of
+        ``filters`` if it is different from the one that is currently set.
+
+        Must be called with ``_bus_lock`` held.
+        """
+        assert self._bus
+
+        merged = merge_discovery_filters(filters)
+
+        if self._applied_discovery_filters.get(adapter_path) == merged:
+            return
+
+        reply = await self._bus.call(
+            Message(
+                destination=defs.BLUEZ_SERVICE,
+                path=adapter_path,
+                interface=defs.ADAPTER_INTERFACE,
+                member="SetDiscoveryFilter",
+                signature="a{sv}",
+                body=[merged],
+            )
+        )
+        assert_reply(reply)
+
+        self._applied_discovery_filters[adapter_path] = merged
+
+    def supports_advertisement_monitor(self, adapter_path: str) -> bool:
+        """
+        Checks if an adapter supports advertisement monitors, which are needed
+        for passive scanning.
+
+        BlueZ only has the ``org.bluez.AdvertisementMonitorManager1``
+        interface when experimental features are enabled and the kernel
+        supports it.
+
+        Args:
+            adapter_path: The D-Bus object path of the adapter.
+
+        Raises:
+            BleakError: if the adapter is not present in BlueZ
+        """
+        self._check_adapter(adapter_path)
+
+        return (
+            defs.ADVERTISEMENT_MONITOR_MANAGER_INTERFACE
+            in self._properties[adapter_path]
+        )
+
     async def passive_scan(
         self,
         adapter_path: str,
         filters: list[OrPatternLike],
         advertisement_callback: AdvertisementCallback,
         device_removed_callback: DeviceRemovedCallback,
+        rssi: Optional[MonitorRSSIParameters] = None,
+        rssi_rejected_callback: Optional[Callable[[], None]] = None,
     ) -> Callable[[], Coroutine[Any, Any, None]]:
         """
         Configures the advertisement data filters and starts scanning.
 
+        The patterns are deduplicated and split between as many advertisement
+        monitors as needed to stay within the limits of the kernel (see
+        :func:`~bleak.backends.bluezdbus.or_patterns.compile_or_patterns`).
+
         Args:
             adapter_path: The D-Bus object path of the adapter to use for scanning.
             filters: A list of "or patterns" to pass to ``org.bluez.AdvertisementMonitor1``.
@@ -544,12 +867,20 @@ class BlueZManager:
                 A callable that will be called when new advertisement data is received.
             device_removed_callback:
                 A callable that will be called when a device is removed from BlueZ.
+            rssi:
+                Optional RSSI properties for ``org.bluez.AdvertisementMonitor1``.
+                If BlueZ rejects the monitor because of them, it is replaced
+                by a monitor without RSSI properties.
+            rssi_rejected_callback:
+                Optional callback that is called if BlueZ rejected the RSSI
+                properties, so that the caller can filter by RSSI instead.
 
         Returns:
             An async function that is used to stop scanning and remove the filters.
 
         Raises:
             BleakError: if the adapter is not present in BlueZ
+            ValueError: if a pattern is invalid
         """
         async with self._bus_lock:
             assert self._bus
@@ -559,6 +890,9 @@ class BlueZManager:
             # error message.
             self._check_adapter(adapter_path)
 
+            # one group of patterns per monitor
+            pattern_groups = compile_or_patterns(filters)
+
             self._advertisement_callbacks[adapter_path].append(advertisement_callback)
 
             device_removed_callback_and_state = DeviceRemovedCallbackAndState(
@@ -566,39 +900,70 @@ class BlueZManager:
             )
             self._device_removed_callbacks.append(device_removed_callback_and_state)
 
-            try:
-                monitor = AdvertisementMonitor(filters)
+            # registered monitors and their D-Bus object paths
+            monitors: list[tuple[str, AdvertisementMonitor]] = []
+            stopped = False
+            rejected = False
+
+            async def register_monitors(use_rssi: bool) -> None:
+                for patterns in pattern_groups:
+                    monitor = (
+                        RSSIAdvertisementMonitor(patterns, rssi, on_rejected)
+                        if use_rssi and rssi is not None
+                        else AdvertisementMonitor(patterns)
+                    )
+                    monitors.append(
+                        (await self._register_monitor(adapter_path, monitor), monitor)
+                    )
 
-                # this should be a unique path to allow multiple python interpreters
-                # running bleak and multiple scanners within a single interpreter
-                monitor_path = f"/org/bleak/{os.getpid()}/{id(monitor)}"
+            async def unregister_monitors() -> None:
+                while monitors:
+                    monitor_path, monitor = monitors.pop()
+                    await self._unregister_monitor(adapter_path, monitor_path, monitor)
 
-                reply = await self._bus.call(
-                    Message(
-                        destination=defs.BLUEZ_SERVICE,
-                        path=adapter_path,
-                        interface=defs.ADVERTISEMENT_MONITOR_MANAGER_INTERFACE,
-                        member="RegisterMonitor",
-                        signature="o",
-                        body=[monitor_path],
-                    )
-                )
+            async def replace_monitors() -> None:
+                async with self._bus_lock:
+                    if stopped:
+                        return
 
-                if (
-                    reply.message_type == MessageType.ERROR
-                    and reply.error_name == "org.freedesktop.DBus.Error.UnknownMethod"
-                ):
-                    raise BleakError(
-                        "passive scanning on Linux requires BlueZ >= 5.56 with --experimental enabled and Linux kernel >= 5.10"
-                    )
+                    try:
+                        await unregister_monitors()
+                    except BleakDBusError as e:
+                        logger.debug("failed to unregister rejected monitor: %s", e)
 
-                assert_reply(reply)
+                    monitors.clear()
+                    await register_monitors(use_rssi=False)
+
+            def on_rejected() -> None:
+                nonlocal rejected
+
+                # called once for each monitor
+                if rejected:
+                    return
+
+                rejected = True
+
+                logger.debug(
+                    "advertisement monitor RSSI properties not supported, filtering in software"
+                )
+                task = asyncio.create_task(replace_monitors())
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
 
-                # It is important to export after registering, otherwise BlueZ
-                # won't use the monitor
-                self._bus.export(monitor_path, monitor)
+                if rssi_rejected_callback:
+                    rssi_rejected_callback()
+
+            try:
+                try:
+                    await register_monitors(use_rssi=True)
+                except BaseException:
+                    # don't leave monitors behind if registering one failed
+                    await unregister_monitors()
+                    raise
 
                 async def stop() -> None:
+                    nonlocal stopped
+
                     # need to remove callbacks first, otherwise we get TxPower
                     # and RSSI properties removed during stop which causes
                     # incorrect advertisement data callbacks
@@ -610,21 +975,8 @@ class BlueZManager:
                     )
 
                     async with self._bus_lock:
-                        assert self._bus
-
-                        self._bus.unexport(monitor_path, monitor)
-
-                        reply = await self._bus.call(
-                            Message(
-                                destination=defs.BLUEZ_SERVICE,
-                                path=adapter_path,
-                                interface=defs.ADVERTISEMENT_MONITOR_MANAGER_INTERFACE,
-                                member="UnregisterMonitor",
-                                signature="o",
-                                body=[monitor_path],
-                            )
-                        )
-                        assert_reply(reply)
+                        stopped = True
+                        await unregister_monitors()
 
                 return stop
 
@@ -636,11 +988,124 @@ class BlueZManager:
                 self._device_removed_callbacks.remove(device_removed_callback_and_state)
                 raise
 
+    async def _register_monitor(
+        self, adapter_path: str, monitor: AdvertisementMonitor
+    ) -> str:
+        """
+        Registers and exports an advertisement monitor.
+
+        Must be called with ``_bus_lock`` held.
+
+        Returns:
+            The D-Bus object path of the monitor.
+        """
+        assert self._bus
+
+        # this should be a unique path to allow multiple python interpreters
+        # running bleak and multiple scanners within a single interpreter
+        monitor_path = f"/org/bleak/{os.getpid()}/{id(monitor)}"
+
+        reply = await self._bus.call(
+            Message(
+                destination=defs.BLUEZ_SERVICE,
+                path=adapter_path,
+                interface=defs.ADVERTISEMENT_MONITOR_MANAGER_INTERFACE,
+                member="RegisterMonitor",
+                signature="o",
+                body=[monitor_path],
+            )
+        )
+
+        if (
+            reply.message_type == MessageType.ERROR
+            and reply.error_name == "org.freedesktop.DBus.Error.UnknownMethod"
+        ):
+            raise BleakError(
+                "passive scanning on Linux requires BlueZ >= 5.56 with --experimental enabled and Linux kernel >= 5.10"
+            )
+
+        assert_reply(reply)
+
+        # It is important to export after registering, otherwise BlueZ
+        # won't use the monitor
+        self._bus.export(monitor_path, monitor)
+
+        return monitor_path
+
+    async def _unregister_monitor(
+        self, adapter_path: str, monitor_path: str, monitor: AdvertisementMonitor
+    ) -> None:
+        """
+        Unexports and unregisters an advertisement monitor.
+
+        Must be called with ``_bus_lock`` held.
+        """
+        assert self._bus
+
+        self._bus.unexport(monitor_path, monitor)
+
+        reply = await self._bus.call(
+            Message(
+                destination=defs.BLUEZ_SERVICE,
+                path=adapter_path,
+                interface=defs.ADVERTISEMENT_MONITOR_MANAGER_INTERFACE,
+                member="UnregisterMonitor",
+                signature="o",
+                body=[monitor_path],
+            )
+        )
+        assert_reply(reply)
+
+    async def connect_device(
+        self, adapter_path: str, address: str, address_type: str
+    ) -> str:
+        """
+        Creates a device object and connects to it without discovery using
+        the experimental ``org.bluez.Adapter1.ConnectDevice`` method.
+
+        Args:
+            adapter_path: The D-Bus object path of the adapter to use.
+            address: The Bluetooth address of the device.
+            address_type: The address type, ``"public"`` or ``"random"``.
+
+        Returns:
+            The D-Bus object path of the new device.
+
+        Raises:
+            BleakError: if the adapter is not present in BlueZ
+            BleakDBusError: if the D-Bus method call failed, e.g. with
+                ``org.freedesktop.DBus.Error.UnknownMethod`` if BlueZ
+                experimental features are not enabled.
+        """
+        assert self._bus
+
+        self._check_adapter(adapter_path)
+
+        reply = await self._bus.call(
+            Message(
+                destination=defs.BLUEZ_SERVICE,
+                path=adapter_path,
+                interface=defs.ADAPTER_INTERFACE,
+                member="ConnectDevice",
+                signature="a{sv}",
+                body=[
+                    {
+                        "Address": Variant("s", address),
+                        "AddressType": Variant("s", address_type),
+                    }
+                ],
+            )
+        )
+        assert_reply(reply)
+
+        return reply.body[0]
+
     def add_device_watcher(
         self,
         device_path: str,
         on_connected_changed: DeviceConnectedChangedCallback,
         on_characteristic_value_changed: CharacteristicValueChangedCallback,
+        on_services_changed: Optional[ServicesChangedCallback] = None,
     ) -> DeviceWatcher:
         """
         Registers a device watcher to receive callbacks when device state
@@ -655,6 +1120,12 @@ class BlueZManager:
             on_characteristic_value_changed:
                 A callback that is called whenever a characteristic receives
                 a notification/indication.
+            on_services_changed:
+                A callback that is called when the services returned by
+                :meth:`get_services` were updated in place because the device
+                added or removed GATT services, characteristics or descriptors.
+
+                .. versionadded:: 3.1
 
         Returns:
             A device watcher object that acts a token to unregister the watcher.
@@ -665,7 +1136,10 @@ class BlueZManager:
         self._check_device(device_path)
 
         watcher = DeviceWatcher(
-            device_path, on_connected_changed, on_characteristic_value_changed
+            device_path,
+            on_connected_changed,
+            on_characteristic_value_changed,
+            on_services_changed,
         )
 
         self._device_watchers.setdefault(device_path, set()).add(watcher)
@@ -685,7 +1159,12 @@ class BlueZManager:
             del self._device_watchers[device_path]
 
     async def get_services(
-        self, device_path: str, use_cached: bool, requested_services: Optional[set[str]]
+        self,
+        device_path: str,
+        use_cached: bool,
+        requested_services: Optional[set[str]],
+        expected_services: Optional[tuple[ServiceRecord, ...]] = None,
+        on_characteristic_added: Optional[CharacteristicAddedCallback] = None,
     ) -> BleakGATTServiceCollection:
         """
         Builds a new :class:`BleakGATTServiceCollection` from the current state.
@@ -700,6 +1179,17 @@ class BlueZManager:
             requested_services:
                 When given, only return services with UUID that is in the list
                 of requested services.
+            expected_services:
+                The known structure of the GATT database of the device, e.g.
+                from a :class:`bleak.registry.DeviceRegistry`. If BlueZ already
+                has objects for exactly these attributes, the method does not
+                wait for ``"ServicesResolved"`` to become true.
+            on_characteristic_added:
+                A callback that is called for each characteristic as soon as
+                BlueZ exported it, while waiting for ``"ServicesResolved"`` to
+                become true. The characteristic can be used immediately.
+
+                .. versionadded:: 3.1
 
         Returns:
             A new :class:`BleakGATTServiceCollection`.
@@ -713,71 +1203,378 @@ class BlueZManager:
             services = self._services_cache.get(device_path)
             if services is not None:
                 logger.debug("Using cached services for %s", device_path)
+
+                if on_characteristic_added:
+                    for char in services.characteristics.values():
+                        self._run_characteristic_added_callback(
+                            on_characteristic_added, char
+                        )
+
+                self._services_live.add(device_path)
                 return services
 
-        await self._wait_for_services_discovery(device_path)
+        known = (
+            expected_services is not None
+            and self.get_services_structure(device_path) == expected_services
+        )
 
+        # Services are built from what BlueZ has already exported and objects
+        # that are added while waiting are added to the same collection, see
+        # _on_gatt_object_added(), so callers can start using them early.
+        services = self._build_services(
+            device_path, requested_services, on_characteristic_added
+        )
+
+        if known:
+            logger.debug("Using known services for %s", device_path)
+        else:
+            discovering = _LiveServices(
+                services, requested_services, on_characteristic_added
+            )
+            self._discovering_services[device_path] = discovering
+
+            try:
+                await self._wait_for_services_discovery(device_path)
+            finally:
+                if self._discovering_services.get(device_path) is discovering:
+                    del self._discovering_services[device_path]
+
+        # devices of the same model can share the lookup tables
+        services.share_indexes()
+
+        self._services_cache[device_path] = services
+        self._services_cache_filters[device_path] = requested_services
+        self._services_live.add(device_path)
+
+        return services
+
+    def _build_services(
+        self,
+        device_path: str,
+        requested_services: Optional[set[str]],
+        on_characteristic_added: Optional[CharacteristicAddedCallback] = None,
+    ) -> BleakGATTServiceCollection:
+        """
+        Builds a new :class:`BleakGATTServiceCollection` from the GATT objects
+        that currently exist for a device.
+        """
         services = BleakGATTServiceCollection()
 
         for service_path in self._service_map.get(device_path, set()):
-            service_props = cast(
-                GattService1,
-                self._properties[service_path][defs.GATT_SERVICE_INTERFACE],
+            self._add_service(
+                services, service_path, requested_services, on_characteristic_added
             )
 
-            service = BleakGATTService(
-                (service_path, service_props),
-                extract_service_handle_from_path(service_path),
-                service_props["UUID"],
+        return services
+
+    def _add_service(
+        self,
+        services: BleakGATTServiceCollection,
+        service_path: str,
+        requested_services: Optional[set[str]],
+        on_characteristic_added: Optional[CharacteristicAddedCallback] = None,
+    ) -> None:
+        """
+        Adds a service and all of its characteristics and descriptors that
+        currently exist to a service collection.
+        """
+        service_props = cast(
+            GattService1,
+            self._properties[service_path][defs.GATT_SERVICE_INTERFACE],
+        )
+
+        service = BleakGATTService(
+            (service_path, service_props),
+            extract_service_handle_from_path(service_path),
+            service_props["UUID"],
+        )
+
+        if requested_services is not None and service.uuid not in requested_services:
+            return
+
+        services.add_service(service)
+
+        for char_path in self._characteristic_map.get(service_path, set()):
+            self._add_characteristic(
+                services, service, char_path, on_characteristic_added
             )
 
+    def _add_characteristic(
+        self,
+        services: BleakGATTServiceCollection,
+        service: BleakGATTService,
+        char_path: str,
+        on_characteristic_added: Optional[CharacteristicAddedCallback] = None,
+    ) -> None:
+        """
+        Adds a characteristic and all of its descriptors that currently exist
+        to a service collection.
+        """
+        char_props = cast(
+            GattCharacteristic1,
+            self._properties[char_path][defs.GATT_CHARACTERISTIC_INTERFACE],
+        )
+
+        char = BleakGATTCharacteristic(
+            (char_path, char_props),
+            extract_service_handle_from_path(char_path),
+            char_props["UUID"],
+            char_props["Flags"],
+            partial(get_max_write_without_response_size, char_props),
+            service,
+        )
+
+        services.add_characteristic(char)
+
+        for desc_path in self._descriptor_map.get(char_path, set()):
+            self._add_descriptor(services, char, desc_path)
+
+        if on_characteristic_added:
+            self._run_characteristic_added_callback(on_characteristic_added, char)
+
+    def _run_characteristic_added_callback(
+        self,
+        on_characteristic_added: CharacteristicAddedCallback,
+        char: BleakGATTCharacteristic,
+    ) -> None:
+        """
+        Calls the ``on_characteristic_added`` callback of :meth:`get_services`.
+
+        This may be called while handling a D-Bus message, so errors in user
+        code are logged instead of raised.
+        """
+        try:
+            on_characteristic_added(char)
+        except Exception:
+            logger.exception("characteristic_discovered_callback failed")
+
+    def _add_descriptor(
+        self,
+        services: BleakGATTServiceCollection,
+        char: BleakGATTCharacteristic,
+        desc_path: str,
+    ) -> None:
+        """
+        Adds a descriptor to a service collection.
+        """
+        desc_props = cast(
+            GattDescriptor1,
+            self._properties[desc_path][defs.GATT_DESCRIPTOR_INTERFACE],
+        )
+
+        desc = BleakGATTDescriptor(
+            (desc_path, desc_props),
+            int(desc_path[-4:], 16),
+            desc_props["UUID"],
+            char,
+        )
+
+        services.add_descriptor(desc)
+
+    def _get_live_services(self, device_path: str) -> Optional[_LiveServices]:
+        """
+        Gets the service collection of a device that is kept up to date with
+        GATT objects being added and removed. This is either the collection
+        that is being discovered or the cached one if :meth:`get_services`
+        completed since the device connected.
+        """
+        discovering = self._discovering_services.get(device_path)
+
+        if discovering is not None:
+            return discovering
+
+        # BlueZ may remove the objects on disconnect but we want to keep the
+        # cached services and objects that are added after reconnecting belong
+        # to a new collection
+        if device_path not in self._services_live:
+            return None
+
+        services = self._services_cache.get(device_path)
+
+        if services is None:
+            return None
+
+        return _LiveServices(services, self._services_cache_filters.get(device_path))
+
+    def _on_gatt_object_added(self, interface: str, obj_path: str) -> None:
+        """
+        Updates the live service collection of a device when BlueZ adds a
+        GATT object.
+        """
+        if interface == defs.GATT_SERVICE_INTERFACE:
+            # /org/bluez/hci0/dev_XX_XX_XX_XX_XX_XX/serviceXXXX
+            device_path = obj_path.rsplit("/", 1)[0]
+            live = self._get_live_services(device_path)
+
             if (
-                requested_services is not None
-                and service.uuid not in requested_services
+                live is None
+                or live.services.get_service(extract_service_handle_from_path(obj_path))
+                is not None
             ):
-                continue
+                return
 
-            services.add_service(service)
+            self._add_service(
+                live.services,
+                obj_path,
+                live.requested_services,
+                live.on_characteristic_added,
+            )
+        elif interface == defs.GATT_CHARACTERISTIC_INTERFACE:
+            device_path, service_name, _ = obj_path.rsplit("/", 2)
+            live = self._get_live_services(device_path)
 
-            for char_path in self._characteristic_map.get(service_path, set()):
-                char_props = cast(
-                    GattCharacteristic1,
-                    self._properties[char_path][defs.GATT_CHARACTERISTIC_INTERFACE],
+            if (
+                live is None
+                or live.services.get_characteristic(
+                    extract_service_handle_from_path(obj_path)
                 )
+                is not None
+            ):
+                return
 
-                char = BleakGATTCharacteristic(
-                    (char_path, char_props),
-                    extract_service_handle_from_path(char_path),
-                    char_props["UUID"],
-                    char_props["Flags"],
-                    # Because `char_props` is a loop varialbe, we cannot
-                    # directly bind a closure (i.e. lambda) to it;
-                    # instead, we let `functools.partial` create a new
-                    # function frame to close over at each iteration.
-                    partial(get_max_write_without_response_size, char_props),
-                    service,
-                )
+            service = live.services.get_service(
+                extract_service_handle_from_path(service_name)
+            )
 
-                services.add_characteristic(char)
+            if service is None:
+                # not one of the requested services
+                return
 
-                for desc_path in self._descriptor_map.get(char_path, set()):
-                    desc_props = cast(
-                        GattDescriptor1,
-                        self._properties[desc_path][defs.GATT_DESCRIPTOR_INTERFACE],
-                    )
+            self._add_characteristic(
+                live.services, service, obj_path, live.on_characteristic_added
+            )
+        elif interface == defs.GATT_DESCRIPTOR_INTERFACE:
+            device_path, _, char_name, _ = obj_path.rsplit("/", 3)
+            live = self._get_live_services(device_path)
 
-                    desc = BleakGATTDescriptor(
-                        (desc_path, desc_props),
-                        int(desc_path[-4:], 16),
-                        desc_props["UUID"],
-                        char,
-                    )
+            if (
+                live is None
+                or live.services.get_descriptor(int(obj_path[-4:], 16)) is not None
+            ):
+                return
 
-                    services.add_descriptor(desc)
+            char = live.services.get_characteristic(
+                extract_service_handle_from_path(char_name)
+            )
 
-        self._services_cache[device_path] = services
+            if char is None:
+                return
 
-        return services
+            self._add_descriptor(live.services, char, obj_path)
+        else:
+            return
+
+        self._schedule_services_changed_callbacks(device_path)
+
+    def _on_gatt_object_removed(self, interface: str, obj_path: str) -> None:
+        """
+        Updates the live service collection of a device when BlueZ removes a
+        GATT object.
+        """
+        if interface == defs.GATT_SERVICE_INTERFACE:
+            device_path = obj_path.rsplit("/", 1)[0]
+        elif interface == defs.GATT_CHARACTERISTIC_INTERFACE:
+            device_path = obj_path.rsplit("/", 2)[0]
+        elif interface == defs.GATT_DESCRIPTOR_INTERFACE:
+            device_path = obj_path.rsplit("/", 3)[0]
+        else:
+            return
+
+        live = self._get_live_services(device_path)
+
+        if live is None:
+            return
+
+        handle = int(obj_path[-4:], 16)
+
+        if interface == defs.GATT_SERVICE_INTERFACE:
+            live.services.remove_service(handle)
+        elif interface == defs.GATT_CHARACTERISTIC_INTERFACE:
+            live.services.remove_characteristic(handle)
+        else:
+            live.services.remove_descriptor(handle)
+
+        self._schedule_services_changed_callbacks(device_path)
+
+    def _schedule_services_changed_callbacks(self, device_path: str) -> None:
+        """
+        Schedules calling the ``on_services_changed`` callbacks of the device
+        watchers. BlueZ adds and removes each GATT object with a separate
+        signal, so all changes received at once result in a single call.
+        """
+        if (
+            device_path in self._services_changed_pending
+            # get_services() has not returned the services yet
+            or device_path in self._discovering_services
+        ):
+            return
+
+        self._services_changed_pending.add(device_path)
+        asyncio.get_running_loop().call_soon(
+            self._run_services_changed_callbacks, device_path
+        )
+
+    def _run_services_changed_callbacks(self, device_path: str) -> None:
+        self._services_changed_pending.discard(device_path)
+
+        # callbacks may remove the watcher, hence the copy
+        for watcher in self._device_watchers.get(device_path, set()).copy():
+            if watcher.on_services_changed:
+                watcher.on_services_changed()
+
+    def get_services_structure(self, device_path: str) -> tuple[ServiceRecord, ...]:
+        """
+        Gets the structure of the GATT objects that currently exist for a
+        device, e.g. for storing it in a :class:`bleak.registry.DeviceRegistry`.
+
+        Args:
+            device_path: The D-Bus object path of the device.
+
+        Returns:
+            The records of all services.
+        """
+        return get_service_records(self._build_services(device_path, None))
+
+    def get_gatt_database_hash(self, device_path: str) -> Optional[bytes]:
+        """
+        Gets the value of the GATT Database Hash characteristic (0x2B2A) of a
+        device, if BlueZ has read it.
+
+        Args:
+            device_path: The D-Bus object path of the device.
+
+        Returns:
+            The hash or ``None`` if the device doesn't have the characteristic
+            or the value is not known.
+        """
+        for service_path in self._service_map.get(device_path, set()):
+            for char_path in self._characteristic_map.get(service_path, set()):
+                char_props = self._properties[char_path][
+                    defs.GATT_CHARACTERISTIC_INTERFACE
+                ]
+
+                if char_props["UUID"] == _GATT_DATABASE_HASH_UUID:
+                    return bytes(char_props.get("Value", b"")) or None
+
+        return None
+
+    def get_device_properties(self, device_path: str) -> Optional[Device1]:
+        """
+        Gets a copy of the "org.bluez.Device1" properties for a device.
+
+        Args:
+            device_path: The D-Bus object path of the device.
+
+        Returns:
+            The current property values or ``None`` if the device does not
+            exist in BlueZ.
+        """
+        try:
+            return cast(
+                Device1, self._properties[device_path][defs.DEVICE_INTERFACE].copy()
+            )
+        except KeyError:
+            return None
 
     def get_device_name(self, device_path: str) -> str:
         """
@@ -839,6 +1636,23 @@ class BlueZManager:
         except KeyError:
             return False
 
+    async def wait_for_services_resolved(self, device_path: str) -> None:
+        """
+        Waits for BlueZ to finish resolving the services of a device.
+
+        Services returned by :meth:`get_services` for the current connection
+        are updated in place while waiting.
+
+        Args:
+            device_path: The D-Bus object path of the device.
+
+        Raises:
+            BleakError:
+                if the device is not present in BlueZ or disconnects while
+                waiting
+        """
+        await self._wait_for_services_discovery(device_path)
+
     async def _wait_for_services_discovery(self, device_path: str) -> None:
         """
         Waits for the device services to be discovered.
@@ -1057,6 +1871,8 @@ class BlueZManager:
                     self._run_advertisement_callbacks(
                         obj_path, cast(Device1, unpacked_props)
                     )
+
+                self._on_gatt_object_added(interface, obj_path)
         elif message.member == "InterfacesRemoved":
             obj_path, interfaces = message.body
 
@@ -1073,6 +1889,8 @@ class BlueZManager:
                         pass
                 elif interface == defs.DEVICE_INTERFACE:
                     self._services_cache.pop(obj_path, None)
+                    self._services_cache_filters.pop(obj_path, None)
+                    self._services_live.discard(obj_path)
                     try:
                         del self._service_map[obj_path]
                     except KeyError:
@@ -1094,10 +1912,26 @@ class BlueZManager:
                     except KeyError:
                         pass
                 elif interface == defs.GATT_CHARACTERISTIC_INTERFACE:
+                    service_path = obj_path[: obj_path.rfind("/")]
+
+                    try:
+                        self._characteristic_map[service_path].remove(obj_path)
+                    except KeyError:
+                        pass
+
                     try:
                         del self._descriptor_map[obj_path]
                     except KeyError:
                         pass
+                elif interface == defs.GATT_DESCRIPTOR_INTERFACE:
+                    char_path = obj_path[: obj_path.rfind("/")]
+
+                    try:
+                        self._descriptor_map[char_path].remove(obj_path)
+                    except KeyError:
+                        pass
+
+                self._on_gatt_object_removed(interface, obj_path)
 
             # Remove empty properties when all interfaces have been removed.
             # This avoids wasting memory for people who have noisy devices
@@ -1153,6 +1987,10 @@ class BlueZManager:
                     # handle device connection change watchers
                     if "Connected" in changed:
                         new_connected = self_interface["Connected"]
+
+                        if not new_connected:
+                            self._services_live.discard(device_path)
+
                         watchers = self._device_watchers.get(device_path)
                         if watchers:
                             # callbacks may remove the watcher, hence the copy
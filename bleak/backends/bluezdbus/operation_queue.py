@@ -0,0 +1,107 @@
+"""
+Operation queue
+---------------
+
+This module contains a queue that serializes GATT operations of a connection.
+
+BlueZ only allows one read and one write at a time on each characteristic or
+descriptor and replies with an ``org.bluez.Error.InProgress`` error otherwise.
+Since there is no signal when the attribute is ready again, operations are
+queued instead and each operation starts as soon as the previous one is done.
+"""
+
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    if sys.platform != "linux":
+        assert False, "This backend is only available on Linux"
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+from collections.abc import AsyncIterator, Hashable
+
+
+class _Waiters:
+    """
+    Operations waiting for the same key.
+    """
+
+    __slots__ = ("busy", "heap")
+
+    def __init__(self) -> None:
+        self.busy = False
+        # heap of (-priority, sequence number, future) so that higher priority
+        # operations are first and operations with the same priority are FIFO
+        self.heap: list[tuple[int, int, asyncio.Future[None]]] = []
+
+
+class GattOperationQueue:
+    """
+    Runs operations with the same key one at a time, in order of priority and
+    then in the order they were queued.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(self) -> None:
+        self._waiters: dict[Hashable, _Waiters] = {}
+        self._sequence = itertools.count()
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, key: Hashable, priority: int = 0) -> AsyncIterator[None]:
+        """
+        Waits until all previously queued operations with the same key are
+        done and runs an operation.
+
+        Args:
+            key:
+                Operations with the same key are run one at a time, e.g. the
+                D-Bus object path of an attribute and the kind of operation.
+            priority:
+                Operations with a higher priority are run before queued
+                operations with a lower priority.
+
+        Example::
+
+            async with queue.acquire((char_path, "read")):
+                reply = await bus.call(...)
+        """
+        waiters = self._waiters.get(key)
+
+        if waiters is None:
+            waiters = self._waiters[key] = _Waiters()
+
+        if waiters.busy:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(waiters.heap, (-priority, next(self._sequence), future))
+
+            try:
+                await future
+            except asyncio.CancelledError:
+                # if we were already next, let the operation after us run
+                if future.done() and not future.cancelled():
+                    self._release(key, waiters)
+                raise
+        else:
+            waiters.busy = True
+
+        try:
+            yield
+        finally:
+            self._release(key, waiters)
+
+    def _release(self, key: Hashable, waiters: _Waiters) -> None:
+        while waiters.heap:
+            _, _, future = heapq.heappop(waiters.heap)
+
+            # skip operations that were cancelled while waiting
+            if not future.done():
+                # hand over directly, so busy stays true
+                future.set_result(None)
+                return
+
+        waiters.busy = False
+        del self._waiters[key]
@@ -0,0 +1,247 @@
+"""
+Or-patterns
+-----------
+
+This module contains helpers for the "or patterns" that are used to filter
+advertisements with the BlueZ `advertisement monitor api
+<https://github.com/bluez/bluez/blob/master/doc/org.bluez.AdvertisementMonitor.rst>`.
+
+Besides preparing patterns for advertisement monitors, it has a matcher that
+applies the same patterns in software, which is used when advertisement
+monitors are not available.
+"""
+
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    if sys.platform != "linux":
+        assert False, "This backend is only available on Linux"
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from bleak.args.bluez import OrPattern, OrPatternLike
+from bleak.assigned_numbers import AdvertisementDataType
+from bleak.backends.bluezdbus.defs import Device1
+
+MAX_AD_LENGTH = 31
+"""
+Maximum length of legacy advertising data. Patterns must fit within this.
+"""
+
+MAX_PATTERNS_PER_MONITOR = 16
+"""
+Maximum number of patterns per monitor supported by the Linux kernel
+(``HCI_MAX_ADV_MONITOR_NUM_PATTERNS``).
+"""
+
+_BASE_UUID_SUFFIX = "-0000-1000-8000-00805f9b34fb"
+
+
+def _is_more_general(a: OrPattern, b: OrPattern) -> bool:
+    """
+    Checks if pattern ``a`` matches everything that pattern ``b`` matches.
+    """
+    offset = a.start_position - b.start_position
+
+    return (
+        a.ad_data_type == b.ad_data_type
+        and offset >= 0
+        and b.content_of_pattern[offset : offset + len(a.content_of_pattern)]
+        == a.content_of_pattern
+    )
+
+
+def compile_or_patterns(patterns: Iterable[OrPatternLike]) -> list[list[OrPattern]]:
+    """
+    Prepares or-patterns for advertisement monitors.
+
+    Duplicate patterns and patterns that can't match anything that another
+    pattern doesn't already match are removed. The remaining patterns are
+    split into groups that are small enough for a single monitor.
+
+    Args:
+        patterns: The or-patterns.
+
+    Returns:
+        One list of patterns per monitor.
+
+    Raises:
+        ValueError: if a pattern does not fit in advertising data.
+    """
+    compiled: list[OrPattern] = []
+
+    for p in patterns:
+        pattern = OrPattern(p[0], p[1], bytes(p[2]))
+
+        if not pattern.content_of_pattern:
+            raise ValueError(f"pattern {pattern} has empty content")
+
+        if (
+            pattern.start_position < 0
+            or pattern.start_position + len(pattern.content_of_pattern) > MAX_AD_LENGTH
+        ):
+            raise ValueError(
+                f"pattern {pattern} does not fit in {MAX_AD_LENGTH} bytes of advertising data"
+            )
+
+        if any(_is_more_general(c, pattern) for c in compiled):
+            continue
+
+        compiled = [c for c in compiled if not _is_more_general(pattern, c)]
+        compiled.append(pattern)
+
+    return [
+        compiled[i : i + MAX_PATTERNS_PER_MONITOR]
+        for i in range(0, len(compiled), MAX_PATTERNS_PER_MONITOR)
+    ]
+
+
+def parse_advertising_data(data: bytes) -> list[tuple[int, bytes]]:
+    """
+    Splits raw advertising data into AD structures.
+
+    Args:
+        data: Raw advertising or scan response data.
+
+    Returns:
+        List of AD type and data of each structure. Parsing stops at the
+        first malformed structure.
+    """
+    structures: list[tuple[int, bytes]] = []
+    i = 0
+
+    while i < len(data):
+        length = data[i]
+
+        # zero length marks the end of significant data
+        if length == 0 or i + 1 + length > len(data):
+            break
+
+        structures.append((data[i + 1], bytes(data[i + 2 : i + 1 + length])))
+        i += 1 + length
+
+    return structures
+
+
+def _uuid_bytes(uuid: str) -> bytes:
+    """
+    Gets the shortest little-endian representation of a UUID.
+    """
+    if uuid.endswith(_BASE_UUID_SUFFIX) and uuid.startswith("0000"):
+        return bytes.fromhex(uuid[4:8])[::-1]
+
+    if uuid.endswith(_BASE_UUID_SUFFIX):
+        return bytes.fromhex(uuid[:8])[::-1]
+
+    return UUID(uuid).bytes[::-1]
+
+
+def get_ad_structures(props: Device1) -> list[tuple[int, bytes]]:
+    """
+    Reconstructs the AD structures of a device from its D-Bus properties.
+
+    BlueZ does not keep the raw advertising data, so this is a best effort.
+    For example, BlueZ accumulates service UUIDs from all advertisements
+    and does not say if the name was complete or shortened.
+
+    Args:
+        props: The D-Bus properties of the device.
+
+    Returns:
+        List of AD type and data of each structure.
+    """
+    structures: list[tuple[int, bytes]] = []
+
+    if "AdvertisingFlags" in props:
+        structures.append(
+            (AdvertisementDataType.FLAGS, bytes(props["AdvertisingFlags"]))
+        )
+
+    uuid_lists: dict[int, bytes] = {2: b"", 4: b"", 16: b""}
+
+    for uuid in props.get("UUIDs", []):
+        data = _uuid_bytes(uuid)
+        uuid_lists[len(data)] += data
+
+    for size, data in uuid_lists.items():
+        if not data:
+            continue
+
+        incomplete = {
+            2: AdvertisementDataType.INCOMPLETE_LIST_SERVICE_UUID16,
+            4: AdvertisementDataType.INCOMPLETE_LIST_SERVICE_UUID32,
+            16: AdvertisementDataType.INCOMPLETE_LIST_SERVICE_UUID128,
+        }[size]
+        structures.append((incomplete, data))
+        structures.append((incomplete + 1, data))
+
+    if "Name" in props:
+        name = props["Name"].encode()
+        structures.append((AdvertisementDataType.SHORTENED_LOCAL_NAME, name))
+        structures.append((AdvertisementDataType.COMPLETE_LOCAL_NAME, name))
+
+    if "TxPower" in props:
+        structures.append(
+            (
+                AdvertisementDataType.TX_POWER_LEVEL,
+                props["TxPower"].to_bytes(1, "little", signed=True),
+            )
+        )
+
+    for uuid, value in props.get("ServiceData", {}).items():
+        data = _uuid_bytes(uuid)
+        ad_type = {
+            2: AdvertisementDataType.SERVICE_DATA_UUID16,
+            4: AdvertisementDataType.SERVICE_DATA_UUID32,
+            16: AdvertisementDataType.SERVICE_DATA_UUID128,
+        }[len(data)]
+        structures.append((ad_type, data + bytes(value)))
+
+    for company_id, value in props.get("ManufacturerData", {}).items():
+        structures.append(
+            (
+                AdvertisementDataType.MANUFACTURER_SPECIFIC_DATA,
+                company_id.to_bytes(2, "little") + bytes(value),
+            )
+        )
+
+    # BlueZ puts all other types here
+    for ad_type, value in props.get("AdvertisingData", {}).items():
+        structures.append((ad_type, bytes(value)))
+
+    return structures
+
+
+def match_or_patterns(
+    patterns: Iterable[OrPatternLike], structures: Iterable[tuple[int, bytes]]
+) -> bool:
+    """
+    Checks if any of the or-patterns matches the advertising data.
+
+    A pattern matches if an AD structure of the same type contains the
+    content of the pattern at the start position of the pattern.
+
+    Args:
+        patterns: The or-patterns.
+        structures:
+            AD type and data of each AD structure, e.g. from
+            :func:`parse_advertising_data` or :func:`get_ad_structures`.
+
+    Returns:
+        ``True`` if any pattern matches.
+    """
+    structures = list(structures)
+
+    for start_position, ad_data_type, content_of_pattern in patterns:
+        end = start_position + len(content_of_pattern)
+
+        for ad_type, data in structures:
+            if (
+                ad_type == ad_data_type
+                and data[start_position:end] == content_of_pattern
+            ):
+                return True
+
+    return False
@@ -6,6 +6,7 @@ if TYPE_CHECKING:
         assert False, "This backend is only available on Linux"
 
 import logging
+import time
 from collections.abc import Callable, Coroutine
 from typing import Any, Literal, Optional
 from warnings import warn
@@ -15,14 +16,23 @@ from dbus_fast import Variant
 from bleak._compat import override
 from bleak.args.bluez import BlueZDiscoveryFilters as _BlueZDiscoveryFilters
 from bleak.args.bluez import BlueZScannerArgs as _BlueZScannerArgs
+from bleak.backends.bluezdbus.advertisement_monitor import get_rssi_parameters
 from bleak.backends.bluezdbus.defs import Device1
 from bleak.backends.bluezdbus.manager import get_global_bluez_manager
+from bleak.backends.bluezdbus.or_patterns import (
+    compile_or_patterns,
+    get_ad_structures,
+    match_or_patterns,
+)
+from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import (
     AdvertisementData,
     AdvertisementDataCallback,
     BaseBleakScanner,
 )
 from bleak.exc import BleakError
+from bleak.registry import DeviceRecord
+from bleak.uuids import normalize_uuid_str
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +54,29 @@ def __getattr__(name: str):
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+# Process-wide registry of scanners that are currently scanning. Clients use
+# this to find devices without starting a new discovery session.
+_active_scanners: set["BleakScannerBlueZDBus"] = set()
+
+
+def get_active_scanner(adapter_path: str) -> Optional["BleakScannerBlueZDBus"]:
+    """
+    Gets a scanner that is currently running on an adapter and is not
+    filtering advertisements, if any.
+
+    Args:
+        adapter_path: The D-Bus object path of the adapter.
+
+    Returns:
+        A scanner that sees all devices on ``adapter_path`` or ``None``.
+    """
+    for scanner in _active_scanners:
+        if scanner._adapter_path == adapter_path and scanner._sees_all_devices():
+            return scanner
+
+    return None
+
+
 class BleakScannerBlueZDBus(BaseBleakScanner):
     """The native Linux Bleak BLE Scanner.
 
@@ -78,6 +111,10 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
 
         self._scanning_mode = scanning_mode
         self._adapter = bluez.get("adapter")
+        self._registry = bluez.get("registry")
+        self._discovery_paused_callback = bluez.get("discovery_paused_callback")
+        # D-Bus object path of the adapter while scanning
+        self._adapter_path: Optional[str] = None
 
         # callback from manager for stopping scanning if it has been started
         self._stop: Optional[Callable[[], Coroutine[Any, Any, None]]] = None
@@ -99,6 +136,24 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
 
         self._or_patterns = bluez.get("or_patterns")
 
+        if self._or_patterns:
+            # raises ValueError for invalid patterns
+            compile_or_patterns(self._or_patterns)
+
+        # True if or-patterns are matched by us instead of BlueZ
+        self._match_or_patterns = False
+
+        monitor_rssi = bluez.get("monitor_rssi")
+        self._monitor_rssi = (
+            get_rssi_parameters(monitor_rssi)
+            if monitor_rssi is not None and self._scanning_mode == "passive"
+            else None
+        )
+        # True if self._monitor_rssi is applied by us instead of BlueZ
+        self._filter_rssi = False
+        # paths of devices that are in range according to self._monitor_rssi
+        self._in_range: set[str] = set()
+
         if self._scanning_mode == "passive" and service_uuids:
             logger.warning(
                 "service uuid filtering is not implemented for passive scanning, use bluez or_patterns as a workaround"
@@ -117,32 +172,100 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
             adapter_path = manager.get_default_adapter()
 
         self.seen_devices = {}
+        self._in_range.clear()
 
-        if self._scanning_mode == "passive":
+        if self._scanning_mode == "passive" and (
+            manager.supports_advertisement_monitor(adapter_path)
+        ):
             assert self._or_patterns is not None  # should be checked in __init__
 
+            self._match_or_patterns = False
+            self._filter_rssi = False
             self._stop = await manager.passive_scan(
                 adapter_path,
                 self._or_patterns,
                 self._handle_advertising_data,
                 self._handle_device_removed,
+                self._monitor_rssi,
+                self._handle_rssi_rejected,
             )
         else:
+            if self._scanning_mode == "passive":
+                logger.warning(
+                    "passive scanning on Linux requires BlueZ >= 5.56 with --experimental enabled and Linux kernel >= 5.10, using active scanning instead"
+                )
+
+            self._match_or_patterns = bool(self._or_patterns)
+            self._filter_rssi = self._monitor_rssi is not None
             self._stop = await manager.active_scan(
                 adapter_path,
                 self._filters,
                 self._handle_advertising_data,
                 self._handle_device_removed,
+                self._discovery_paused_callback,
             )
 
+        self._adapter_path = adapter_path
+        _active_scanners.add(self)
+
     @override
     async def stop(self) -> None:
         if self._stop:
             # avoid reentrancy
             stop, self._stop = self._stop, None
 
+            _active_scanners.discard(self)
+            self._adapter_path = None
+
             await stop()
 
+    @override
+    def get_cached_device(self, address: str) -> Optional[BLEDevice]:
+        if self._registry is None:
+            return None
+
+        record = self._registry.get(address)
+
+        if record is None or record.device_path is None or record.adapter is None:
+            return None
+
+        if self._adapter and record.adapter != f"/org/bluez/{self._adapter}":
+            return None
+
+        # minimal set of properties used by BleakClientBlueZDBus
+        props: dict[str, Any] = {
+            "Address": record.address,
+            "Alias": record.name or record.address.replace(":", "-"),
+            "Adapter": record.adapter,
+        }
+
+        if record.name:
+            props["Name"] = record.name
+
+        if record.address_type:
+            props["AddressType"] = record.address_type
+
+        return BLEDevice(
+            record.address, record.name, {"path": record.device_path, "props": props}
+        )
+
+    def _sees_all_devices(self) -> bool:
+        """
+        Checks if this scanner receives advertisements from all devices, i.e.
+        it is doing active scanning without any filters.
+        """
+        discoverable = self._filters.get("Discoverable")
+
+        return (
+            self._scanning_mode == "active"
+            and not self._or_patterns
+            # Discoverable=True hides non-discoverable devices
+            and (discoverable is None or not discoverable.value)
+            and set(self._filters).issubset(
+                {"Transport", "DuplicateData", "Discoverable"}
+            )
+        )
+
     def set_scanning_filter(self, **kwargs: Any) -> None:
         """Sets OS level scanning filters for the BleakScanner.
 
@@ -158,7 +281,9 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
         """
         for k, v in kwargs.get("filters", {}).items():
             if k == "UUIDs":
-                self._filters[k] = Variant("as", v)
+                # BlueZ also accepts 16-bit and 32-bit UUIDs but advertised
+                # UUIDs are always in the 128-bit form
+                self._filters[k] = Variant("as", [normalize_uuid_str(u) for u in v])
             elif k == "RSSI":
                 self._filters[k] = Variant("n", v)
             elif k == "Pathloss":
@@ -184,11 +309,24 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
             path: The D-Bus object path of the device.
             props: The D-Bus object properties of the device.
         """
+        timestamp = time.monotonic_ns() if self.receive_timestamps else None
         _service_uuids = props.get("UUIDs", [])
 
         if not self.is_allowed_uuid(_service_uuids):
             return
 
+        if not self._matches_filters(props):
+            return
+
+        if self._match_or_patterns:
+            assert self._or_patterns is not None
+
+            if not match_or_patterns(self._or_patterns, get_ad_structures(props)):
+                return
+
+        if self._filter_rssi and not self._is_in_range(path, props):
+            return
+
         # Get all the information wanted to pack in the advertisement data
         _local_name = props.get("Name")
         _manufacturer_data = {
@@ -208,6 +346,7 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
             tx_power=tx_power,
             rssi=props.get("RSSI", -127),
             platform_data=(path, props),
+            timestamp=timestamp,
         )
 
         device = self.create_or_update_device(
@@ -224,12 +363,92 @@ class BleakScannerBlueZDBus(BaseBleakScanner):
             advertisement_data,
         )
 
+        if self._registry is not None:
+            previous = self._registry.get(device.address)
+
+            self._registry.update(
+                DeviceRecord(
+                    device.address,
+                    device.name,
+                    time.time(),
+                    advertisement_data._replace(platform_data=(), timestamp=None),
+                    props.get("AddressType"),
+                    props.get("Adapter"),
+                    path,
+                    previous.gatt_database_hash if previous else None,
+                )
+            )
+
         self.call_detection_callbacks(device, advertisement_data)
 
+    def _matches_filters(self, props: Device1) -> bool:
+        """
+        Checks if a device matches the discovery filters of this scanner.
+
+        The discovery session is shared with other scanners on the same
+        adapter, so BlueZ may report devices that only match the filters of
+        the other scanners.
+        """
+        if (uuids := self._filters.get("UUIDs")) and uuids.value:
+            # BlueZ also matches service data UUIDs
+            advertised = {*props.get("UUIDs", []), *props.get("ServiceData", {})}
+
+            if advertised.isdisjoint(uuids.value):
+                return False
+
+        rssi = props.get("RSSI")
+
+        if (threshold := self._filters.get("RSSI")) and rssi is not None:
+            if rssi < threshold.value:
+                return False
+
+        if (threshold := self._filters.get("Pathloss")) and rssi is not None:
+            tx_power = props.get("TxPower")
+
+            if tx_power is not None and tx_power - rssi > threshold.value:
+                return False
+
+        if pattern := self._filters.get("Pattern"):
+            if not (
+                props["Address"].startswith(pattern.value)
+                or props.get("Name", "").startswith(pattern.value)
+            ):
+                return False
+
+        return True
+
+    def _handle_rssi_rejected(self) -> None:
+        """
+        Handles BlueZ rejecting the RSSI properties of the advertisement
+        monitors.
+        """
+        self._filter_rssi = True
+
+    def _is_in_range(self, path: str, props: Device1) -> bool:
+        """
+        Applies the RSSI thresholds of the advertisement monitor in software.
+
+        This is needed when BlueZ or the controller does not support them. The
+        timeouts and sampling period are not emulated.
+        """
+        assert self._monitor_rssi is not None
+
+        rssi = props.get("RSSI")
+
+        if rssi is not None:
+            if rssi >= self._monitor_rssi.high_threshold:
+                self._in_range.add(path)
+            elif rssi <= self._monitor_rssi.low_threshold:
+                self._in_range.discard(path)
+
+        return path in self._in_range
+
     def _handle_device_removed(self, device_path: str) -> None:
         """
         Handles a device being removed from BlueZ.
         """
+        self._in_range.discard(device_path)
+
         try:
             del self.seen_devices[device_path]
         except KeyError:
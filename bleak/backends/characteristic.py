@@ -5,13 +5,21 @@ Interface class for the Bleak representation of a GATT Characteristic
 from __future__ import annotations
 
 import enum
+import sys
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Union, cast
 from uuid import UUID
 
-from bleak.assigned_numbers import CharacteristicPropertyName
+from bleak.assigned_numbers import CHARACTERISTIC_PROPERTIES, CharacteristicPropertyName
+from bleak.backends._uuid_index import (
+    EMPTY_INDEX,
+    UUIDIndex,
+    add_to_index,
+    lookup,
+    remove_from_index,
+)
 from bleak.backends.descriptor import BleakGATTDescriptor
-from bleak.uuids import normalize_uuid_str, uuidstr_to_str
+from bleak.uuids import uuidstr_to_str
 
 # to prevent circular import
 if TYPE_CHECKING:
@@ -31,9 +39,35 @@ class GattCharacteristicsFlags(enum.Enum):
     writable_auxiliaries = 0x0200
 
 
+# Map of property name to bit in BleakGATTCharacteristic.property_flags. The
+# standard properties use the same bits as GattCharacteristicsFlags. BlueZ
+# security flags use bits 16 and up. Other properties don't have a bit.
+_PROPERTY_FLAGS: dict[str, int] = {
+    **{name: flag for flag, name in CHARACTERISTIC_PROPERTIES.items()},
+    "encrypt-read": 1 << 16,
+    "encrypt-write": 1 << 17,
+    "encrypt-authenticated-read": 1 << 18,
+    "encrypt-authenticated-write": 1 << 19,
+    "authorize": 1 << 20,
+}
+
+
 class BleakGATTCharacteristic:
     """The Bleak representation of a GATT Characteristic"""
 
+    __slots__ = (
+        "obj",
+        "_handle",
+        "_uuid",
+        "_properties",
+        "_property_flags",
+        "_max_write_without_response_size",
+        "_service",
+        "_descriptors",
+        "_descriptor_handles",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         obj: Any,
@@ -55,11 +89,19 @@ class BleakGATTCharacteristic:
         """
         self.obj = obj
         self._handle = handle
-        self._uuid = uuid
-        self._properties = properties
+        self._uuid = sys.intern(uuid)
+        # the names are the same for all characteristics, so they are interned
+        # to share them
+        self._properties = tuple(sys.intern(name) for name in properties)
+        flags = 0
+        for name in properties:
+            flags |= _PROPERTY_FLAGS.get(name, 0)
+        self._property_flags = flags
         self._max_write_without_response_size = max_write_without_response_size
         self._service = service
         self._descriptors: dict[int, BleakGATTDescriptor] = {}
+        # map of descriptor UUID to handles of descriptors with that UUID
+        self._descriptor_handles: UUIDIndex = EMPTY_INDEX
 
     def __str__(self):
         return f"{self.uuid} (Handle: {self.handle}): {self.description}"
@@ -91,8 +133,32 @@ class BleakGATTCharacteristic:
 
     @property
     def properties(self) -> list[CharacteristicPropertyName]:
-        """Properties of this characteristic"""
-        return self._properties
+        """
+        Properties of this characteristic.
+
+        This is a new list on each access. Use :attr:`property_flags` to check
+        for a property in performance-critical code.
+        """
+        return cast(list[CharacteristicPropertyName], list(self._properties))
+
+    @property
+    def property_flags(self) -> int:
+        """
+        Properties of this characteristic as a bitmask.
+
+        The standard properties use the bits from the Bluetooth specification,
+        see :class:`GattCharacteristicsFlags`. The BlueZ security properties,
+        like ``"encrypt-read"``, use bits 16 and up. Other properties are only
+        included in :attr:`properties`.
+
+        Example::
+
+            if char.property_flags & GattCharacteristicsFlags.write.value:
+                ...
+
+        .. versionadded:: 3.1
+        """
+        return self._property_flags
 
     @property
     def max_write_without_response_size(self) -> int:
@@ -137,12 +203,8 @@ class BleakGATTCharacteristic:
         if isinstance(specifier, int):
             return self._descriptors.get(specifier)
 
-        uuid = normalize_uuid_str(str(specifier))
-        for descriptor in self._descriptors.values():
-            if descriptor.uuid == uuid:
-                return descriptor
-
-        return None
+        handles = lookup(self._descriptor_handles, specifier)
+        return self._descriptors[handles[0]] if handles else None
 
     def add_descriptor(self, descriptor: BleakGATTDescriptor) -> None:
         """Add a :py:class:`~BleakGATTDescriptor` to the characteristic.
@@ -155,3 +217,20 @@ class BleakGATTCharacteristic:
             )
 
         self._descriptors[descriptor.handle] = descriptor
+        self._descriptor_handles = add_to_index(
+            self._descriptor_handles, descriptor.uuid, descriptor.handle
+        )
+
+    def remove_descriptor(self, handle: int) -> None:
+        """Remove a :py:class:`~BleakGATTDescriptor` from the characteristic.
+
+        Should not be used by end user, but rather by `bleak` itself.
+
+        .. versionadded:: 3.1
+        """
+        descriptor = self._descriptors.pop(handle, None)
+
+        if descriptor is not None:
+            self._descriptor_handles = remove_from_index(
+                self._descriptor_handles, descriptor.uuid, handle
+            )
@@ -3,6 +3,8 @@
 Base class for backend clients.
 """
 import abc
+import asyncio
+import time
 from collections.abc import Callable
 from typing import Any, Optional, Union
 
@@ -15,6 +17,38 @@ from bleak.backends.service import BleakGATTServiceCollection
 from bleak.exc import BleakError
 
 NotifyCallback = Callable[[bytearray], None]
+TimestampedNotifyCallback = Callable[[bytearray, int], None]
+BatchNotifyCallback = Callable[[list[tuple[int, bytearray]]], None]
+
+
+def create_batch_notify_callback(
+    callback: BatchNotifyCallback,
+) -> TimestampedNotifyCallback:
+    """
+    Creates a notification callback that collects notifications and calls
+    ``callback`` once per event loop iteration.
+
+    This is for backends that receive notifications one by one.
+
+    .. versionadded:: 3.1
+    """
+    loop = asyncio.get_running_loop()
+    batch: list[tuple[int, bytearray]] = []
+
+    def flush() -> None:
+        nonlocal batch
+        notifications, batch = batch, []
+        callback(notifications)
+
+    def on_notification(data: bytearray, timestamp: int) -> None:
+        if not batch:
+            # Backends receive notifications that arrive at the same time in
+            # the same event loop iteration, e.g. a burst of D-Bus signals.
+            loop.call_soon(flush)
+
+        batch.append((timestamp, data))
+
+    return on_notification
 
 
 class BaseBleakClient(abc.ABC):
@@ -169,6 +203,63 @@ class BaseBleakClient(abc.ABC):
         """
         raise NotImplementedError()
 
+    async def read_gatt_chars(
+        self, characteristics: list[BleakGATTCharacteristic], **kwargs: Any
+    ) -> list[Union[bytearray, BleakError]]:
+        """
+        Perform read operations on several GATT characteristics.
+
+        The default implementation reads one characteristic at a time. Backends
+        that allow more than one operation in progress should override this.
+
+        Args:
+            characteristics: The characteristics to read from.
+
+        Returns:
+            The read data or the error for each characteristic, in the same order.
+
+        .. versionadded:: 3.1
+        """
+        results: list[Union[bytearray, BleakError]] = []
+
+        for characteristic in characteristics:
+            try:
+                results.append(await self.read_gatt_char(characteristic, **kwargs))
+            except BleakError as e:
+                results.append(e)
+
+        return results
+
+    async def write_gatt_chars(
+        self, writes: list[tuple[BleakGATTCharacteristic, SizedBuffer, bool]]
+    ) -> list[Optional[BleakError]]:
+        """
+        Perform write operations on several GATT characteristics.
+
+        The default implementation writes one characteristic at a time. Backends
+        that allow more than one operation in progress should override this.
+
+        Args:
+            writes:
+                The characteristic, data and if write-with-response should be
+                done for each write.
+
+        Returns:
+            ``None`` or the error for each write, in the same order.
+
+        .. versionadded:: 3.1
+        """
+        results: list[Optional[BleakError]] = []
+
+        for characteristic, data, response in writes:
+            try:
+                await self.write_gatt_char(characteristic, data, response)
+                results.append(None)
+            except BleakError as e:
+                results.append(e)
+
+        return results
+
     @abc.abstractmethod
     async def write_gatt_descriptor(
         self, descriptor: BleakGATTDescriptor, data: SizedBuffer
@@ -200,6 +291,49 @@ class BaseBleakClient(abc.ABC):
         """
         raise NotImplementedError()
 
+    async def start_notify_timestamped(
+        self,
+        characteristic: BleakGATTCharacteristic,
+        callback: TimestampedNotifyCallback,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Same as :meth:`start_notify` but ``callback`` also receives the
+        :func:`time.monotonic_ns` time when the notification was received.
+
+        The default implementation takes the time when the backend calls the
+        callback. Backends should override this if they can take the time
+        earlier.
+
+        .. versionadded:: 3.1
+        """
+        await self.start_notify(
+            characteristic,
+            lambda data: callback(data, time.monotonic_ns()),
+            **kwargs,
+        )
+
+    async def start_notify_batched(
+        self,
+        characteristic: BleakGATTCharacteristic,
+        callback: BatchNotifyCallback,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Same as :meth:`start_notify` but ``callback`` receives a list of tuples
+        of the :func:`time.monotonic_ns` time when a notification was received
+        and its data.
+
+        The default implementation collects the notifications received in one
+        iteration of the event loop. Backends should override this if they
+        receive several notifications at once.
+
+        .. versionadded:: 3.1
+        """
+        await self.start_notify_timestamped(
+            characteristic, create_batch_notify_callback(callback), **kwargs
+        )
+
     @abc.abstractmethod
     async def stop_notify(self, characteristic: BleakGATTCharacteristic) -> None:
         """Deactivate notification/indication on a specified characteristic.
@@ -6,6 +6,7 @@ if TYPE_CHECKING:
         assert False, "This backend is only available on macOS"
 
 import logging
+import time
 from typing import Any, Literal, Optional, cast
 from warnings import warn
 
@@ -111,6 +112,7 @@ class BleakScannerCoreBluetooth(BaseBleakScanner):
         def callback(
             peripheral: CBPeripheral, adv_data: CBAdvertisementData, rssi: NSNumber
         ) -> None:
+            timestamp = time.monotonic_ns() if self.receive_timestamps else None
 
             service_uuids = [
                 cb_uuid_to_str(u) for u in adv_data.get("kCBAdvDataServiceUUIDs", [])
@@ -143,6 +145,7 @@ class BleakScannerCoreBluetooth(BaseBleakScanner):
                 tx_power=to_optional_int(adv_data.get("kCBAdvDataTxPowerLevel")),
                 rssi=int(rssi),
                 platform_data=(peripheral, adv_data, rssi),
+                timestamp=timestamp,
             )
 
             if self._use_bdaddr:
@@ -4,6 +4,7 @@ Interface class for the Bleak representation of a GATT Descriptor
 """
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any
 
 from bleak.uuids import normalize_uuid_16
@@ -110,6 +111,8 @@ _descriptor_descriptions = {
 class BleakGATTDescriptor:
     """The Bleak representation of a GATT Descriptor"""
 
+    __slots__ = ("obj", "_handle", "_uuid", "_characteristic", "__weakref__")
+
     def __init__(
         self, obj: Any, handle: int, uuid: str, characteristic: BleakGATTCharacteristic
     ):
@@ -122,7 +125,7 @@ class BleakGATTDescriptor:
         """
         self.obj = obj
         self._handle = handle
-        self._uuid = uuid
+        self._uuid = sys.intern(uuid)
         self._characteristic = characteristic
 
     def __str__(self):
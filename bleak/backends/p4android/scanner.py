@@ -7,6 +7,7 @@ if TYPE_CHECKING:
 
 import asyncio
 import logging
+import time
 import warnings
 from typing import Literal, Optional
 
@@ -221,6 +222,7 @@ class BleakScannerP4Android(BaseBleakScanner):
             logger.debug("BTLE scan already stopped")
 
     def _handle_scan_result(self, result) -> None:
+        timestamp = time.monotonic_ns() if self.receive_timestamps else None
         native_device = result.getDevice()
         record = result.getScanRecord()
 
@@ -255,6 +257,7 @@ class BleakScannerP4Android(BaseBleakScanner):
             tx_power=tx_power,
             rssi=result.getRssi(),
             platform_data=(result,),
+            timestamp=timestamp,
         )
 
         device = self.create_or_update_device(
@@ -62,6 +62,17 @@ class AdvertisementData(NamedTuple):
     This is not a stable API. The actual values may change between releases.
     """
 
+    timestamp: Optional[int] = None
+    """
+    The :func:`time.monotonic_ns` time when the advertisement was received or
+    ``None`` if receive timestamps are not enabled.
+
+    Note that this is an additional item of the tuple, so advertisements that
+    only differ in the time they were received are not equal.
+
+    .. versionadded:: 3.1
+    """
+
     def __repr__(self) -> str:
         kwargs: list[str] = []
         if self.local_name:
@@ -75,6 +86,8 @@ class AdvertisementData(NamedTuple):
         if self.tx_power is not None:
             kwargs.append(f"tx_power={repr(self.tx_power)}")
         kwargs.append(f"rssi={repr(self.rssi)}")
+        if self.timestamp is not None:
+            kwargs.append(f"timestamp={repr(self.timestamp)}")
         return f"AdvertisementData({', '.join(kwargs)})"
 
 
@@ -110,6 +123,14 @@ class BaseBleakScanner(abc.ABC):
             containing this advertising data will be received.
     """
 
+    receive_timestamps: bool = False
+    """
+    If true, backends set :attr:`AdvertisementData.timestamp` as soon as an
+    advertisement is received.
+
+    .. versionadded:: 3.1
+    """
+
     seen_devices: dict[str, tuple[BLEDevice, AdvertisementData]]
     """
     Map of device identifier to BLEDevice and most recent advertisement data.
@@ -267,6 +288,23 @@ class BaseBleakScanner(abc.ABC):
 
         return device
 
+    def get_cached_device(self, address: str) -> Optional[BLEDevice]:
+        """
+        Gets a device that was seen previously without having to scan for it.
+
+        Backends that support a persistent device registry override this. The
+        default implementation always returns ``None``.
+
+        Args:
+            address: The Bluetooth address of the device (UUID on macOS).
+
+        Returns:
+            A device that can be passed to :class:`bleak.BleakClient` or ``None``.
+
+        .. versionadded:: 3.1
+        """
+        return None
+
     @abc.abstractmethod
     async def start(self) -> None:
         """Start scanning for devices"""
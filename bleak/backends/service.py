@@ -3,14 +3,23 @@
 Gatt Service Collection class and interface class for the Bleak representation of a GATT Service.
 """
 import logging
+import sys
 from collections.abc import Iterator
 from typing import Any, Optional, Union, cast
 from uuid import UUID
 
+from bleak.backends._uuid_index import (
+    EMPTY_INDEX,
+    UUIDIndex,
+    add_to_index,
+    intern_index,
+    lookup,
+    remove_from_index,
+)
 from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.descriptor import BleakGATTDescriptor
 from bleak.exc import BleakError
-from bleak.uuids import normalize_uuid_str, uuidstr_to_str
+from bleak.uuids import uuidstr_to_str
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +27,22 @@ logger = logging.getLogger(__name__)
 class BleakGATTService:
     """The Bleak representation of a GATT Service."""
 
+    __slots__ = (
+        "obj",
+        "_handle",
+        "_uuid",
+        "_characteristics",
+        "_characteristic_handles",
+        "__weakref__",
+    )
+
     def __init__(self, obj: Any, handle: int, uuid: str) -> None:
         self.obj = obj
         self._handle = handle
-        self._uuid = uuid
+        self._uuid = sys.intern(uuid)
         self._characteristics: dict[int, BleakGATTCharacteristic] = {}
+        # map of characteristic UUID to handles of characteristics with that UUID
+        self._characteristic_handles: UUIDIndex = EMPTY_INDEX
 
     def __str__(self) -> str:
         return f"{self.uuid} (Handle: {self.handle}): {self.description}"
@@ -59,6 +79,23 @@ class BleakGATTService:
             )
 
         self._characteristics[characteristic.handle] = characteristic
+        self._characteristic_handles = add_to_index(
+            self._characteristic_handles, characteristic.uuid, characteristic.handle
+        )
+
+    def remove_characteristic(self, handle: int) -> None:
+        """Remove a :py:class:`~BleakGATTCharacteristic` from the service.
+
+        Should not be used by end user, but rather by `bleak` itself.
+
+        .. versionadded:: 3.1
+        """
+        characteristic = self._characteristics.pop(handle, None)
+
+        if characteristic is not None:
+            self._characteristic_handles = remove_from_index(
+                self._characteristic_handles, characteristic.uuid, handle
+            )
 
     def get_characteristic(
         self, uuid: Union[str, UUID]
@@ -72,14 +109,8 @@ class BleakGATTService:
             The first characteristic matching ``uuid`` or ``None`` if no
             matching characteristic was found.
         """
-        uuid = normalize_uuid_str(str(uuid))
-
-        try:
-            return next(
-                filter(lambda x: x.uuid == uuid, self._characteristics.values())
-            )
-        except StopIteration:
-            return None
+        handles = lookup(self._characteristic_handles, uuid)
+        return self._characteristics[handles[0]] if handles else None
 
 
 class BleakGATTServiceCollection:
@@ -89,6 +120,9 @@ class BleakGATTServiceCollection:
         self.__services: dict[int, BleakGATTService] = {}
         self.__characteristics: dict[int, BleakGATTCharacteristic] = {}
         self.__descriptors: dict[int, BleakGATTDescriptor] = {}
+        # maps of UUID to handles of services/characteristics with that UUID
+        self.__service_handles: UUIDIndex = EMPTY_INDEX
+        self.__characteristic_handles: UUIDIndex = EMPTY_INDEX
 
     def __getitem__(
         self, item: Union[str, int, UUID]
@@ -128,6 +162,9 @@ class BleakGATTServiceCollection:
         """
         if service.handle not in self.__services:
             self.__services[service.handle] = service
+            self.__service_handles = add_to_index(
+                self.__service_handles, service.uuid, service.handle
+            )
         else:
             logger.error(
                 "The service '%s' is already present in this BleakGATTServiceCollection!",
@@ -141,21 +178,14 @@ class BleakGATTServiceCollection:
         if isinstance(specifier, int):
             return self.services.get(specifier)
 
-        uuid = normalize_uuid_str(str(specifier))
-
-        x = list(
-            filter(
-                lambda x: x.uuid == uuid,
-                self.services.values(),
-            )
-        )
+        handles = lookup(self.__service_handles, specifier)
 
-        if len(x) > 1:
+        if len(handles) > 1:
             raise BleakError(
                 "Multiple Services with this UUID, refer to your desired service by the `handle` attribute instead."
             )
 
-        return x[0] if x else None
+        return self.__services[handles[0]] if handles else None
 
     def add_characteristic(self, characteristic: BleakGATTCharacteristic) -> None:
         """Add a :py:class:`~BleakGATTCharacteristic` to the service collection.
@@ -164,6 +194,11 @@ class BleakGATTServiceCollection:
         """
         if characteristic.handle not in self.__characteristics:
             self.__characteristics[characteristic.handle] = characteristic
+            self.__characteristic_handles = add_to_index(
+                self.__characteristic_handles,
+                characteristic.uuid,
+                characteristic.handle,
+            )
             self.__services[characteristic.service_handle].add_characteristic(
                 characteristic
             )
@@ -180,22 +215,14 @@ class BleakGATTServiceCollection:
         if isinstance(specifier, int):
             return self.characteristics.get(specifier)
 
-        uuid = normalize_uuid_str(str(specifier))
+        handles = lookup(self.__characteristic_handles, specifier)
 
-        # Assume uuid usage.
-        x = list(
-            filter(
-                lambda x: x.uuid == uuid,
-                self.characteristics.values(),
-            )
-        )
-
-        if len(x) > 1:
+        if len(handles) > 1:
             raise BleakError(
                 "Multiple Characteristics with this UUID, refer to your desired characteristic by the `handle` attribute instead."
             )
 
-        return x[0] if x else None
+        return self.__characteristics[handles[0]] if handles else None
 
     def add_descriptor(self, descriptor: BleakGATTDescriptor) -> None:
         """Add a :py:class:`~BleakGATTDescriptor` to the service collection.
@@ -216,3 +243,89 @@ class BleakGATTServiceCollection:
     def get_descriptor(self, handle: int) -> Optional[BleakGATTDescriptor]:
         """Get a descriptor by integer handle"""
         return self.descriptors.get(handle)
+
+    def remove_service(self, handle: int) -> None:
+        """Remove a :py:class:`~BleakGATTService` and all of its characteristics
+        and descriptors from the service collection.
+
+        Should not be used by end user, but rather by `bleak` itself.
+
+        .. versionadded:: 3.1
+        """
+        service = self.__services.pop(handle, None)
+
+        if service is None:
+            return
+
+        self.__service_handles = remove_from_index(
+            self.__service_handles, service.uuid, handle
+        )
+
+        for characteristic in service.characteristics:
+            self.remove_characteristic(characteristic.handle)
+
+    def remove_characteristic(self, handle: int) -> None:
+        """Remove a :py:class:`~BleakGATTCharacteristic` and all of its
+        descriptors from the service collection.
+
+        Should not be used by end user, but rather by `bleak` itself.
+
+        .. versionadded:: 3.1
+        """
+        characteristic = self.__characteristics.pop(handle, None)
+
+        if characteristic is None:
+            return
+
+        self.__characteristic_handles = remove_from_index(
+            self.__characteristic_handles, characteristic.uuid, handle
+        )
+        service = self.__services.get(characteristic.service_handle)
+
+        if service is not None:
+            service.remove_characteristic(handle)
+
+        for descriptor in characteristic.descriptors:
+            self.remove_descriptor(descriptor.handle)
+
+    def remove_descriptor(self, handle: int) -> None:
+        """Remove a :py:class:`~BleakGATTDescriptor` from the service collection.
+
+        Should not be used by end user, but rather by `bleak` itself.
+
+        .. versionadded:: 3.1
+        """
+        descriptor = self.__descriptors.pop(handle, None)
+
+        if descriptor is None:
+            return
+
+        characteristic = self.__characteristics.get(descriptor.characteristic_handle)
+
+        if characteristic is not None:
+            characteristic.remove_descriptor(handle)
+
+    def share_indexes(self) -> None:
+        """
+        Shares the internal UUID lookup tables with identical service
+        collections, e.g. of other devices of the same model, to save memory.
+
+        Should be called after all attributes were added. Adding more
+        attributes afterwards is still possible.
+
+        Should not be used by end user, but rather by `bleak` itself.
+
+        .. versionadded:: 3.1
+        """
+        self.__service_handles = intern_index(self.__service_handles)
+        self.__characteristic_handles = intern_index(self.__characteristic_handles)
+
+        for service in self.__services.values():
+            service._characteristic_handles = intern_index(
+                service._characteristic_handles
+            )
+
+        for characteristic in self.__characteristics.values():
+            characteristic._descriptor_handles = intern_index(
+                characteristic._descriptor_handles
+            )
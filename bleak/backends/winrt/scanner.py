@@ -7,6 +7,7 @@ if TYPE_CHECKING:
 
 import asyncio
 import logging
+import time
 from typing import Literal, NamedTuple, Optional
 from uuid import UUID
 
@@ -122,6 +123,8 @@ class BleakScannerWinRT(BaseBleakScanner):
         event_args: BluetoothLEAdvertisementReceivedEventArgs,
     ):
         """Callback for AdvertisementWatcher.Received"""
+        timestamp = time.monotonic_ns() if self.receive_timestamps else None
+
         # TODO: Cannot check for if sender == self.watcher in winrt?
         logger.debug("Received %s.", _format_event_args(event_args))
 
@@ -211,6 +214,7 @@ class BleakScannerWinRT(BaseBleakScanner):
             tx_power=tx_power,
             rssi=event_args.raw_signal_strength_in_dbm,
             platform_data=(sender, raw_data),
+            timestamp=timestamp,
         )
 
         device = self.create_or_update_device(
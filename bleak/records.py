@@ -0,0 +1,253 @@
+"""
+Decoding of fixed-size records.
+
+Many sensors pack one or more fixed-size records, e.g. a few ``int16`` samples
+and a ``uint32`` timestamp, into each notification. A :class:`RecordBuffer`
+collects notifications into a preallocated ring buffer and decodes all
+buffered records at once, so high-rate notifications don't have to be decoded
+one by one in Python.
+
+Records are decoded with :mod:`numpy` if a NumPy dtype is given as layout. NumPy
+is not a dependency of Bleak, so it has to be installed separately in this
+case. Otherwise the layout is a :mod:`struct` format.
+
+.. versionadded:: 3.1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from bleak.backends.characteristic import BleakGATTCharacteristic
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class RecordBuffer:
+    """
+    Ring buffer of fixed-size records received in notifications.
+
+    An instance can be passed as callback to :meth:`bleak.BleakClient.start_notify`.
+    By default, records don't need to be aligned to notifications, a record
+    can be split over more than one notification. If a notification of the
+    wrong length is received, all following records are misaligned until
+    :meth:`clear` is called. Devices that send whole records in each
+    notification should use ``split_records=False`` instead, so that an
+    incomplete record is discarded and the next notification starts with a
+    new record.
+
+    Example::
+
+        buffer = RecordBuffer(numpy.dtype([("xyz", "<i2", 3), ("time", "<u4")]))
+
+        await client.start_notify(char_uuid, buffer)
+
+        while True:
+            records = await buffer.read(100)
+            process(records["xyz"], records["time"])
+
+    Args:
+        layout:
+            The layout of a record. Either a NumPy dtype or a :mod:`struct`
+            format string or :class:`struct.Struct`.
+        capacity:
+            The maximum number of records that are buffered. When the buffer is
+            full, the oldest records are discarded.
+        split_records:
+            If true, an incomplete record at the end of a notification is
+            continued by the next notification. Otherwise, it is discarded.
+
+    Raises:
+        ValueError: if ``capacity`` is less than 1 or ``layout`` has a size of 0.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(
+        self,
+        layout: Union[str, struct.Struct, numpy.dtype[Any]],
+        capacity: int = 4096,
+        split_records: bool = True,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._dtype: Optional[numpy.dtype[Any]] = None
+        self._struct: Optional[struct.Struct] = None
+
+        if isinstance(layout, str):
+            self._struct = struct.Struct(layout)
+            record_size = self._struct.size
+        elif isinstance(layout, struct.Struct):
+            self._struct = layout
+            record_size = layout.size
+        else:
+            import numpy
+
+            self._dtype = numpy.dtype(layout)
+            record_size = self._dtype.itemsize
+
+        if record_size == 0:
+            raise ValueError("record size must not be 0")
+
+        self._record_size = record_size
+        self._split_records = split_records
+        self._buffer = bytearray(capacity * record_size)
+        self._view = memoryview(self._buffer)
+        # start of the oldest record and number of bytes of complete records
+        self._start = 0
+        self._count = 0
+        # bytes of a record that was split over notifications
+        self._partial = b""
+        self._dropped = 0
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._waiter_count = 0
+
+    @property
+    def record_size(self) -> int:
+        """
+        The size of a record in bytes.
+        """
+        return self._record_size
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of records that were discarded because the buffer was full
+        or, with ``split_records=False``, because they were incomplete.
+        """
+        return self._dropped
+
+    def __len__(self) -> int:
+        return self._count // self._record_size
+
+    def __call__(self, sender: BleakGATTCharacteristic, data: bytearray) -> None:
+        self.feed(data)
+
+    def feed(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Adds received data to the buffer.
+
+        Args:
+            data: The value of a notification.
+        """
+        if self._partial:
+            data = self._partial + data
+            self._partial = b""
+
+        size = len(data)
+        remainder = size % self._record_size
+
+        if remainder:
+            size -= remainder
+
+            if self._split_records:
+                self._partial = bytes(data[size:])
+            else:
+                self._dropped += 1
+
+        if size:
+            self._write(memoryview(data)[:size])
+
+        if (
+            self._waiter is not None
+            and not self._waiter.done()
+            and len(self) >= self._waiter_count
+        ):
+            self._waiter.set_result(None)
+
+    def clear(self) -> None:
+        """
+        Discards all buffered records, including an incomplete record that
+        would be continued by the next notification.
+        """
+        self._start = 0
+        self._count = 0
+        self._partial = b""
+
+    def _write(self, data: memoryview) -> None:
+        capacity = len(self._buffer)
+
+        # only the newest records fit
+        if len(data) > capacity:
+            self._dropped += (len(data) - capacity) // self._record_size
+            data = data[-capacity:]
+
+        overflow = self._count + len(data) - capacity
+
+        if overflow > 0:
+            self._dropped += overflow // self._record_size
+            self._start = (self._start + overflow) % capacity
+            self._count -= overflow
+
+        end = (self._start + self._count) % capacity
+        first = min(len(data), capacity - end)
+        self._view[end : end + first] = data[:first]
+        self._view[: len(data) - first] = data[first:]
+        self._count += len(data)
+
+    def read_nowait(self, max_records: Optional[int] = None) -> Any:
+        """
+        Removes buffered records from the buffer and decodes them.
+
+        Args:
+            max_records:
+                The maximum number of records to read or ``None`` to read all.
+
+        Returns:
+            A NumPy structured array if the layout is a NumPy dtype, otherwise
+            a list of tuples as returned by :meth:`struct.Struct.unpack`.
+        """
+        count = len(self)
+
+        if max_records is not None:
+            count = min(count, max_records)
+
+        size = count * self._record_size
+        capacity = len(self._buffer)
+        first = min(size, capacity - self._start)
+
+        data = bytearray(self._view[self._start : self._start + first])
+        data += self._view[: size - first]
+
+        self._start = (self._start + size) % capacity
+        self._count -= size
+
+        if self._dtype is not None:
+            import numpy
+
+            return numpy.frombuffer(data, self._dtype)
+
+        assert self._struct is not None
+        return list(self._struct.iter_unpack(data))
+
+    async def read(self, min_records: int = 1) -> Any:
+        """
+        Waits until at least ``min_records`` records are buffered, then
+        removes all buffered records from the buffer and decodes them.
+
+        Args:
+            min_records: The number of records to wait for.
+
+        Returns:
+            Same as :meth:`read_nowait`.
+
+        Raises:
+            ValueError: if ``min_records`` is larger than the capacity.
+        """
+        if min_records * self._record_size > len(self._buffer):
+            raise ValueError("min_records must not be larger than capacity")
+
+        while len(self) < min_records:
+            self._waiter = asyncio.get_running_loop().create_future()
+            self._waiter_count = min_records
+
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        return self.read_nowait()
@@ -0,0 +1,391 @@
+"""
+Persistent device registry.
+
+The registry remembers devices that were seen while scanning or that were
+connected to, so that an application can find them again right away after it
+is restarted instead of having to scan for them first.
+
+.. versionadded:: 3.1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, NamedTuple, Optional, Union
+
+from bleak.backends.scanner import AdvertisementData
+from bleak.backends.service import BleakGATTServiceCollection
+
+logger = logging.getLogger(__name__)
+
+# prevent tasks from being garbage collected
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+class DescriptorRecord(NamedTuple):
+    """
+    The structure of a GATT descriptor stored in a :class:`DeviceRecord`.
+    """
+
+    handle: int
+    uuid: str
+
+
+class CharacteristicRecord(NamedTuple):
+    """
+    The structure of a GATT characteristic stored in a :class:`DeviceRecord`.
+    """
+
+    handle: int
+    uuid: str
+    properties: tuple[str, ...]
+    descriptors: tuple[DescriptorRecord, ...]
+
+
+class ServiceRecord(NamedTuple):
+    """
+    The structure of a GATT service stored in a :class:`DeviceRecord`.
+    """
+
+    handle: int
+    uuid: str
+    characteristics: tuple[CharacteristicRecord, ...]
+
+
+def get_service_records(
+    services: BleakGATTServiceCollection,
+) -> tuple[ServiceRecord, ...]:
+    """
+    Gets the structure of a service collection for storing it in a
+    :class:`DeviceRecord`.
+
+    Attributes are sorted by handle, so two collections with the same
+    structure give equal results.
+
+    Args:
+        services: The service collection.
+
+    Returns:
+        The records of all services.
+    """
+    return tuple(
+        ServiceRecord(
+            service.handle,
+            service.uuid,
+            tuple(
+                CharacteristicRecord(
+                    char.handle,
+                    char.uuid,
+                    tuple(char.properties),
+                    tuple(
+                        DescriptorRecord(desc.handle, desc.uuid)
+                        for desc in sorted(char.descriptors, key=lambda d: d.handle)
+                    ),
+                )
+                for char in sorted(service.characteristics, key=lambda c: c.handle)
+            ),
+        )
+        for service in sorted(services, key=lambda s: s.handle)
+    )
+
+
+class DeviceRecord(NamedTuple):
+    """
+    Information about a device stored in a :class:`DeviceRegistry`.
+    """
+
+    address: str
+    """
+    The Bluetooth address of the device (UUID on macOS).
+    """
+
+    name: Optional[str]
+    """
+    The operating system name of the device.
+    """
+
+    last_seen: float
+    """
+    The time the record was last updated, as returned by :func:`time.time`.
+    """
+
+    advertisement: Optional[AdvertisementData] = None
+    """
+    The most recently received advertisement data, if any.
+
+    ``platform_data`` is not stored, so it will always be empty.
+    """
+
+    address_type: Optional[str] = None
+    """
+    The address type of the device, ``"public"`` or ``"random"`` (BlueZ only).
+    """
+
+    adapter: Optional[str] = None
+    """
+    The D-Bus object path of the adapter that saw the device (BlueZ only).
+    """
+
+    device_path: Optional[str] = None
+    """
+    The D-Bus object path of the device (BlueZ only).
+    """
+
+    gatt_database_hash: Optional[bytes] = None
+    """
+    The value of the GATT Database Hash characteristic (0x2B2A) the last time
+    the device was connected, if the device has this characteristic.
+    """
+
+    services: Optional[tuple[ServiceRecord, ...]] = None
+    """
+    The structure of the GATT database of the device the last time it was
+    connected, see :func:`get_service_records`.
+    """
+
+
+def _encode_record(record: DeviceRecord) -> str:
+    adv = record.advertisement
+
+    return json.dumps(
+        {
+            "address": record.address,
+            "name": record.name,
+            "last_seen": record.last_seen,
+            "advertisement": (
+                None
+                if adv is None
+                else {
+                    "local_name": adv.local_name,
+                    "manufacturer_data": {
+                        str(k): v.hex() for k, v in adv.manufacturer_data.items()
+                    },
+                    "service_data": {k: v.hex() for k, v in adv.service_data.items()},
+                    "service_uuids": adv.service_uuids,
+                    "tx_power": adv.tx_power,
+                    "rssi": adv.rssi,
+                }
+            ),
+            "address_type": record.address_type,
+            "adapter": record.adapter,
+            "device_path": record.device_path,
+            "gatt_database_hash": (
+                None
+                if record.gatt_database_hash is None
+                else record.gatt_database_hash.hex()
+            ),
+            # named tuples are encoded as nested lists
+            "services": record.services,
+        }
+    )
+
+
+def _decode_record(data: str) -> DeviceRecord:
+    obj: dict[str, Any] = json.loads(data)
+    adv = obj["advertisement"]
+    gatt_database_hash = obj["gatt_database_hash"]
+    services = obj.get("services")
+
+    return DeviceRecord(
+        address=obj["address"],
+        name=obj["name"],
+        last_seen=obj["last_seen"],
+        advertisement=(
+            None
+            if adv is None
+            else AdvertisementData(
+                local_name=adv["local_name"],
+                manufacturer_data={
+                    int(k): bytes.fromhex(v)
+                    for k, v in adv["manufacturer_data"].items()
+                },
+                service_data={
+                    k: bytes.fromhex(v) for k, v in adv["service_data"].items()
+                },
+                service_uuids=adv["service_uuids"],
+                tx_power=adv["tx_power"],
+                rssi=adv["rssi"],
+                platform_data=(),
+            )
+        ),
+        address_type=obj["address_type"],
+        adapter=obj["adapter"],
+        device_path=obj["device_path"],
+        gatt_database_hash=(
+            None if gatt_database_hash is None else bytes.fromhex(gatt_database_hash)
+        ),
+        services=(
+            None
+            if services is None
+            else tuple(
+                ServiceRecord(
+                    s_handle,
+                    s_uuid,
+                    tuple(
+                        CharacteristicRecord(
+                            c_handle,
+                            c_uuid,
+                            tuple(properties),
+                            tuple(DescriptorRecord(*d) for d in descriptors),
+                        )
+                        for c_handle, c_uuid, properties, descriptors in chars
+                    ),
+                )
+                for s_handle, s_uuid, chars in services
+            )
+        ),
+    )
+
+
+class DeviceRegistry:
+    """
+    A persistent registry of devices, stored in a SQLite database file.
+
+    All records are loaded into memory when the registry is created. Updates
+    are made in memory and written to disk in the background, at most once
+    every ``flush_interval`` seconds, so updating the registry for every
+    received advertisement is cheap.
+
+    Currently, the registry is only used by the BlueZ backend. Pass it to
+    :class:`bleak.BleakScanner` and :class:`bleak.BleakClient` using the
+    ``registry`` key of the ``bluez`` argument.
+
+    Args:
+        path:
+            The path to the database file. It is created if it does not exist.
+        flush_interval:
+            The maximum time in seconds that updates are held in memory before
+            they are written to the file.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike[str]], flush_interval: float = 5.0
+    ) -> None:
+        self._flush_interval = flush_interval
+        # writes happen in a worker thread, so we need to serialize access
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS devices (address TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            rows = self._connection.execute("SELECT data FROM devices").fetchall()
+
+        self._records: dict[str, DeviceRecord] = {}
+        self._dirty: set[str] = set()
+        # serializes flushes, so that a newer record is never overwritten
+        # by an older one that is written later
+        self._flush_lock = asyncio.Lock()
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        # the flush started by the timer, if it is still in progress
+        self._flush_task: Optional[asyncio.Task[None]] = None
+
+        for (data,) in rows:
+            try:
+                record = _decode_record(data)
+            except Exception:
+                logger.warning("ignoring invalid device registry record: %s", data)
+                continue
+
+            self._records[record.address.upper()] = record
+
+    def get(self, address: str) -> Optional[DeviceRecord]:
+        """
+        Gets the record for a device.
+
+        Args:
+            address: The Bluetooth address of the device (UUID on macOS).
+
+        Returns:
+            The record or ``None`` if the device is not in the registry.
+        """
+        return self._records.get(address.upper())
+
+    def update(self, record: DeviceRecord) -> None:
+        """
+        Adds or replaces the record for a device.
+
+        The record is written to the file in the background.
+
+        Args:
+            record: The new record.
+        """
+        key = record.address.upper()
+        self._records[key] = record
+        self._dirty.add(key)
+
+        if self._flush_timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # no event loop, will be written on next flush() or close()
+                return
+
+            self._flush_timer = loop.call_later(self._flush_interval, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_timer = None
+        self._flush_task = asyncio.create_task(self._flush_in_background())
+        _background_tasks.add(self._flush_task)
+        self._flush_task.add_done_callback(_background_tasks.discard)
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            # the updates are kept and written on the next flush
+            logger.exception("failed to write device registry")
+        finally:
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+
+    async def flush(self) -> None:
+        """
+        Writes all pending updates to the file.
+
+        If writing fails, the updates are kept and written on the next flush.
+        """
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+
+            dirty, self._dirty = self._dirty, set()
+            rows = [(key, _encode_record(self._records[key])) for key in dirty]
+
+            try:
+                await asyncio.to_thread(self._write, rows)
+            except BaseException:
+                # keys that were updated again meanwhile are still dirty
+                self._dirty |= dirty
+                raise
+
+    def _write(self, rows: list[tuple[str, str]]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO devices (address, data) VALUES (?, ?)", rows
+            )
+
+    async def close(self) -> None:
+        """
+        Writes all pending updates to the file and closes it.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        # the write can't be cancelled once it is running in the worker thread
+        if self._flush_task is not None:
+            await self._flush_task
+
+        await self.flush()
+
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+
+"""Tests for `bleak.backends.bluezdbus.client` module."""
+
+import asyncio
+import contextlib
+import os
+import socket
+import sys
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+if sys.platform != "linux":
+    pytest.skip("skipping linux-only tests", allow_module_level=True)
+    assert False  # HACK: work around pyright bug
+
+from dbus_fast import Message
+from dbus_fast.constants import ErrorType
+
+from bleak.backends.bluezdbus import client as client_module
+from bleak.backends.bluezdbus.client import BleakClientBlueZDBus
+from bleak.backends.bluezdbus.manager import get_max_write_without_response_size
+from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.device import BLEDevice
+from bleak.backends.service import BleakGATTService
+from bleak.exc import (
+    BleakDBusError,
+    BleakError,
+    BleakGATTProtocolError,
+    BleakGATTProtocolErrorCode,
+)
+from bleak.uuids import normalize_uuid_16
+
+ADAPTER_PATH = "/org/bluez/hci0"
+DEVICE_PATH = f"{ADAPTER_PATH}/dev_11_22_33_44_55_66"
+CHAR_PATH = f"{DEVICE_PATH}/service000a/char000b"
+
+
+class FakeBus:
+    """
+    Stand-in for a D-Bus connection that records method calls and hands out
+    one end of a socket pair for ``AcquireWrite`` and ``AcquireNotify``.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[Message] = []
+        self.connected = True
+        # our ends of the socket pairs
+        self.socks: list[socket.socket] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.read_not_permitted: set[str] = set()
+
+    async def call(self, msg: Message) -> Message:
+        msg.serial = len(self.calls) + 1
+        self.calls.append(msg)
+
+        if msg.member in ("AcquireWrite", "AcquireNotify"):
+            theirs, ours = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+            # small buffer to test backpressure
+            theirs.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+            ours.setblocking(False)
+            self.socks.append(ours)
+            return Message.new_method_return(msg, "hq", [0, 247], [theirs.detach()])
+
+        if msg.member == "ReadValue":
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+
+            if msg.path in self.read_not_permitted:
+                return Message.new_error(
+                    msg, "org.bluez.Error.NotPermitted", "Read not permitted"
+                )
+
+            # the value is the end of the object path
+            return Message.new_method_return(msg, "ay", [msg.path[-4:].encode()])
+
+        return Message.new_method_return(msg)
+
+    def members(self) -> list[str]:
+        return [m.member for m in self.calls if m.member]
+
+    def close(self) -> None:
+        for sock in self.socks:
+            sock.close()
+
+
+def create_client(**bluez: Any) -> tuple[BleakClientBlueZDBus, FakeBus]:
+    client = BleakClientBlueZDBus(
+        "11:22:33:44:55:66", bluez=bluez, timeout=10  # type: ignore
+    )
+    bus = FakeBus()
+    client._bus = bus  # type: ignore
+    client._is_connected = True
+    return client, bus
+
+
+def create_characteristic(path: str = CHAR_PATH) -> BleakGATTCharacteristic:
+    props: Any = {
+        "UUID": normalize_uuid_16(0x2A3D),
+        "Flags": ["write-without-response", "write", "notify"],
+        "WriteAcquired": False,
+        "NotifyAcquired": False,
+        "MTU": 247,
+    }
+    service = BleakGATTService(None, 0xA, normalize_uuid_16(0x1234))
+    return BleakGATTCharacteristic(
+        (path, props),
+        int(path[-4:], 16),
+        props["UUID"],
+        props["Flags"],
+        lambda: get_max_write_without_response_size(props),
+        service,
+    )
+
+
+async def test_write_without_response_uses_acquired_socket():
+    client, bus = create_client()
+    char = create_characteristic()
+
+    await client.write_gatt_char(char, b"\x01\x02", False)
+    await client.write_gatt_char(char, bytearray(b"\x03" * 244), False)
+
+    assert bus.members() == ["AcquireWrite"]
+    (sock,) = bus.socks
+    assert sock.recv(1024) == b"\x01\x02"
+    assert sock.recv(1024) == b"\x03" * 244
+    assert client._mtu_size == 247
+
+    # too large for one packet
+    await client.write_gatt_char(char, b"\x04" * 245, False)
+    assert bus.members() == ["AcquireWrite", "WriteValue"]
+    assert not client._write_fds
+
+    # acquired again on next write without response
+    await client.write_gatt_char(char, b"\x05", False)
+    assert bus.members() == ["AcquireWrite", "WriteValue", "AcquireWrite"]
+
+    # BlueZ does not allow WriteValue while the write is acquired
+    await client.write_gatt_char(char, b"\x06", True)
+    assert bus.members()[-1] == "WriteValue"
+    assert not client._write_fds
+
+    bus.close()
+
+
+async def test_write_without_response_backpressure():
+    client, bus = create_client()
+    char = create_characteristic()
+    packets = [bytes([i]) * 244 for i in range(100)]
+
+    async def write_all() -> None:
+        for packet in packets:
+            await client.write_gatt_char(char, packet, False)
+
+    task = asyncio.create_task(write_all())
+    await asyncio.sleep(0.1)
+
+    # blocked until the other side reads
+    assert not task.done()
+
+    loop = asyncio.get_running_loop()
+    received = [await loop.sock_recv(bus.socks[0], 1024) for _ in packets]
+    await task
+
+    assert received == packets
+    assert bus.members() == ["AcquireWrite"]
+
+    bus.close()
+
+
+async def fill_write_socket(client: BleakClientBlueZDBus, char_path: str) -> None:
+    """Writes to the acquired socket until the next write would block."""
+    fd = client._write_fds[char_path]
+
+    while True:
+        try:
+            os.write(fd, b"\x00" * 244)
+        except BlockingIOError:
+            break
+
+
+async def test_write_without_response_disconnected_while_waiting():
+    client, bus = create_client()
+    char = create_characteristic()
+
+    await client.write_gatt_char(char, b"\x01", False)
+    await fill_write_socket(client, CHAR_PATH)
+
+    task = asyncio.create_task(client.write_gatt_char(char, b"\x02", False))
+    await asyncio.sleep(0.1)
+    assert not task.done()
+
+    # same as cleanup on disconnect
+    client._is_connected = False
+    client._release_write_fd(CHAR_PATH)
+
+    with pytest.raises(BleakError, match="Not connected"):
+        await task
+
+    bus.close()
+
+
+async def test_write_without_response_acquire_write_disabled():
+    client, bus = create_client(use_acquire_write=False)
+    char = create_characteristic()
+
+    await client.write_gatt_char(char, b"\x01", False)
+
+    assert bus.members() == ["WriteValue"]
+
+
+@pytest.mark.parametrize("value_type", ["bytearray", "bytes", "memoryview"])
+async def test_acquired_notifications(value_type: str):
+    client, bus = create_client()
+    char = create_characteristic()
+    received: list[Any] = []
+
+    def callback(data: Any) -> None:
+        assert type(data).__name__ == value_type
+        received.append(bytes(data))
+
+    await client.start_notify(char, callback, bluez={"value_type": value_type})
+    (sock,) = bus.socks
+
+    for i in range(3):
+        sock.send(bytes([i]) * 20)
+
+    await asyncio.sleep(0.1)
+    assert received == [bytes([i]) * 20 for i in range(3)]
+
+    await client.stop_notify(char)
+    bus.close()
+
+
+async def test_notify_fd_reader_drains_all_pending_packets():
+    client, _ = create_client()
+    theirs, ours = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    batches: list[list[bytes]] = []
+
+    fd = client._notification_fds[CHAR_PATH] = ours.detach()
+    client._register_notify_fd_reader(
+        CHAR_PATH, fd, lambda packets, _: batches.append(list(map(bytes, packets)))
+    )
+
+    for i in range(10):
+        theirs.send(bytes([i]) * 20)
+
+    await asyncio.sleep(0.1)
+    assert batches == [[bytes([i]) * 20 for i in range(10)]]
+
+    # EOF stops notifications
+    theirs.close()
+    await asyncio.sleep(0.1)
+    assert CHAR_PATH not in client._notification_fds
+
+
+async def test_acquired_notifications_timestamps():
+    client, bus = create_client()
+    char = create_characteristic()
+    received: list[tuple[bytes, int]] = []
+
+    await client.start_notify_timestamped(
+        char, lambda data, timestamp: received.append((data, timestamp)), bluez={}
+    )
+    (sock,) = bus.socks
+
+    before = time.monotonic_ns()
+    sock.send(b"\x01")
+    sock.send(b"\x02")
+    await asyncio.sleep(0.1)
+
+    # packets read at once have the time when the socket became readable
+    ((data1, timestamp1), (data2, timestamp2)) = received
+    assert (data1, data2) == (b"\x01", b"\x02")
+    assert before <= timestamp1 == timestamp2 <= time.monotonic_ns()
+
+    await client.stop_notify(char)
+    bus.close()
+
+
+async def test_acquired_notifications_batched():
+    client, bus = create_client()
+    char = create_characteristic()
+    batches: list[list[tuple[int, bytes]]] = []
+
+    await client.start_notify_batched(
+        char,
+        lambda batch: batches.append([(t, bytes(data)) for t, data in batch]),
+        bluez={},
+    )
+    (sock,) = bus.socks
+
+    for i in range(3):
+        sock.send(bytes([i]))
+
+    await asyncio.sleep(0.1)
+
+    # packets read at once are passed to the callback as they are
+    (batch,) = batches
+    assert [data for _, data in batch] == [b"\x00", b"\x01", b"\x02"]
+    assert len({timestamp for timestamp, _ in batch}) == 1
+
+    await client.stop_notify(char)
+    bus.close()
+
+
+async def test_read_gatt_chars_pipelined():
+    client, bus = create_client()
+    chars = [create_characteristic(f"{CHAR_PATH[:-4]}{i:04x}") for i in range(1, 6)]
+    bus.read_not_permitted.add(chars[1].obj[0])
+
+    results = await client.read_gatt_chars(chars)
+
+    # all reads were sent without waiting for the other replies
+    assert bus.max_in_flight == len(chars)
+
+    assert results[0] == b"0001"
+    assert isinstance(results[1], BleakGATTProtocolError)
+    assert results[1].code == BleakGATTProtocolErrorCode.READ_NOT_PERMITTED
+    assert results[2:] == [b"0003", b"0004", b"0005"]
+
+
+async def test_write_gatt_chars():
+    client, bus = create_client(use_acquire_write=False)
+    char = create_characteristic()
+
+    errors = await client.write_gatt_chars(
+        [(char, b"\x01", True), (char, b"\x02", True), (char, b"\x03", False)]
+    )
+
+    assert errors == [None, None, None]
+    # writes to the same characteristic are done in order
+    assert [bytes(m.body[0]) for m in bus.calls] == [b"\x01", b"\x02", b"\x03"]
+
+
+async def test_write_gatt_chars_disconnected_while_waiting():
+    client, bus = create_client()
+    char = create_characteristic()
+    other_char = create_characteristic(f"{CHAR_PATH[:-4]}000d")
+
+    await client.write_gatt_char(char, b"\x01", False)
+    await fill_write_socket(client, CHAR_PATH)
+
+    task = asyncio.create_task(
+        client.write_gatt_chars([(char, b"\x02", False), (other_char, b"\x03", True)])
+    )
+    await asyncio.sleep(0.1)
+    assert not task.done()
+
+    client._is_connected = False
+    client._release_write_fd(CHAR_PATH)
+
+    # the failed write does not abort the other writes
+    error, other_error = await task
+    assert isinstance(error, BleakError)
+    assert other_error is None
+    assert bus.members()[-1] == "WriteValue"
+
+    bus.close()
+
+
+class FakeManager:
+    """Stand-in for :class:`BlueZManager` for finding devices."""
+
+    def __init__(self, connect_device_delay: float = 0) -> None:
+        self.connect_device_delay = connect_device_delay
+        self.connect_device_calls: list[str] = []
+
+    def get_default_adapter(self) -> str:
+        return ADAPTER_PATH
+
+    def get_device_properties(self, device_path: str) -> None:
+        return None
+
+    @contextlib.asynccontextmanager
+    async def pause_discovery(self, adapter_path: str) -> AsyncIterator[None]:
+        yield
+
+    async def connect_device(
+        self, adapter_path: str, address: str, address_type: str
+    ) -> str:
+        self.connect_device_calls.append(address)
+        await asyncio.sleep(self.connect_device_delay)
+        raise BleakDBusError(ErrorType.UNKNOWN_METHOD.value, [])
+
+
+@pytest.fixture
+def fake_manager(monkeypatch: pytest.MonkeyPatch) -> FakeManager:
+    manager = FakeManager()
+
+    async def get_global_bluez_manager() -> FakeManager:
+        return manager
+
+    monkeypatch.setattr(
+        client_module, "get_global_bluez_manager", get_global_bluez_manager
+    )
+
+    return manager
+
+
+async def test_find_device_connect_device_not_available(
+    fake_manager: FakeManager, monkeypatch: pytest.MonkeyPatch
+):
+    """Without ConnectDevice, the device is found by scanning instead."""
+    client, _ = create_client(address_type="public")
+    device = BLEDevice(
+        "11:22:33:44:55:66",
+        None,
+        {"path": DEVICE_PATH, "props": {"Adapter": ADAPTER_PATH}},
+    )
+    scans: list[str] = []
+
+    async def find_device_by_address(address: str, **kwargs: Any) -> BLEDevice:
+        scans.append(address)
+        return device
+
+    monkeypatch.setattr(
+        client_module.BleakScanner, "find_device_by_address", find_device_by_address
+    )
+
+    loop = asyncio.get_running_loop()
+    connecting = await client._find_device(fake_manager, loop.time() + 10)  # type: ignore
+
+    assert not connecting
+    assert fake_manager.connect_device_calls == ["11:22:33:44:55:66"]
+    assert scans == ["11:22:33:44:55:66"]
+    assert client._device_path == DEVICE_PATH
+
+
+async def test_find_device_connect_device_deadline(fake_manager: FakeManager):
+    """ConnectDevice only gets the time that is left until the deadline."""
+    fake_manager.connect_device_delay = 10
+    client, _ = create_client(address_type="public")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await client._find_device(fake_manager, start + 0.05)  # type: ignore
+
+    assert loop.time() - start < 1
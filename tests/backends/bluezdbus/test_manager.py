@@ -0,0 +1,715 @@
+#!/usr/bin/env python
+
+"""Tests for `bleak.backends.bluezdbus.manager` package."""
+
+import asyncio
+import sys
+from collections.abc import Callable
+from typing import Any, Optional
+
+import pytest
+
+if sys.platform != "linux":
+    pytest.skip("skipping linux-only tests", allow_module_level=True)
+    assert False  # HACK: work around pyright bug
+
+from dbus_fast import Message, Variant
+from dbus_fast.constants import ErrorType
+
+from bleak.backends.bluezdbus import defs
+from bleak.backends.bluezdbus.advertisement_monitor import (
+    AdvertisementMonitor,
+    RSSIAdvertisementMonitor,
+    get_rssi_parameters,
+)
+from bleak.backends.bluezdbus.client import BleakClientBlueZDBus
+from bleak.backends.bluezdbus.manager import BlueZManager, merge_discovery_filters
+from bleak.exc import BleakDBusError
+from bleak.registry import CharacteristicRecord, ServiceRecord
+from bleak.uuids import normalize_uuid_16
+
+ADAPTER_PATH = "/org/bluez/hci0"
+DEVICE_ADDRESS = "11:22:33:44:55:66"
+DEVICE_PATH = f"{ADAPTER_PATH}/dev_11_22_33_44_55_66"
+
+MethodHandler = Callable[[Message], Optional[Message]]
+
+
+class FakeBus:
+    """
+    Stand-in for the BlueZ service on the other end of a D-Bus connection.
+
+    Method calls are recorded and passed to ``handler``, which can return a
+    reply. If it returns ``None``, an empty method return is sent.
+    """
+
+    def __init__(self, handler: Optional[MethodHandler] = None) -> None:
+        self.calls: list[Message] = []
+        self.connected = True
+        self.exported: dict[str, Any] = {}
+        self._handler = handler
+
+    async def call(self, msg: Message) -> Message:
+        # replies require the serial number of the call
+        msg.serial = len(self.calls) + 1
+        self.calls.append(msg)
+
+        if self._handler and (reply := self._handler(msg)):
+            return reply
+
+        return Message.new_method_return(msg)
+
+    def export(self, path: str, interface: Any) -> None:
+        self.exported[path] = interface
+
+    def unexport(self, path: str, interface: Any) -> None:
+        del self.exported[path]
+
+    def members(self) -> list[str]:
+        return [m.member for m in self.calls if m.member]
+
+
+def create_manager(handler: Optional[MethodHandler] = None) -> BlueZManager:
+    manager = BlueZManager()
+    manager._bus = FakeBus(handler)  # type: ignore
+    manager._properties[ADAPTER_PATH] = {
+        defs.ADAPTER_INTERFACE: {
+            "Address": "00:00:00:00:00:01",
+            "Powered": True,
+            "Roles": ["central"],
+        }
+    }
+    manager._adapters.add(ADAPTER_PATH)
+    return manager
+
+
+def interfaces_added_signal(
+    path: str, interface: str, props: dict[str, Any]
+) -> Message:
+    return Message.new_signal(
+        "/",
+        defs.OBJECT_MANAGER_INTERFACE,
+        "InterfacesAdded",
+        "oa{sa{sv}}",
+        [path, {interface: props}],
+    )
+
+
+def device_added_signal(path: str, props: dict[str, Any]) -> Message:
+    return interfaces_added_signal(path, defs.DEVICE_INTERFACE, props)
+
+
+def interfaces_removed_signal(path: str, interface: str) -> Message:
+    return Message.new_signal(
+        "/",
+        defs.OBJECT_MANAGER_INTERFACE,
+        "InterfacesRemoved",
+        "oas",
+        [path, [interface]],
+    )
+
+
+def properties_changed_signal(
+    path: str, interface: str, changed: dict[str, Any]
+) -> Message:
+    return Message.new_signal(
+        path,
+        defs.PROPERTIES_INTERFACE,
+        "PropertiesChanged",
+        "sa{sv}as",
+        [interface, changed, []],
+    )
+
+
+def service_added_signal(path: str, uuid: int) -> Message:
+    return interfaces_added_signal(
+        path,
+        defs.GATT_SERVICE_INTERFACE,
+        {
+            "UUID": Variant("s", normalize_uuid_16(uuid)),
+            "Device": Variant("o", path.rsplit("/", 1)[0]),
+            "Primary": Variant("b", True),
+        },
+    )
+
+
+def characteristic_added_signal(path: str, uuid: int) -> Message:
+    return interfaces_added_signal(
+        path,
+        defs.GATT_CHARACTERISTIC_INTERFACE,
+        {
+            "UUID": Variant("s", normalize_uuid_16(uuid)),
+            "Service": Variant("o", path.rsplit("/", 1)[0]),
+            "Flags": Variant("as", ["read"]),
+        },
+    )
+
+
+async def test_connect_device():
+    """ConnectDevice creates the device object and returns its path."""
+
+    manager: BlueZManager
+
+    def handler(msg: Message) -> Optional[Message]:
+        assert msg.member == "ConnectDevice"
+        assert msg.path == ADAPTER_PATH
+        params = msg.body[0]
+        assert params["Address"].value == DEVICE_ADDRESS
+        assert params["AddressType"].value == "random"
+
+        # BlueZ emits InterfacesAdded before sending the reply
+        manager._parse_msg(
+            device_added_signal(
+                DEVICE_PATH,
+                {
+                    "Address": Variant("s", DEVICE_ADDRESS),
+                    "AddressType": Variant("s", "random"),
+                    "Adapter": Variant("o", ADAPTER_PATH),
+                    "Alias": Variant("s", "11-22-33-44-55-66"),
+                    "Connected": Variant("b", True),
+                },
+            )
+        )
+
+        return Message.new_method_return(msg, "o", [DEVICE_PATH])
+
+    manager = create_manager(handler)
+
+    path = await manager.connect_device(ADAPTER_PATH, DEVICE_ADDRESS, "random")
+
+    assert path == DEVICE_PATH
+    assert manager.is_connected(DEVICE_PATH)
+
+    props = manager.get_device_properties(DEVICE_PATH)
+    assert props is not None
+    assert props["AddressType"] == "random"
+
+
+async def test_connect_device_not_available():
+    """ConnectDevice errors are raised as BleakDBusError."""
+
+    def handler(msg: Message) -> Optional[Message]:
+        return Message.new_error(msg, ErrorType.UNKNOWN_METHOD, "Unknown method")
+
+    manager = create_manager(handler)
+
+    with pytest.raises(BleakDBusError) as exc_info:
+        await manager.connect_device(ADAPTER_PATH, DEVICE_ADDRESS, "public")
+
+    assert exc_info.value.dbus_error == ErrorType.UNKNOWN_METHOD.value
+    assert manager.get_device_properties(DEVICE_PATH) is None
+
+
+def _discovery_filter(**filters: Variant) -> dict[str, Variant]:
+    return {
+        "Transport": Variant("s", "le"),
+        "DuplicateData": Variant("b", False),
+        **filters,
+    }
+
+
+async def test_active_scan_shares_discovery_session():
+    """Discovery is started once per adapter and filters are merged."""
+    manager = create_manager()
+    bus: FakeBus = manager._bus  # type: ignore
+
+    stop1 = await manager.active_scan(
+        ADAPTER_PATH,
+        _discovery_filter(UUIDs=Variant("as", ["a"])),
+        lambda p, d: None,
+        lambda p: None,
+    )
+    assert bus.members() == ["SetDiscoveryFilter", "StartDiscovery"]
+
+    stop2 = await manager.active_scan(
+        ADAPTER_PATH,
+        _discovery_filter(UUIDs=Variant("as", ["b"]), RSSI=Variant("n", -70)),
+        lambda p, d: None,
+        lambda p: None,
+    )
+    assert bus.members()[2:] == ["SetDiscoveryFilter"]
+    assert bus.calls[-1].body[0] == _discovery_filter(UUIDs=Variant("as", ["a", "b"]))
+
+    # same filter as an existing scanner doesn't change anything
+    stop3 = await manager.active_scan(
+        ADAPTER_PATH,
+        _discovery_filter(UUIDs=Variant("as", ["a"])),
+        lambda p, d: None,
+        lambda p: None,
+    )
+    assert len(bus.calls) == 3
+
+    await stop3()
+    assert len(bus.calls) == 3
+
+    await stop1()
+    assert bus.members()[3:] == ["SetDiscoveryFilter"]
+    assert bus.calls[-1].body[0] == _discovery_filter(
+        UUIDs=Variant("as", ["b"]), RSSI=Variant("n", -70)
+    )
+
+    await stop2()
+    assert bus.members()[4:] == ["StopDiscovery", "SetDiscoveryFilter"]
+    assert bus.calls[-1].body[0] == {}
+
+
+async def test_pause_discovery():
+    """Discovery is stopped while paused and resumed with the same filter."""
+    manager = create_manager()
+    bus: FakeBus = manager._bus  # type: ignore
+    paused: list[bool] = []
+
+    # nothing to pause if nobody is scanning
+    async with manager.pause_discovery(ADAPTER_PATH):
+        pass
+
+    assert bus.calls == []
+
+    stop1 = await manager.active_scan(
+        ADAPTER_PATH,
+        _discovery_filter(UUIDs=Variant("as", ["a"])),
+        lambda p, d: None,
+        lambda p: None,
+        paused.append,
+    )
+
+    async with manager.pause_discovery(ADAPTER_PATH):
+        assert bus.members()[2:] == ["StopDiscovery"]
+        assert paused == [True]
+
+        # overlapping pauses don't stop discovery again
+        async with manager.pause_discovery(ADAPTER_PATH):
+            pass
+
+        # scanners started while paused are told right away
+        stop2 = await manager.active_scan(
+            ADAPTER_PATH,
+            _discovery_filter(UUIDs=Variant("as", ["b"])),
+            lambda p, d: None,
+            lambda p: None,
+            paused.append,
+        )
+        assert paused == [True, True]
+
+        await stop1()
+        assert bus.members()[2:] == ["StopDiscovery"]
+
+    assert bus.members()[3:] == ["SetDiscoveryFilter", "StartDiscovery"]
+    assert bus.calls[3].body[0] == _discovery_filter(UUIDs=Variant("as", ["b"]))
+    assert paused == [True, True, False]
+
+    await stop2()
+    assert bus.members()[5:] == ["StopDiscovery", "SetDiscoveryFilter"]
+
+
+def test_merge_discovery_filters():
+    """The merged filter is the weakest of the filters."""
+    merged = merge_discovery_filters(
+        [
+            _discovery_filter(
+                RSSI=Variant("n", -60),
+                Pattern=Variant("s", "11:22:33"),
+            ),
+            _discovery_filter(
+                RSSI=Variant("n", -80),
+                Pattern=Variant("s", "11:22:44"),
+                Discoverable=Variant("b", True),
+            ),
+            {"DuplicateData": Variant("b", True), "RSSI": Variant("n", -70)},
+        ]
+    )
+
+    assert merged == {
+        "RSSI": Variant("n", -80),
+        "Transport": Variant("s", "auto"),
+        "DuplicateData": Variant("b", True),
+    }
+
+    # stricter filters are only used if all scanners ask for them
+    merged = merge_discovery_filters(
+        [
+            _discovery_filter(Discoverable=Variant("b", True)),
+            _discovery_filter(Discoverable=Variant("b", True)),
+        ]
+    )
+
+    assert merged == {
+        "Transport": Variant("s", "le"),
+        "DuplicateData": Variant("b", False),
+        "Discoverable": Variant("b", True),
+    }
+
+
+async def test_passive_scan_rssi_rejected():
+    """A monitor with rejected RSSI properties is replaced by one without."""
+    manager = create_manager()
+    bus: FakeBus = manager._bus  # type: ignore
+    rejected: list[None] = []
+
+    stop = await manager.passive_scan(
+        ADAPTER_PATH,
+        [(0, 0x09, b"test")],  # type: ignore
+        lambda p, d: None,
+        lambda p: None,
+        get_rssi_parameters({"RSSIHighThreshold": -60}),
+        lambda: rejected.append(None),
+    )
+    assert bus.members() == ["RegisterMonitor"]
+    (monitor,) = bus.exported.values()
+    assert isinstance(monitor, RSSIAdvertisementMonitor)
+
+    # BlueZ releases monitors with invalid properties without activating them
+    monitor.Release()
+    await asyncio.sleep(0)
+    assert rejected == [None]
+
+    assert bus.members() == ["RegisterMonitor", "UnregisterMonitor", "RegisterMonitor"]
+    (monitor,) = bus.exported.values()
+    assert type(monitor) is AdvertisementMonitor
+
+    await stop()
+    assert bus.members()[-1] == "UnregisterMonitor"
+    assert not bus.exported
+
+
+async def test_passive_scan_multiple_monitors():
+    """Patterns are split between several monitors."""
+    manager = create_manager()
+    bus: FakeBus = manager._bus  # type: ignore
+
+    stop = await manager.passive_scan(
+        ADAPTER_PATH,
+        [(0, 0xFF, bytes([i, 0])) for i in range(20)],  # type: ignore
+        lambda p, d: None,
+        lambda p: None,
+    )
+    assert bus.members() == ["RegisterMonitor", "RegisterMonitor"]
+    assert len(bus.exported) == 2
+
+    await stop()
+    assert bus.members()[2:] == ["UnregisterMonitor", "UnregisterMonitor"]
+    assert not bus.exported
+
+
+async def test_get_services_expected_services():
+    """Known services are used without waiting for ServicesResolved."""
+    manager = create_manager()
+    service_path = f"{DEVICE_PATH}/service000a"
+    char_path = f"{service_path}/char000b"
+
+    manager._parse_msg(
+        device_added_signal(
+            DEVICE_PATH,
+            {
+                "Address": Variant("s", DEVICE_ADDRESS),
+                "Adapter": Variant("o", ADAPTER_PATH),
+                "Connected": Variant("b", True),
+                "ServicesResolved": Variant("b", False),
+            },
+        )
+    )
+    manager._parse_msg(
+        interfaces_added_signal(
+            service_path,
+            defs.GATT_SERVICE_INTERFACE,
+            {
+                "UUID": Variant("s", normalize_uuid_16(0x1801)),
+                "Device": Variant("o", DEVICE_PATH),
+                "Primary": Variant("b", True),
+            },
+        )
+    )
+    manager._parse_msg(
+        interfaces_added_signal(
+            char_path,
+            defs.GATT_CHARACTERISTIC_INTERFACE,
+            {
+                "UUID": Variant("s", normalize_uuid_16(0x2B2A)),
+                "Service": Variant("o", service_path),
+                "Flags": Variant("as", ["read"]),
+                "Value": Variant("ay", b"\x01" * 16),
+            },
+        )
+    )
+
+    assert manager.get_gatt_database_hash(DEVICE_PATH) == b"\x01" * 16
+
+    structure = manager.get_services_structure(DEVICE_PATH)
+    assert structure == (
+        ServiceRecord(
+            10,
+            normalize_uuid_16(0x1801),
+            (CharacteristicRecord(11, normalize_uuid_16(0x2B2A), ("read",), ()),),
+        ),
+    )
+
+    services = await asyncio.wait_for(
+        manager.get_services(DEVICE_PATH, False, None, structure), timeout=1
+    )
+    assert services.get_characteristic(0xB) is not None
+
+    # other structure, have to wait
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            manager.get_services(DEVICE_PATH, False, None, ()), timeout=0.1
+        )
+
+
+async def test_services_updated_in_place():
+    """GATT objects added or removed while connected update the services."""
+    manager = create_manager()
+    service_path = f"{DEVICE_PATH}/service000a"
+    char_path = f"{service_path}/char000b"
+    changes: list[None] = []
+
+    manager._parse_msg(
+        device_added_signal(
+            DEVICE_PATH,
+            {
+                "Address": Variant("s", DEVICE_ADDRESS),
+                "Adapter": Variant("o", ADAPTER_PATH),
+                "Connected": Variant("b", True),
+                "ServicesResolved": Variant("b", True),
+            },
+        )
+    )
+    manager._parse_msg(service_added_signal(service_path, 0x180F))
+    manager._parse_msg(characteristic_added_signal(char_path, 0x2A19))
+
+    manager.add_device_watcher(
+        DEVICE_PATH, lambda c: None, lambda p, v: None, lambda: changes.append(None)
+    )
+    services = await manager.get_services(DEVICE_PATH, False, None)
+    assert services.get_characteristic("2a19") is not None
+
+    # e.g. after a Service Changed indication
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service0010", 0x180D))
+    manager._parse_msg(
+        characteristic_added_signal(f"{DEVICE_PATH}/service0010/char0011", 0x2A37)
+    )
+    manager._parse_msg(
+        interfaces_removed_signal(char_path, defs.GATT_CHARACTERISTIC_INTERFACE)
+    )
+    manager._parse_msg(
+        interfaces_removed_signal(service_path, defs.GATT_SERVICE_INTERFACE)
+    )
+
+    assert list(services.services) == [0x10]
+    assert list(services.characteristics) == [0x11]
+    assert services.get_characteristic("2a37") is services.get_characteristic(0x11)
+    assert services.get_characteristic("2a19") is None
+
+    # all changes result in a single callback
+    assert not changes
+    await asyncio.sleep(0)
+    assert changes == [None]
+
+    # BlueZ removes objects on disconnect but services stay usable
+    manager._parse_msg(
+        properties_changed_signal(
+            DEVICE_PATH, defs.DEVICE_INTERFACE, {"Connected": Variant("b", False)}
+        )
+    )
+    manager._parse_msg(
+        interfaces_removed_signal(
+            f"{DEVICE_PATH}/service0010", defs.GATT_SERVICE_INTERFACE
+        )
+    )
+    assert list(services.services) == [0x10]
+
+
+async def test_services_not_updated_after_reconnect():
+    """Cached services of a previous connection are not updated."""
+    manager = create_manager()
+    changes: list[None] = []
+
+    manager._parse_msg(
+        device_added_signal(
+            DEVICE_PATH,
+            {
+                "Address": Variant("s", DEVICE_ADDRESS),
+                "Adapter": Variant("o", ADAPTER_PATH),
+                "Connected": Variant("b", True),
+                "ServicesResolved": Variant("b", True),
+            },
+        )
+    )
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service000a", 0x180F))
+    manager.add_device_watcher(
+        DEVICE_PATH, lambda c: None, lambda p, v: None, lambda: changes.append(None)
+    )
+    services = await manager.get_services(DEVICE_PATH, False, None)
+
+    for connected in (False, True):
+        manager._parse_msg(
+            properties_changed_signal(
+                DEVICE_PATH,
+                defs.DEVICE_INTERFACE,
+                {"Connected": Variant("b", connected)},
+            )
+        )
+
+    # BlueZ exports the objects again before get_services() is called
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service0010", 0x180D))
+
+    await asyncio.sleep(0)
+    assert list(services.services) == [0xA]
+    assert not changes
+
+    new_services = await manager.get_services(DEVICE_PATH, False, None)
+    assert new_services is not services
+    assert sorted(new_services.services) == [0xA, 0x10]
+
+
+async def test_revalidated_services_updated_in_place():
+    """Services from the registry stay live after BlueZ resolved services."""
+    manager = create_manager()
+    client = BleakClientBlueZDBus(DEVICE_ADDRESS, bluez={}, timeout=10)
+    client._device_path = DEVICE_PATH
+
+    manager._parse_msg(
+        device_added_signal(
+            DEVICE_PATH,
+            {
+                "Address": Variant("s", DEVICE_ADDRESS),
+                "Adapter": Variant("o", ADAPTER_PATH),
+                "Connected": Variant("b", True),
+                "ServicesResolved": Variant("b", False),
+            },
+        )
+    )
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service000a", 0x180F))
+    manager._parse_msg(
+        characteristic_added_signal(f"{DEVICE_PATH}/service000a/char000b", 0x2A19)
+    )
+    expected = manager.get_services_structure(DEVICE_PATH)
+
+    client.services = await manager.get_services(DEVICE_PATH, False, None, expected)
+    task = asyncio.create_task(client._revalidate_services(manager, expected))
+    await asyncio.sleep(0)
+
+    manager._parse_msg(
+        properties_changed_signal(
+            DEVICE_PATH,
+            defs.DEVICE_INTERFACE,
+            {"ServicesResolved": Variant("b", True)},
+        )
+    )
+    await asyncio.wait_for(task, timeout=1)
+
+    # e.g. after a Service Changed indication
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service0010", 0x180D))
+
+    assert sorted(client.services.services) == [0xA, 0x10]
+
+
+async def test_get_services_streams_characteristics():
+    """Characteristics can be used before all services are resolved."""
+    manager = create_manager()
+    discovered: list[int] = []
+    changes: list[None] = []
+
+    manager._parse_msg(
+        device_added_signal(
+            DEVICE_PATH,
+            {
+                "Address": Variant("s", DEVICE_ADDRESS),
+                "Adapter": Variant("o", ADAPTER_PATH),
+                "Connected": Variant("b", True),
+                "ServicesResolved": Variant("b", False),
+            },
+        )
+    )
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service000a", 0x180F))
+    manager._parse_msg(
+        characteristic_added_signal(f"{DEVICE_PATH}/service000a/char000b", 0x2A19)
+    )
+    manager.add_device_watcher(
+        DEVICE_PATH, lambda c: None, lambda p, v: None, lambda: changes.append(None)
+    )
+
+    task = asyncio.create_task(
+        manager.get_services(
+            DEVICE_PATH,
+            False,
+            None,
+            on_characteristic_added=lambda c: discovered.append(c.handle),
+        )
+    )
+    await asyncio.sleep(0)
+    assert discovered == [0xB]
+
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service0010", 0x180D))
+    manager._parse_msg(
+        characteristic_added_signal(f"{DEVICE_PATH}/service0010/char0011", 0x2A37)
+    )
+    assert discovered == [0xB, 0x11]
+    assert not task.done()
+
+    manager._parse_msg(
+        properties_changed_signal(
+            DEVICE_PATH,
+            defs.DEVICE_INTERFACE,
+            {"ServicesResolved": Variant("b", True)},
+        )
+    )
+    services = await asyncio.wait_for(task, timeout=1)
+
+    assert sorted(services.characteristics) == [0xB, 0x11]
+    assert services.get_characteristic("2a37") is services.get_characteristic(0x11)
+
+    # discovering services is not a change of the services
+    await asyncio.sleep(0)
+    assert not changes
+
+
+async def test_get_services_characteristic_callback_error(
+    caplog: pytest.LogCaptureFixture,
+):
+    """Errors in the characteristic callback don't break message handling."""
+    manager = create_manager()
+
+    def on_characteristic_added(char: Any) -> None:
+        raise RuntimeError("callback failed")
+
+    manager._parse_msg(
+        device_added_signal(
+            DEVICE_PATH,
+            {
+                "Address": Variant("s", DEVICE_ADDRESS),
+                "Adapter": Variant("o", ADAPTER_PATH),
+                "Connected": Variant("b", True),
+                "ServicesResolved": Variant("b", False),
+            },
+        )
+    )
+    task = asyncio.create_task(
+        manager.get_services(
+            DEVICE_PATH, False, None, on_characteristic_added=on_characteristic_added
+        )
+    )
+    await asyncio.sleep(0)
+
+    manager._parse_msg(service_added_signal(f"{DEVICE_PATH}/service000a", 0x180F))
+    manager._parse_msg(
+        characteristic_added_signal(f"{DEVICE_PATH}/service000a/char000b", 0x2A19)
+    )
+    manager._parse_msg(
+        properties_changed_signal(
+            DEVICE_PATH,
+            defs.DEVICE_INTERFACE,
+            {"ServicesResolved": Variant("b", True)},
+        )
+    )
+    services = await asyncio.wait_for(task, timeout=1)
+
+    assert services.get_characteristic("2a19") is not None
+    assert "characteristic_discovered_callback failed" in caplog.text
+    caplog.clear()
+
+    # same for cached services
+    cached = await manager.get_services(
+        DEVICE_PATH, True, None, on_characteristic_added=on_characteristic_added
+    )
+    assert cached is services
+    assert "characteristic_discovered_callback failed" in caplog.text
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""Tests for `bleak.backends.bluezdbus.operation_queue` module."""
+
+import asyncio
+import sys
+
+import pytest
+
+if sys.platform != "linux":
+    pytest.skip("skipping linux-only tests", allow_module_level=True)
+    assert False  # HACK: work around pyright bug
+
+from bleak.backends.bluezdbus.operation_queue import GattOperationQueue
+
+
+async def test_operations_are_serialized_in_order():
+    queue = GattOperationQueue()
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def operation(name: str, key: str, priority: int = 0) -> None:
+        async with queue.acquire(key, priority):
+            order.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(operation("first", "a"))
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(operation("second", "a")),
+        asyncio.create_task(operation("third", "a")),
+        asyncio.create_task(operation("urgent", "a", priority=1)),
+        # other keys are independent
+        asyncio.create_task(operation("other", "b")),
+    ]
+    await asyncio.sleep(0)
+
+    assert order == ["first", "other"]
+
+    release.set()
+    await asyncio.gather(first, *tasks)
+
+    assert order == ["first", "other", "urgent", "second", "third"]
+    assert not queue._waiters
+
+
+async def test_cancelled_operation_is_skipped():
+    queue = GattOperationQueue()
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def operation(name: str) -> None:
+        async with queue.acquire("a"):
+            order.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(operation("first"))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(operation("cancelled"))
+    last = asyncio.create_task(operation("last"))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    release.set()
+    await asyncio.gather(first, last)
+
+    assert cancelled.cancelled()
+    assert order == ["first", "last"]
+    assert not queue._waiters
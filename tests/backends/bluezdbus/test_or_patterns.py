@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+"""Tests for `bleak.backends.bluezdbus.or_patterns` module."""
+
+import sys
+
+import pytest
+
+if sys.platform != "linux":
+    pytest.skip("skipping linux-only tests", allow_module_level=True)
+    assert False  # HACK: work around pyright bug
+
+from bleak.args.bluez import OrPattern
+from bleak.assigned_numbers import AdvertisementDataType
+from bleak.backends.bluezdbus.or_patterns import (
+    MAX_PATTERNS_PER_MONITOR,
+    compile_or_patterns,
+    get_ad_structures,
+    match_or_patterns,
+    parse_advertising_data,
+)
+
+# flags, complete list of 16-bit UUIDs (0x180F), complete local name "bleak",
+# manufacturer data for company 0x004C and service data for 0x180F
+RAW_AD = bytes.fromhex("020106" "03030f18" "0609626c65616b" "05ff4c000215" "04160f1864")
+
+PROPS = {
+    "Address": "11:22:33:44:55:66",
+    "AdvertisingFlags": b"\x06",
+    "UUIDs": ["0000180f-0000-1000-8000-00805f9b34fb"],
+    "Name": "bleak",
+    "ManufacturerData": {0x004C: b"\x02\x15"},
+    "ServiceData": {"0000180f-0000-1000-8000-00805f9b34fb": b"\x64"},
+}
+
+
+def test_parse_advertising_data():
+    """Raw advertising data is split into AD structures."""
+    assert parse_advertising_data(RAW_AD) == [
+        (0x01, b"\x06"),
+        (0x03, b"\x0f\x18"),
+        (0x09, b"bleak"),
+        (0xFF, b"\x4c\x00\x02\x15"),
+        (0x16, b"\x0f\x18\x64"),
+    ]
+
+    # truncated structure and zero padding are ignored
+    assert parse_advertising_data(b"\x02\x01\x06\x00\x00") == [(0x01, b"\x06")]
+    assert parse_advertising_data(b"\x02\x01\x06\x05\xff") == [(0x01, b"\x06")]
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        (OrPattern(0, AdvertisementDataType.COMPLETE_LOCAL_NAME, b"ble"), True),
+        (OrPattern(2, AdvertisementDataType.COMPLETE_LOCAL_NAME, b"eak"), True),
+        (OrPattern(1, AdvertisementDataType.COMPLETE_LOCAL_NAME, b"ble"), False),
+        (OrPattern(0, AdvertisementDataType.SHORTENED_LOCAL_NAME, b"ble"), False),
+        (
+            OrPattern(0, AdvertisementDataType.MANUFACTURER_SPECIFIC_DATA, b"\x4c\x00"),
+            True,
+        ),
+        (
+            OrPattern(2, AdvertisementDataType.MANUFACTURER_SPECIFIC_DATA, b"\x02\x15"),
+            True,
+        ),
+        (OrPattern(0, AdvertisementDataType.SERVICE_DATA_UUID16, b"\x0f\x18"), True),
+        (
+            OrPattern(
+                0, AdvertisementDataType.COMPLETE_LIST_SERVICE_UUID16, b"\x0f\x18"
+            ),
+            True,
+        ),
+        (OrPattern(0, AdvertisementDataType.FLAGS, b"\x06"), True),
+        (OrPattern(0, AdvertisementDataType.FLAGS, b"\x06\x00"), False),
+    ],
+)
+def test_match_or_patterns(pattern: OrPattern, expected: bool):
+    """Patterns match raw data and data reconstructed from D-Bus properties."""
+    assert match_or_patterns([pattern], parse_advertising_data(RAW_AD)) == expected
+
+    # BlueZ does not tell us if the name was shortened
+    if pattern.ad_data_type != AdvertisementDataType.SHORTENED_LOCAL_NAME:
+        assert match_or_patterns([pattern], get_ad_structures(PROPS)) == expected  # type: ignore
+
+
+def test_compile_or_patterns():
+    """Duplicate and redundant patterns are removed."""
+    name = AdvertisementDataType.COMPLETE_LOCAL_NAME
+
+    assert compile_or_patterns(
+        [
+            (0, name, b"bleak"),
+            OrPattern(0, name, b"bleak"),
+            OrPattern(0, name, b"ble"),
+            OrPattern(1, name, b"le"),
+            OrPattern(0, AdvertisementDataType.SHORTENED_LOCAL_NAME, b"ble"),
+        ]
+    ) == [
+        [
+            OrPattern(1, name, b"le"),
+            OrPattern(0, AdvertisementDataType.SHORTENED_LOCAL_NAME, b"ble"),
+        ]
+    ]
+
+
+def test_compile_or_patterns_split():
+    """Patterns are split between monitors."""
+    patterns = [
+        OrPattern(0, AdvertisementDataType.MANUFACTURER_SPECIFIC_DATA, bytes([i, 0]))
+        for i in range(MAX_PATTERNS_PER_MONITOR + 1)
+    ]
+
+    assert compile_or_patterns(patterns) == [
+        patterns[:MAX_PATTERNS_PER_MONITOR],
+        patterns[MAX_PATTERNS_PER_MONITOR:],
+    ]
+
+
+def test_compile_or_patterns_invalid():
+    """Patterns that don't fit in advertising data are rejected."""
+    with pytest.raises(ValueError):
+        compile_or_patterns(
+            [OrPattern(30, AdvertisementDataType.COMPLETE_LOCAL_NAME, b"ab")]
+        )
+
+    with pytest.raises(ValueError):
+        compile_or_patterns([OrPattern(0, AdvertisementDataType.FLAGS, b"")])
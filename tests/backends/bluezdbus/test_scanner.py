@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+
+"""Tests for `bleak.backends.bluezdbus.scanner` package."""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+if sys.platform != "linux":
+    pytest.skip("skipping linux-only tests", allow_module_level=True)
+    assert False  # HACK: work around pyright bug
+
+from bleak.args.bluez import OrPattern
+from bleak.assigned_numbers import AdvertisementDataType
+from bleak.backends.bluezdbus import scanner as scanner_module
+from bleak.backends.bluezdbus.scanner import BleakScannerBlueZDBus, get_active_scanner
+from bleak.registry import DeviceRegistry
+from bleak.uuids import normalize_uuid_16
+
+ADAPTER_PATH = "/org/bluez/hci0"
+DEVICE_ADDRESS = "11:22:33:44:55:66"
+DEVICE_PATH = f"{ADAPTER_PATH}/dev_11_22_33_44_55_66"
+OR_PATTERNS = [OrPattern(0, AdvertisementDataType.COMPLETE_LOCAL_NAME, b"test")]
+
+
+class FakeManager:
+    """Stand-in for :class:`BlueZManager` that does not need D-Bus."""
+
+    def __init__(self) -> None:
+        self.advertisement_monitor = True
+        self.scans: list[str] = []
+        self.scan_args: tuple[Any, ...] = ()
+
+    def get_default_adapter(self) -> str:
+        return ADAPTER_PATH
+
+    def supports_advertisement_monitor(self, adapter_path: str) -> bool:
+        return self.advertisement_monitor
+
+    async def passive_scan(self, *args: Any, **kwargs: Any):
+        self.scans.append("passive")
+        self.scan_args = args
+        return await self._scan()
+
+    async def active_scan(self, *args: Any, **kwargs: Any):
+        self.scans.append("active")
+        return await self._scan()
+
+    async def _scan(self):
+        async def stop() -> None:
+            pass
+
+        return stop
+
+
+@pytest.fixture(autouse=True)
+def fake_manager(monkeypatch: pytest.MonkeyPatch) -> FakeManager:
+    manager = FakeManager()
+
+    async def get_global_bluez_manager() -> FakeManager:
+        return manager
+
+    monkeypatch.setattr(
+        scanner_module, "get_global_bluez_manager", get_global_bluez_manager
+    )
+
+    return manager
+
+
+async def test_active_scanner_registry():
+    """Running scanners without filters can be found by adapter path."""
+    scanner = BleakScannerBlueZDBus(None, None, "active", bluez={})
+    filtered_scanner = BleakScannerBlueZDBus(
+        None, ["0000180f-0000-1000-8000-00805f9b34fb"], "active", bluez={}
+    )
+
+    await filtered_scanner.start()
+    assert get_active_scanner(ADAPTER_PATH) is None
+
+    await scanner.start()
+    assert get_active_scanner(ADAPTER_PATH) is scanner
+    assert get_active_scanner("/org/bluez/hci1") is None
+
+    await scanner.stop()
+    await filtered_scanner.stop()
+    assert get_active_scanner(ADAPTER_PATH) is None
+
+
+async def test_active_scanner_registry_discoverable():
+    """Scanners that only report discoverable devices are not used."""
+    scanner = BleakScannerBlueZDBus(
+        None, None, "active", bluez={"filters": {"Discoverable": True}}
+    )
+
+    await scanner.start()
+    assert get_active_scanner(ADAPTER_PATH) is None
+    await scanner.stop()
+
+    scanner = BleakScannerBlueZDBus(
+        None, None, "active", bluez={"filters": {"Discoverable": False}}
+    )
+
+    await scanner.start()
+    assert get_active_scanner(ADAPTER_PATH) is scanner
+    await scanner.stop()
+
+
+async def test_registry(tmp_path: Path):
+    """Advertisements are recorded and the device can be looked up later."""
+    registry = DeviceRegistry(tmp_path / "devices.db")
+    scanner = BleakScannerBlueZDBus(None, None, "active", bluez={"registry": registry})
+
+    scanner._handle_advertising_data(
+        DEVICE_PATH,
+        {
+            "Address": DEVICE_ADDRESS,
+            "AddressType": "random",
+            "Adapter": ADAPTER_PATH,
+            "Alias": "test",
+            "Name": "test",
+            "RSSI": -50,
+        },  # type: ignore
+    )
+
+    record = registry.get(DEVICE_ADDRESS)
+    assert record is not None
+    assert record.address_type == "random"
+    assert record.device_path == DEVICE_PATH
+    assert record.advertisement is not None
+    assert record.advertisement.rssi == -50
+
+    scanner = BleakScannerBlueZDBus(None, None, "active", bluez={"registry": registry})
+    device = scanner.get_cached_device(DEVICE_ADDRESS.lower())
+    assert device is not None
+    assert device.name == "test"
+    assert device.details["path"] == DEVICE_PATH
+    assert device.details["props"]["AddressType"] == "random"
+    assert device.details["props"]["Adapter"] == ADAPTER_PATH
+
+    scanner = BleakScannerBlueZDBus(
+        None, None, "active", bluez={"adapter": "hci1", "registry": registry}
+    )
+    assert scanner.get_cached_device(DEVICE_ADDRESS) is None
+
+    await registry.close()
+
+
+def test_software_filters():
+    """Advertisements not matching the scanner's own filters are dropped."""
+    scanner = BleakScannerBlueZDBus(
+        None,
+        None,
+        "active",
+        bluez={"filters": {"RSSI": -70, "Pattern": "11:22"}},
+    )
+    props: dict[str, Any] = {
+        "Address": DEVICE_ADDRESS,
+        "Adapter": ADAPTER_PATH,
+        "Alias": "test",
+    }
+
+    scanner._handle_advertising_data(DEVICE_PATH, {**props, "RSSI": -80})  # type: ignore
+    assert not scanner.seen_devices
+
+    scanner._handle_advertising_data(
+        "/org/bluez/hci0/dev_AA_22_33_44_55_66",
+        {**props, "Address": "AA:22:33:44:55:66", "RSSI": -50},  # type: ignore
+    )
+    assert not scanner.seen_devices
+
+    scanner._handle_advertising_data(DEVICE_PATH, {**props, "RSSI": -50})  # type: ignore
+    assert list(scanner.seen_devices) == [DEVICE_PATH]
+
+
+def test_software_filters_short_uuid():
+    """Filter UUIDs can be given in the short form like for BlueZ."""
+    scanner = BleakScannerBlueZDBus(
+        None, None, "active", bluez={"filters": {"UUIDs": ["180D"]}}
+    )
+    props: dict[str, Any] = {
+        "Address": DEVICE_ADDRESS,
+        "Adapter": ADAPTER_PATH,
+        "Alias": "test",
+    }
+
+    scanner._handle_advertising_data(  # type: ignore
+        DEVICE_PATH, {**props, "UUIDs": [normalize_uuid_16(0x180F)]}
+    )
+    assert not scanner.seen_devices
+
+    scanner._handle_advertising_data(  # type: ignore
+        DEVICE_PATH, {**props, "UUIDs": [normalize_uuid_16(0x180D)]}
+    )
+    assert list(scanner.seen_devices) == [DEVICE_PATH]
+
+
+def test_receive_timestamps():
+    scanner = BleakScannerBlueZDBus(None, None, "active", bluez={})
+    props: dict[str, Any] = {
+        "Address": DEVICE_ADDRESS,
+        "Adapter": ADAPTER_PATH,
+        "Alias": "test",
+    }
+
+    scanner._handle_advertising_data(DEVICE_PATH, props)  # type: ignore
+    _, adv = scanner.seen_devices[DEVICE_PATH]
+    assert adv.timestamp is None
+
+    scanner.receive_timestamps = True
+    before = time.monotonic_ns()
+    scanner._handle_advertising_data(DEVICE_PATH, props)  # type: ignore
+    _, adv = scanner.seen_devices[DEVICE_PATH]
+    assert adv.timestamp is not None
+    assert before <= adv.timestamp <= time.monotonic_ns()
+
+
+def test_monitor_rssi_validation():
+    """Out of range advertisement monitor RSSI parameters are rejected."""
+    with pytest.raises(ValueError):
+        BleakScannerBlueZDBus(
+            None,
+            None,
+            "passive",
+            bluez={"or_patterns": OR_PATTERNS, "monitor_rssi": {"RSSIHighTimeout": 0}},
+        )
+
+    with pytest.raises(ValueError):
+        BleakScannerBlueZDBus(
+            None,
+            None,
+            "passive",
+            bluez={
+                "or_patterns": OR_PATTERNS,
+                "monitor_rssi": {"RSSIHighThreshold": -80, "RSSILowThreshold": -70},
+            },
+        )
+
+
+async def test_monitor_rssi_software_filter(fake_manager: FakeManager):
+    """RSSI thresholds are applied with hysteresis if not done by BlueZ."""
+    fake_manager.advertisement_monitor = False
+    scanner = BleakScannerBlueZDBus(
+        None,
+        None,
+        "passive",
+        bluez={
+            "or_patterns": OR_PATTERNS,
+            "monitor_rssi": {"RSSIHighThreshold": -60, "RSSILowThreshold": -80},
+        },
+    )
+    props: dict[str, Any] = {
+        "Address": DEVICE_ADDRESS,
+        "Adapter": ADAPTER_PATH,
+        "Alias": "test",
+        "Name": "test",
+    }
+    received: list[int] = []
+    scanner.register_detection_callback(lambda d, ad: received.append(ad.rssi))
+
+    await scanner.start()
+
+    for rssi in [-70, -50, -70, -85, -70, -60]:
+        scanner._handle_advertising_data(DEVICE_PATH, {**props, "RSSI": rssi})  # type: ignore
+
+    assert received == [-50, -70, -60]
+
+    await scanner.stop()
+
+
+async def test_monitor_rssi_rejected(fake_manager: FakeManager):
+    """RSSI thresholds are only applied in software if BlueZ rejected them."""
+    scanner = BleakScannerBlueZDBus(
+        None,
+        None,
+        "passive",
+        bluez={
+            "or_patterns": OR_PATTERNS,
+            "monitor_rssi": {"RSSIHighThreshold": -60, "RSSILowThreshold": -80},
+        },
+    )
+    props: dict[str, Any] = {
+        "Address": DEVICE_ADDRESS,
+        "Adapter": ADAPTER_PATH,
+        "Alias": "test",
+    }
+    received: list[int] = []
+    scanner.register_detection_callback(lambda d, ad: received.append(ad.rssi))
+
+    await scanner.start()
+    assert fake_manager.scans == ["passive"]
+
+    # BlueZ already filters by RSSI
+    scanner._handle_advertising_data(DEVICE_PATH, {**props, "RSSI": -70})  # type: ignore
+    assert received == [-70]
+
+    rssi_rejected_callback = fake_manager.scan_args[5]
+    rssi_rejected_callback()
+
+    for rssi in [-70, -50, -85]:
+        scanner._handle_advertising_data(DEVICE_PATH, {**props, "RSSI": rssi})  # type: ignore
+
+    assert received == [-70, -50]
+
+    await scanner.stop()
+
+
+async def test_passive_scan_fallback(fake_manager: FakeManager):
+    """Without advertisement monitors, or-patterns are matched in software."""
+    fake_manager.advertisement_monitor = False
+    scanner = BleakScannerBlueZDBus(
+        None, None, "passive", bluez={"or_patterns": OR_PATTERNS}
+    )
+    props: dict[str, Any] = {
+        "Address": DEVICE_ADDRESS,
+        "Adapter": ADAPTER_PATH,
+        "Alias": "test",
+    }
+
+    await scanner.start()
+    assert fake_manager.scans == ["active"]
+
+    scanner._handle_advertising_data(DEVICE_PATH, {**props, "Name": "other"})  # type: ignore
+    assert not scanner.seen_devices
+
+    scanner._handle_advertising_data(DEVICE_PATH, {**props, "Name": "test"})  # type: ignore
+    assert list(scanner.seen_devices) == [DEVICE_PATH]
+
+    await scanner.stop()
@@ -0,0 +1,152 @@
+"""Tests for `bleak.backends.service` module."""
+
+from uuid import UUID
+
+import pytest
+
+from bleak.backends.characteristic import (
+    BleakGATTCharacteristic,
+    GattCharacteristicsFlags,
+)
+from bleak.backends.descriptor import BleakGATTDescriptor
+from bleak.backends.service import BleakGATTService, BleakGATTServiceCollection
+from bleak.exc import BleakError
+from bleak.uuids import normalize_uuid_16
+
+
+def _create_collection() -> BleakGATTServiceCollection:
+    collection = BleakGATTServiceCollection()
+
+    for service_handle, service_uuid in [(1, 0x180D), (10, 0x180F), (20, 0x180F)]:
+        service = BleakGATTService(
+            None, service_handle, normalize_uuid_16(service_uuid)
+        )
+        collection.add_service(service)
+
+        for offset, char_uuid in [(1, 0x2A37), (4, 0x2A38)]:
+            char = BleakGATTCharacteristic(
+                None,
+                service_handle + offset,
+                normalize_uuid_16(char_uuid + service_handle),
+                ["read", "notify"],
+                lambda: 20,
+                service,
+            )
+            collection.add_characteristic(char)
+            collection.add_descriptor(
+                BleakGATTDescriptor(
+                    None, service_handle + offset + 1, normalize_uuid_16(0x2902), char
+                )
+            )
+
+    return collection
+
+
+def test_get_service_by_uuid():
+    collection = _create_collection()
+
+    service = collection.get_service("180d")
+    assert service is not None
+    assert service.handle == 1
+    assert collection.get_service(normalize_uuid_16(0x180D)) is service
+    assert collection.get_service(UUID(normalize_uuid_16(0x180D))) is service
+    assert collection.get_service("180a") is None
+
+    with pytest.raises(BleakError):
+        collection.get_service("180F")
+
+
+def test_get_characteristic_by_uuid():
+    collection = _create_collection()
+
+    char = collection.get_characteristic("2A39")
+    assert char is not None
+    assert char.handle == 5
+    assert collection.get_characteristic(normalize_uuid_16(0x2A39)) is char
+    assert collection.get_characteristic("2a36") is None
+
+    service = collection.get_service(1)
+    assert service is not None
+    assert service.get_characteristic("2a39") is char
+    assert service.get_characteristic("2a43") is None
+
+    descriptor = char.get_descriptor("2902")
+    assert descriptor is not None
+    assert descriptor.handle == 6
+    assert char.get_descriptor(normalize_uuid_16(0x2902)) is descriptor
+    assert char.get_descriptor("2901") is None
+
+
+def test_characteristic_properties():
+    service = BleakGATTService(None, 1, normalize_uuid_16(0x180D))
+    char = BleakGATTCharacteristic(
+        None,
+        2,
+        normalize_uuid_16(0x2A37),
+        ["notify", "encrypt-read", "read", "x-unknown"],  # type: ignore
+        lambda: 20,
+        service,
+    )
+
+    assert char.property_flags & GattCharacteristicsFlags.read.value
+    assert char.property_flags & GattCharacteristicsFlags.notify.value
+    assert not char.property_flags & GattCharacteristicsFlags.write.value
+    # only "encrypt-read", unknown properties don't have a bit
+    assert char.property_flags >> 16 == 1
+
+    # same order as given by the backend
+    assert char.properties == ["notify", "encrypt-read", "read", "x-unknown"]
+
+
+def test_share_indexes():
+    collection1 = _create_collection()
+    collection2 = _create_collection()
+
+    collection1.share_indexes()
+    collection2.share_indexes()
+
+    char1 = collection1.get_characteristic(5)
+    char2 = collection2.get_characteristic(5)
+    assert char1 is not None and char2 is not None
+    assert char1._descriptor_handles is char2._descriptor_handles
+
+    # adding after sharing must not change the other collection
+    collection1.add_descriptor(
+        BleakGATTDescriptor(None, 7, normalize_uuid_16(0x2901), char1)
+    )
+    assert char1.get_descriptor("2901") is not None
+    assert char2.get_descriptor("2901") is None
+
+    assert collection1.get_characteristic("2A39") is char1
+    assert collection2.get_characteristic("2A39") is char2
+
+
+def test_remove():
+    collection = _create_collection()
+    collection.share_indexes()
+    other = _create_collection()
+    other.share_indexes()
+
+    collection.remove_descriptor(3)
+    char = collection.get_characteristic(2)
+    assert char is not None
+    assert char.get_descriptor("2902") is None
+    assert collection.get_descriptor(3) is None
+
+    collection.remove_characteristic(5)
+    assert collection.get_characteristic("2a39") is None
+    assert collection.get_descriptor(6) is None
+    service = collection.get_service(1)
+    assert service is not None
+    assert service.get_characteristic("2a39") is None
+
+    # UUID is no longer ambiguous
+    collection.remove_service(20)
+    assert collection.get_service("180f") is collection.get_service(10)
+    assert 21 not in collection.characteristics
+    assert 22 not in collection.descriptors
+
+    # shared indexes of other collections are not changed
+    assert other.get_characteristic("2a39") is other.get_characteristic(5)
+    with pytest.raises(BleakError):
+        other.get_service("180f")
@@ -371,3 +371,21 @@ async def test_indicate_gatt_char(char_test_peripheral: CharTestPeripheral):
     # Verify no indication was received after stop
     with pytest.raises(asyncio.TimeoutError):
         await asyncio.wait_for(indicated_data.get(), timeout=1)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_bind(char_test_peripheral: CharTestPeripheral):
+    """I/O is possible on a bound characteristic."""
+
+    read_char = char_test_peripheral.bleak_client.bind(READ_CHAR_UUID)
+    assert read_char.characteristic.uuid.lower() == READ_CHAR_UUID
+
+    char_test_peripheral.read_characteristic.value = b"DATA"
+    assert await read_char.read() == b"DATA"
+
+    write_char = char_test_peripheral.bleak_client.bind(WRITE_WITH_RESPONSE_CHAR_UUID)
+
+    # response defaults to the "write" property, like write_gatt_char()
+    char_test_peripheral.write_characteristic.value = b"----"
+    await write_char.write(b"DATA")
+    assert char_test_peripheral.write_characteristic.value == b"DATA"
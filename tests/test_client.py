@@ -0,0 +1,301 @@
+"""Tests for :class:`bleak.BleakClient` using a fake backend."""
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from bleak import BleakClient, NotificationStream
+from bleak.args import SizedBuffer
+from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.client import BaseBleakClient, NotifyCallback
+from bleak.backends.descriptor import BleakGATTDescriptor
+from bleak.backends.service import BleakGATTService, BleakGATTServiceCollection
+from bleak.exc import (
+    BleakCharacteristicNotFoundError,
+    BleakError,
+    BleakGATTProtocolError,
+    BleakGATTProtocolErrorCode,
+)
+from bleak.uuids import normalize_uuid_16
+
+NOTIFY_CHAR_UUID = normalize_uuid_16(0x2A37)
+
+
+class FakeClient(BaseBleakClient):
+    """Client backend with a single characteristic that can notify."""
+
+    def __init__(self, address_or_ble_device: Any, **kwargs: Any):
+        super().__init__(address_or_ble_device, **kwargs)
+        self._connected = False
+        self.notify_callbacks: dict[int, NotifyCallback] = {}
+        self.values: dict[int, bytearray] = {}
+
+    @property
+    def mtu_size(self) -> int:
+        return 23
+
+    async def connect(self, pair: bool, **kwargs: Any) -> None:
+        services = BleakGATTServiceCollection()
+        service = BleakGATTService(None, 1, normalize_uuid_16(0x180D))
+        services.add_service(service)
+        services.add_characteristic(
+            BleakGATTCharacteristic(
+                None, 2, NOTIFY_CHAR_UUID, ["notify"], lambda: 20, service
+            )
+        )
+        self.services = services
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        if not self._connected:
+            return
+
+        self._connected = False
+        self.notify_callbacks.clear()
+
+        if self._disconnected_callback:
+            self._disconnected_callback()
+
+    async def pair(self, *args: Any, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    async def unpair(self) -> None:
+        raise NotImplementedError
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def read_gatt_char(
+        self, characteristic: BleakGATTCharacteristic, **kwargs: Any
+    ) -> bytearray:
+        if characteristic.handle not in self.values:
+            raise BleakGATTProtocolError(BleakGATTProtocolErrorCode.READ_NOT_PERMITTED)
+
+        return self.values[characteristic.handle]
+
+    async def read_gatt_descriptor(
+        self, descriptor: BleakGATTDescriptor, **kwargs: Any
+    ) -> bytearray:
+        raise NotImplementedError
+
+    async def write_gatt_char(
+        self, characteristic: BleakGATTCharacteristic, data: SizedBuffer, response: bool
+    ) -> None:
+        self.values[characteristic.handle] = bytearray(data)
+
+    async def write_gatt_descriptor(
+        self, descriptor: BleakGATTDescriptor, data: SizedBuffer
+    ) -> None:
+        raise NotImplementedError
+
+    async def start_notify(
+        self,
+        characteristic: BleakGATTCharacteristic,
+        callback: NotifyCallback,
+        **kwargs: Any,
+    ) -> None:
+        self.notify_callbacks[characteristic.handle] = callback
+
+    async def stop_notify(self, characteristic: BleakGATTCharacteristic) -> None:
+        del self.notify_callbacks[characteristic.handle]
+
+
+async def test_notifications():
+    disconnected: list[BleakClient] = []
+
+    async with BleakClient(
+        "00:11:22:33:44:55", disconnected.append, backend=FakeClient
+    ) as client:
+        backend: FakeClient = client._backend  # type: ignore
+
+        async with client.notifications(NOTIFY_CHAR_UUID) as stream:
+            notify = backend.notify_callbacks[2]
+            notify(bytearray(b"1"))
+            notify(bytearray(b"2"))
+
+            received: list[bytes] = []
+
+            async for timestamp, data in stream:
+                assert timestamp > 0
+                received.append(bytes(data))
+
+                if len(received) == 2:
+                    break
+
+            assert received == [b"1", b"2"]
+
+        # notifications are stopped on exit
+        assert not backend.notify_callbacks
+
+        async with client.notifications(NOTIFY_CHAR_UUID) as stream:
+            backend.notify_callbacks[2](bytearray(b"3"))
+            await client.disconnect()
+
+            # buffered notifications are still received, then iteration ends
+            assert [bytes(data) async for _, data in stream] == [b"3"]
+
+    assert disconnected == [client]
+
+
+async def test_notifications_stop_failed():
+    """Failing to stop notifications doesn't hide errors in the context."""
+    async with BleakClient("00:11:22:33:44:55", backend=FakeClient) as client:
+        backend: FakeClient = client._backend  # type: ignore
+
+        async def stop_notify(characteristic: BleakGATTCharacteristic) -> None:
+            raise BleakError("Not connected")
+
+        backend.stop_notify = stop_notify  # type: ignore
+
+        with pytest.raises(ZeroDivisionError):
+            async with client.notifications(NOTIFY_CHAR_UUID):
+                1 / 0
+
+
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        ("drop-oldest", [b"2", b"3"]),
+        ("drop-newest", [b"0", b"1"]),
+        ("latest", [b"3"]),
+    ],
+)
+async def test_notification_stream_overflow(policy: Any, expected: list[bytes]):
+    stream = NotificationStream(2, policy)
+
+    for i in range(4):
+        stream._put(bytearray(str(i).encode()), i)
+
+    stream._close()
+
+    assert [bytes(data) async for _, data in stream] == expected
+    assert stream.dropped == 4 - len(expected)
+
+
+async def test_notification_stream_waits():
+    stream = NotificationStream(1, "drop-oldest")
+
+    task = asyncio.create_task(stream.__anext__())
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    stream._put(bytearray(b"1"), 1)
+    _, data = await task
+    assert data == b"1"
+
+
+async def test_notification_stream_concurrent_iteration():
+    stream = NotificationStream(1, "drop-oldest")
+
+    task = asyncio.create_task(stream.__anext__())
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError):
+        await stream.__anext__()
+
+    stream._put(bytearray(b"1"), 1)
+    _, data = await task
+    assert data == b"1"
+
+
+def test_notification_stream_invalid_args():
+    with pytest.raises(ValueError):
+        NotificationStream(0, "drop-oldest")
+
+    with pytest.raises(ValueError):
+        NotificationStream(1, "block")  # type: ignore
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+async def test_batched_notifications(is_async: bool):
+    batches: list[list[bytes]] = []
+
+    def on_batch(sender: BleakGATTCharacteristic, batch: list[Any]) -> None:
+        assert sender.uuid == NOTIFY_CHAR_UUID
+        assert all(timestamp > 0 for timestamp, _ in batch)
+        batches.append([bytes(data) for _, data in batch])
+
+    async def on_batch_async(sender: BleakGATTCharacteristic, batch: list[Any]):
+        on_batch(sender, batch)
+
+    async with BleakClient("00:11:22:33:44:55", backend=FakeClient) as client:
+        backend: FakeClient = client._backend  # type: ignore
+
+        await client.start_notify(
+            NOTIFY_CHAR_UUID, on_batch_async if is_async else on_batch, batch=True
+        )
+        notify = backend.notify_callbacks[2]
+
+        # notifications received in the same event loop iteration are batched
+        notify(bytearray(b"1"))
+        notify(bytearray(b"2"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert batches == [[b"1", b"2"]]
+
+        notify(bytearray(b"3"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert batches == [[b"1", b"2"], [b"3"]]
+
+        with pytest.raises(ValueError):
+            await client.start_notify(
+                NOTIFY_CHAR_UUID,
+                on_batch,
+                batch=True,
+                bluez={"value_type": "memoryview"},
+            )
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+async def test_notification_timestamps(is_async: bool):
+    received: list[tuple[bytes, int]] = []
+
+    def on_notify(sender: BleakGATTCharacteristic, data: bytearray, timestamp: int):
+        received.append((bytes(data), timestamp))
+
+    async def on_notify_async(
+        sender: BleakGATTCharacteristic, data: bytearray, timestamp: int
+    ):
+        on_notify(sender, data, timestamp)
+
+    async with BleakClient("00:11:22:33:44:55", backend=FakeClient) as client:
+        backend: FakeClient = client._backend  # type: ignore
+
+        await client.start_notify(
+            NOTIFY_CHAR_UUID,
+            on_notify_async if is_async else on_notify,
+            timestamps=True,
+        )
+
+        before = time.monotonic_ns()
+        backend.notify_callbacks[2](bytearray(b"1"))
+        await asyncio.sleep(0)
+
+        ((data, timestamp),) = received
+        assert data == b"1"
+        assert before <= timestamp <= time.monotonic_ns()
+
+
+async def test_bulk_read_and_write():
+    async with BleakClient("00:11:22:33:44:55", backend=FakeClient) as client:
+        unknown_uuid = normalize_uuid_16(0x2A38)
+
+        errors = await client.write_gatt_chars(
+            [(NOTIFY_CHAR_UUID, b"1", False), (unknown_uuid, b"2", False)]
+        )
+        assert errors[0] is None
+        assert isinstance(errors[1], BleakCharacteristicNotFoundError)
+
+        results = await client.read_gatt_chars([unknown_uuid, 2, NOTIFY_CHAR_UUID])
+        assert isinstance(results[0], BleakCharacteristicNotFoundError)
+        assert results[1:] == [b"1", b"1"]
+
+        backend: FakeClient = client._backend  # type: ignore
+        backend.values.clear()
+
+        (result,) = await client.read_gatt_chars([2])
+        assert isinstance(result, BleakGATTProtocolError)
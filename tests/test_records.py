@@ -0,0 +1,104 @@
+"""Tests for `bleak.records` module."""
+
+import asyncio
+import struct
+
+import pytest
+
+from bleak.records import RecordBuffer
+
+
+def test_struct_records():
+    buffer = RecordBuffer("<hhhI", capacity=4)
+    assert buffer.record_size == 10
+
+    records = [(i, -i, 2 * i, 1000 * i) for i in range(3)]
+    data = b"".join(struct.pack("<hhhI", *r) for r in records)
+
+    # records can be split over notifications
+    buffer.feed(data[:7])
+    assert len(buffer) == 0
+    buffer.feed(data[7:25])
+    assert len(buffer) == 2
+    buffer.feed(data[25:])
+
+    assert buffer.read_nowait(max_records=1) == records[:1]
+    assert buffer.read_nowait() == records[1:]
+    assert buffer.read_nowait() == []
+    assert buffer.dropped == 0
+
+
+def test_overflow_drops_oldest_records():
+    buffer = RecordBuffer(struct.Struct("<B"), capacity=3)
+
+    buffer.feed(b"\x01\x02")
+    buffer.feed(b"\x03\x04")
+    assert buffer.read_nowait() == [(2,), (3,), (4,)]
+    assert buffer.dropped == 1
+
+    # larger than the whole buffer, wrapping around the end
+    buffer.feed(b"\x05\x06\x07\x08\x09")
+    assert buffer.read_nowait() == [(7,), (8,), (9,)]
+    assert buffer.dropped == 3
+
+
+async def test_read_waits_for_records():
+    buffer = RecordBuffer("<H", capacity=8)
+
+    task = asyncio.create_task(buffer.read(2))
+    buffer.feed(b"\x01\x00")
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    buffer(None, bytearray(b"\x02\x00\x03\x00"))  # type: ignore
+    assert await task == [(1,), (2,), (3,)]
+
+    with pytest.raises(ValueError):
+        await buffer.read(9)
+
+
+def test_numpy_records():
+    numpy = pytest.importorskip("numpy")
+
+    dtype = numpy.dtype([("xyz", "<i2", 3), ("time", "<u4")])
+    buffer = RecordBuffer(dtype, capacity=2)
+
+    buffer.feed(struct.pack("<hhhI", 1, 2, 3, 100))
+    buffer.feed(struct.pack("<hhhIhhhI", 4, 5, 6, 200, 7, 8, 9, 300))
+
+    records = buffer.read_nowait()
+    assert records.dtype == dtype
+    assert records["xyz"].tolist() == [[4, 5, 6], [7, 8, 9]]
+    assert records["time"].tolist() == [200, 300]
+    assert buffer.dropped == 1
+
+
+def test_whole_records_per_notification():
+    buffer = RecordBuffer("<H", split_records=False)
+
+    # the incomplete record is discarded and does not shift later records
+    buffer.feed(b"\x01\x00\x02")
+    buffer.feed(b"\x03\x00")
+
+    assert buffer.read_nowait() == [(1,), (3,)]
+    assert buffer.dropped == 1
+
+
+def test_clear():
+    buffer = RecordBuffer("<H")
+
+    buffer.feed(b"\x01\x00\x02")
+    buffer.clear()
+    assert len(buffer) == 0
+
+    # resynchronized after a notification of the wrong length
+    buffer.feed(b"\x03\x00")
+    assert buffer.read_nowait() == [(3,)]
+
+
+def test_invalid_args():
+    with pytest.raises(ValueError):
+        RecordBuffer("<H", capacity=0)
+
+    with pytest.raises(ValueError):
+        RecordBuffer("")
@@ -0,0 +1,128 @@
+"""Tests for :mod:`bleak.registry`."""
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from bleak.backends.scanner import AdvertisementData
+from bleak.registry import (
+    CharacteristicRecord,
+    DescriptorRecord,
+    DeviceRecord,
+    DeviceRegistry,
+    ServiceRecord,
+)
+
+ADDRESS = "11:22:33:44:55:66"
+
+
+async def test_registry_round_trip(tmp_path: Path):
+    """Records are written to the file and loaded again."""
+    adv = AdvertisementData(
+        "test",
+        {0x1234: b"\x01\x02"},
+        {"0000180f-0000-1000-8000-00805f9b34fb": b"\x64"},
+        ["0000180f-0000-1000-8000-00805f9b34fb"],
+        4,
+        -60,
+        (),
+        None,
+    )
+    record = DeviceRecord(
+        ADDRESS,
+        "test",
+        1234.5,
+        adv,
+        "random",
+        "/org/bluez/hci0",
+        "/org/bluez/hci0/dev_11_22_33_44_55_66",
+        b"\x00" * 16,
+        (
+            ServiceRecord(
+                1,
+                "0000180f-0000-1000-8000-00805f9b34fb",
+                (
+                    CharacteristicRecord(
+                        2,
+                        "00002a19-0000-1000-8000-00805f9b34fb",
+                        ("read", "notify"),
+                        (DescriptorRecord(4, "00002902-0000-1000-8000-00805f9b34fb"),),
+                    ),
+                ),
+            ),
+        ),
+    )
+
+    registry = DeviceRegistry(tmp_path / "devices.db")
+    registry.update(record)
+    await registry.close()
+
+    registry = DeviceRegistry(tmp_path / "devices.db")
+
+    assert registry.get(ADDRESS) == record
+    assert registry.get(ADDRESS.lower()) == record
+    assert registry.get("00:00:00:00:00:00") is None
+
+    await registry.close()
+
+
+async def test_registry_background_flush(tmp_path: Path):
+    """Updates are written to the file after ``flush_interval``."""
+    registry = DeviceRegistry(tmp_path / "devices.db", flush_interval=0.01)
+    registry.update(DeviceRecord(ADDRESS, None, 0.0))
+
+    await asyncio.sleep(0.1)
+
+    other = DeviceRegistry(tmp_path / "devices.db")
+    assert other.get(ADDRESS) == DeviceRecord(ADDRESS, None, 0.0)
+
+    await other.close()
+    await registry.close()
+
+
+async def test_registry_close_waits_for_background_flush(tmp_path: Path):
+    """Closing while a background write is in progress does not lose it."""
+    registry = DeviceRegistry(tmp_path / "devices.db", flush_interval=0)
+    write = registry._write
+
+    def slow_write(rows: list[tuple[str, str]]) -> None:
+        time.sleep(0.1)
+        write(rows)
+
+    registry._write = slow_write  # type: ignore
+    registry.update(DeviceRecord(ADDRESS, None, 0.0))
+
+    # let the write start in the worker thread
+    await asyncio.sleep(0.01)
+    assert registry._flush_task is not None
+
+    await registry.close()
+
+    other = DeviceRegistry(tmp_path / "devices.db")
+    assert other.get(ADDRESS) == DeviceRecord(ADDRESS, None, 0.0)
+    await other.close()
+
+
+async def test_registry_failed_flush_is_retried(tmp_path: Path):
+    """Updates are kept if writing them fails."""
+    registry = DeviceRegistry(tmp_path / "devices.db")
+    write = registry._write
+
+    def failing_write(rows: list[tuple[str, str]]) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    registry._write = failing_write  # type: ignore
+    registry.update(DeviceRecord(ADDRESS, None, 0.0))
+
+    with pytest.raises(sqlite3.OperationalError):
+        await registry.flush()
+
+    registry._write = write  # type: ignore
+    await registry.close()
+
+    other = DeviceRegistry(tmp_path / "devices.db")
+    assert other.get(ADDRESS) == DeviceRecord(ADDRESS, None, 0.0)
+    await other.close()
@@ -0,0 +1,191 @@
+"""Tests for :class:`bleak.BleakScanner` using a fake backend."""
+
+import asyncio
+import time
+from typing import Any, Literal, Optional
+
+from bleak import BleakScanner
+from bleak.backends.scanner import (
+    AdvertisementData,
+    AdvertisementDataCallback,
+    BaseBleakScanner,
+)
+
+# list of (delay, address, local name) that the fake backend will "receive"
+_ADVERTISEMENTS: list[tuple[float, str, Optional[str]]] = []
+
+
+class FakeScanner(BaseBleakScanner):
+    """Scanner backend that replays :data:`_ADVERTISEMENTS` when started."""
+
+    def __init__(
+        self,
+        detection_callback: Optional[AdvertisementDataCallback],
+        service_uuids: Optional[list[str]],
+        scanning_mode: Literal["active", "passive"],
+        **kwargs: Any,
+    ):
+        super().__init__(detection_callback, service_uuids)
+        self._handles: list[asyncio.TimerHandle] = []
+
+    async def start(self) -> None:
+        self.seen_devices = {}
+        loop = asyncio.get_running_loop()
+
+        for delay, address, name in _ADVERTISEMENTS:
+            self._handles.append(
+                loop.call_later(delay, self._on_advertisement, address, name)
+            )
+
+    async def stop(self) -> None:
+        for handle in self._handles:
+            handle.cancel()
+
+        self._handles.clear()
+
+    def _on_advertisement(self, address: str, name: Optional[str]) -> None:
+        timestamp = time.monotonic_ns() if self.receive_timestamps else None
+        adv = AdvertisementData(name, {}, {}, [], None, -50, (), timestamp)
+        device = self.create_or_update_device(address, address, name, None, adv)
+        self.call_detection_callbacks(device, adv)
+
+
+def _set_advertisements(*advertisements: tuple[float, str, Optional[str]]) -> None:
+    _ADVERTISEMENTS.clear()
+    _ADVERTISEMENTS.extend(advertisements)
+
+
+async def test_discover_count():
+    """discover() returns as soon as ``count`` devices have been seen."""
+    _set_advertisements(
+        (0.01, "00:00:00:00:00:01", "a"),
+        (0.02, "00:00:00:00:00:01", "a"),
+        (0.03, "00:00:00:00:00:02", "b"),
+        (5.0, "00:00:00:00:00:03", "c"),
+    )
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    devices = await BleakScanner.discover(timeout=5.0, count=2, backend=FakeScanner)
+
+    assert loop.time() - start < 1.0
+    assert sorted(d.address for d in devices) == [
+        "00:00:00:00:00:01",
+        "00:00:00:00:00:02",
+    ]
+
+
+async def test_discover_count_with_filter():
+    """Only devices matching the filter are counted."""
+    _set_advertisements(
+        (0.01, "00:00:00:00:00:01", "a"),
+        (0.02, "00:00:00:00:00:02", "b"),
+        (0.03, "00:00:00:00:00:03", "b"),
+    )
+
+    devices = await BleakScanner.discover(
+        timeout=5.0,
+        return_adv=True,
+        count=2,
+        filterfunc=lambda d, ad: ad.local_name == "b",
+        backend=FakeScanner,
+    )
+
+    assert set(devices) == {
+        "00:00:00:00:00:01",
+        "00:00:00:00:00:02",
+        "00:00:00:00:00:03",
+    }
+
+
+async def test_discover_idle_timeout():
+    """discover() returns when no new device has been seen for ``idle_timeout``."""
+    _set_advertisements(
+        (0.01, "00:00:00:00:00:01", "a"),
+        (0.05, "00:00:00:00:00:02", "b"),
+        (0.1, "00:00:00:00:00:01", "a"),
+        (5.0, "00:00:00:00:00:03", "c"),
+    )
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    devices = await BleakScanner.discover(
+        timeout=5.0, idle_timeout=0.2, backend=FakeScanner
+    )
+
+    assert loop.time() - start < 1.0
+    assert len(devices) == 2
+
+
+async def test_discover_timeout_is_upper_bound():
+    """``timeout`` still applies when ``count`` is never reached."""
+    _set_advertisements((0.01, "00:00:00:00:00:01", "a"))
+
+    devices = await BleakScanner.discover(timeout=0.1, count=2, backend=FakeScanner)
+
+    assert len(devices) == 1
+
+
+async def test_find_devices_by_address():
+    """All devices are found in a single scan and yielded as they appear."""
+    _set_advertisements(
+        (0.01, "00:00:00:00:00:01", "a"),
+        (0.02, "00:00:00:00:00:02", "b"),
+        (0.03, "00:00:00:00:00:01", "a"),
+        (0.04, "00:00:00:00:00:03", "c"),
+        (5.0, "00:00:00:00:00:04", "d"),
+    )
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    found = [
+        d.address
+        async for d in BleakScanner.find_devices_by_address(
+            ["00:00:00:00:00:01", "00:00:00:00:00:03"],
+            timeout=5.0,
+            backend=FakeScanner,
+        )
+    ]
+
+    assert loop.time() - start < 1.0
+    assert found == ["00:00:00:00:00:01", "00:00:00:00:00:03"]
+
+
+async def test_find_devices_by_filter_timeout():
+    """Iteration stops at the timeout when not all devices were found."""
+    _set_advertisements(
+        (0.01, "00:00:00:00:00:01", "a"),
+        (0.02, "00:00:00:00:00:02", "b"),
+        (5.0, "00:00:00:00:00:03", "a"),
+    )
+
+    found = [
+        d.address
+        async for d in BleakScanner.find_devices_by_filter(
+            lambda d, ad: ad.local_name == "a", timeout=0.1, backend=FakeScanner
+        )
+    ]
+
+    assert found == ["00:00:00:00:00:01"]
+
+
+async def test_discover_timestamps():
+    """``timestamps`` can be passed to the convenience methods."""
+    _set_advertisements((0.01, "00:00:00:00:00:01", "a"))
+
+    before = time.monotonic_ns()
+    devices = await BleakScanner.discover(
+        timeout=0.1, return_adv=True, timestamps=True, backend=FakeScanner
+    )
+
+    (_, adv) = devices["00:00:00:00:00:01"]
+    assert adv.timestamp is not None
+    assert before <= adv.timestamp <= time.monotonic_ns()
+
+
+def test_advertisement_data_repr():
+    adv = AdvertisementData("a", {}, {}, [], None, -50, ())
+    assert repr(adv) == "AdvertisementData(local_name='a', rssi=-50)"
+
+    adv = adv._replace(timestamp=123)
+    assert repr(adv) == "AdvertisementData(local_name='a', rssi=-50, timestamp=123)"